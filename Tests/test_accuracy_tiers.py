@@ -0,0 +1,73 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import numpy as np
+import pytest
+
+import TerraFrame
+from TerraFrame.PrecessionNutation import SeriesExpansion
+from TerraFrame.Utilities import Conversions
+from TerraFrame.Utilities.Time import JulianDate
+
+
+@pytest.mark.parametrize('accuracy', list(SeriesExpansion.Accuracy))
+def test_accuracy_tier_error_bound(accuracy):
+    se_full = SeriesExpansion.cip_xys()
+    se_tier = SeriesExpansion.cip_xys(accuracy)
+
+    tier_error = Conversions.muas_to_rad(accuracy.value)
+
+    for full, tier in zip([se_full.se_cip_x, se_full.se_cip_y,
+                           se_full.se_cip_sxy2],
+                          [se_tier.se_cip_x, se_tier.se_cip_y,
+                           se_tier.se_cip_sxy2]):
+        assert len(tier) <= len(full)
+        assert tier.truncation_error_bound <= tier_error
+
+    # Sample the default time span densely, including its ends
+    t = np.concatenate([np.linspace(-1.0, 1.0, 5001),
+                        np.random.uniform(-1.0, 1.0, 5000)])
+
+    x, y, s = se_full.compute_many(t)
+    x_t, y_t, s_t = se_tier.compute_many(t)
+
+    assert np.max(np.abs(x_t - x)) <= se_tier.se_cip_x.truncation_error_bound
+    assert np.max(np.abs(y_t - y)) <= se_tier.se_cip_y.truncation_error_bound
+
+    # s also picks up the truncation error of X and Y through XY/2
+    assert np.max(np.abs(s_t - s)) <= 1.02 * tier_error
+
+
+def test_accuracy_time_span():
+    # A longer time span keeps more terms for the same accuracy target
+    se_short = SeriesExpansion.cip_x(
+        accuracy=SeriesExpansion.Accuracy.MILLIARCSECOND, time_span=(0, 0.5))
+    se_long = SeriesExpansion.cip_x(
+        accuracy=SeriesExpansion.Accuracy.MILLIARCSECOND, time_span=(-3, 3))
+
+    assert len(se_short) < len(se_long)
+
+    t = np.linspace(-3.0, 3.0, 2001)
+    x = SeriesExpansion.cip_x().compute_many(t)
+
+    assert (np.max(np.abs(se_long.compute_many(t) - x)) <=
+            se_long.truncation_error_bound)
+
+
+def test_transformation_accuracy_tier():
+    jd_tt = JulianDate.julian_date_from_datetime(
+        2025, 6, 27, 14, 5, 37, time_scale=JulianDate.TimeScales.TT)
+
+    ct = TerraFrame.CelestialTerrestrialTransformation(
+        user_polar_motion=False, user_nutation_corrections=False)
+    ct_mas = TerraFrame.CelestialTerrestrialTransformation(
+        user_polar_motion=False, user_nutation_corrections=False,
+        accuracy=SeriesExpansion.Accuracy.MILLIARCSECOND)
+
+    t_gi = ct.itrs_to_gcrs(jd_tt)
+    t_gi_mas = ct_mas.itrs_to_gcrs(jd_tt)
+
+    # Each matrix element moves by no more than the angular error
+    assert (np.max(np.abs(t_gi - t_gi_mas)) <
+            3.0 * Conversions.mas_to_rad(1.0))
@@ -0,0 +1,69 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import numpy as np
+import pytest
+
+from TerraFrame.PrecessionNutation import Chebyshev, SeriesExpansion
+from TerraFrame.Utilities import Conversions
+
+
+def test_chebyshev_fit_meets_tolerance():
+    se_cip_xys = SeriesExpansion.cip_xys()
+    tolerance = Conversions.muas_to_rad(1.0)
+
+    t_start = 0.1
+    t_end = t_start + 120.0 / 36525.0
+
+    fit = Chebyshev.ChebyshevCipXys.fit(t_start, t_end, tolerance=tolerance,
+                                        se_cip_xys=se_cip_xys)
+
+    assert fit.max_error <= fit.error_bound <= tolerance
+    assert fit.t_start == t_start
+    assert fit.t_end == t_end
+
+    t = np.concatenate([np.linspace(t_start, t_end, 2001),
+                        np.random.uniform(t_start, t_end, 2000)])
+
+    values = np.array(fit.compute_many(t))
+    truth = np.array(se_cip_xys.compute_many(t))
+
+    assert np.max(np.abs(values - truth)) <= fit.error_bound
+
+    for i in [0, 1000, 2000]:
+        cip_x, cip_y, cip_s = fit.compute(t[i])
+
+        assert abs(cip_x - values[0, i]) < 1e-15
+        assert abs(cip_y - values[1, i]) < 1e-15
+        assert abs(cip_s - values[2, i]) < 1e-15
+
+
+def test_chebyshev_save_and_load(tmp_path):
+    fit = Chebyshev.ChebyshevCipXys.fit(0.0, 30.0 / 36525.0, degree=12)
+
+    file_path = tmp_path / 'cip_xys.npz'
+    fit.save(file_path)
+
+    loaded = Chebyshev.ChebyshevCipXys.load(file_path)
+
+    assert loaded.degree == 12
+    assert loaded.tolerance == fit.tolerance
+    assert loaded.error_bound == fit.error_bound
+    assert np.array_equal(loaded.boundaries, fit.boundaries)
+    assert np.array_equal(loaded.coefficients, fit.coefficients)
+
+    t = np.linspace(0.0, 30.0 / 36525.0, 101)
+
+    assert np.array_equal(np.array(loaded.compute_many(t)),
+                          np.array(fit.compute_many(t)))
+
+
+def test_chebyshev_out_of_range():
+    fit = Chebyshev.ChebyshevCipXys.fit(0.0, 10.0 / 36525.0)
+
+    with pytest.raises(ValueError):
+        fit.compute(-1e-6)
+
+    with pytest.raises(ValueError):
+        fit.compute_many(np.array([0.0, 11.0 / 36525.0]))
@@ -6,6 +6,7 @@ import erfa
 import numpy as np
 
 from TerraFrame.PrecessionNutation import SeriesExpansion
+from TerraFrame.Utilities import Conversions
 from TerraFrame.Utilities.Time import JulianDate
 
 
@@ -46,3 +47,141 @@ def test_cip_calculation():
     assert np.max(np.abs(cip_x - cip_x_a)) < 1e-10
     assert np.max(np.abs(cip_y - cip_y_a)) < 1e-10
     assert np.max(np.abs(cip_s - cip_s_a)) < 1e-10
+
+
+def test_cip_batch_calculation():
+    se_cip_xys = SeriesExpansion.cip_xys()
+
+    n = 250
+    frac = np.linspace(-365.25 * 10.0, 365.25 * 10.0, n)
+
+    jdc_tt = frac / 36525.0
+
+    # A small chunk size forces the batch to be split over several chunks
+    cip_x, cip_y, cip_s = se_cip_xys.compute_many(jdc_tt, chunk_size=7)
+
+    x, y, s = erfa.xys06a(2451545.0, frac)
+
+    assert cip_x.shape == (n,)
+    assert np.max(np.abs(cip_x - x)) < 1e-10
+    assert np.max(np.abs(cip_y - y)) < 1e-10
+    assert np.max(np.abs(cip_s - s)) < 1e-10
+
+    for i in [0, n // 2, n - 1]:
+        x_i, y_i, s_i = se_cip_xys.compute(jdc_tt[i])
+
+        assert abs(x_i - cip_x[i]) < 1e-15
+        assert abs(y_i - cip_y[i]) < 1e-15
+        assert abs(s_i - cip_s[i]) < 1e-15
+
+
+def test_fused_cip_calculation():
+    se_cip_xys = SeriesExpansion.cip_xys()
+
+    # The fused table shares argument combinations between the series
+    assert len(se_cip_xys) < (len(se_cip_xys.se_cip_x) +
+                              len(se_cip_xys.se_cip_y) +
+                              len(se_cip_xys.se_cip_sxy2))
+
+    for jdc_tt in np.linspace(-1.0, 1.0, 11):
+        cip_x, cip_y, cip_s = se_cip_xys.compute(jdc_tt)
+
+        x = se_cip_xys.se_cip_x.compute(jdc_tt)
+        y = se_cip_xys.se_cip_y.compute(jdc_tt)
+        s = se_cip_xys.se_cip_sxy2.compute(jdc_tt) - x * y / 2.0
+
+        assert abs(cip_x - x) < 1e-15
+        assert abs(cip_y - y) < 1e-15
+        assert abs(cip_s - s) < 1e-15
+
+
+def test_recurrence_strategy():
+    strategy = SeriesExpansion.EvaluationStrategy.RECURRENCE
+    se_cip_xys = SeriesExpansion.cip_xys(strategy=strategy)
+    se_cip_x = SeriesExpansion.cip_x(strategy=strategy)
+
+    frac = np.linspace(-365.25 * 50.0, 365.25 * 50.0, 200)
+    jdc_tt = frac / 36525.0
+
+    cip_x, cip_y, cip_s = se_cip_xys.compute_many(jdc_tt)
+
+    x, y, s = erfa.xys06a(2451545.0, frac)
+
+    assert np.max(np.abs(cip_x - x)) < 1e-10
+    assert np.max(np.abs(cip_y - y)) < 1e-10
+    assert np.max(np.abs(cip_s - s)) < 1e-10
+
+    assert abs(se_cip_x.compute(jdc_tt[17]) - cip_x[17]) < 1e-15
+    assert abs(se_cip_xys.compute(jdc_tt[17])[0] - cip_x[17]) < 1e-15
+
+    results = SeriesExpansion.compare_strategies(jdc_tt[:10], number=1)
+
+    assert set(results.keys()) == set(SeriesExpansion.EvaluationStrategy)
+
+    for seconds, difference in results.values():
+        assert seconds > 0.0
+        assert difference < 1e-15
+
+
+def test_phasor_stepping():
+    se_cip_xys = SeriesExpansion.cip_xys()
+
+    t0 = 0.25
+    dt = 10.0 / 86400.0 / 36525.0
+    n = 2500
+    reanchor_interval = 1000
+
+    steps = list(se_cip_xys.iter_steps(t0, dt, n, reanchor_interval))
+
+    assert len(steps) == n
+
+    values = np.array(steps).T
+    truth = np.array(se_cip_xys.compute_many(t0 + np.arange(n) * dt))
+
+    bounds = se_cip_xys.step_drift_bound(dt, reanchor_interval, t_max=0.26)
+
+    for i in range(3):
+        assert np.max(np.abs(values[i] - truth[i])) <= bounds[i]
+
+        # Anchor steps are evaluated from the exact series
+        assert abs(values[i, reanchor_interval] -
+                   truth[i, reanchor_interval]) < 1e-15
+
+    # The bound must stay small
+    assert max(bounds) < Conversions.muas_to_rad(0.01)
+
+    # With a ten-day step the truncation error dominates the bound
+    dt = 10.0 / 36525.0
+    n = 300
+
+    values = np.array(list(se_cip_xys.iter_steps(t0, dt, n, n))).T
+    truth = np.array(se_cip_xys.compute_many(t0 + np.arange(n) * dt))
+
+    bounds = se_cip_xys.step_drift_bound(dt, n, t_max=0.34)
+    rounding = se_cip_xys.step_drift_bound(0.0, n, t_max=0.34)
+
+    for i in range(3):
+        assert np.max(np.abs(values[i] - truth[i])) <= bounds[i]
+        assert bounds[i] > 2.0 * rounding[i]
+
+
+def test_table_layout():
+    for se in (SeriesExpansion.cip_x(), SeriesExpansion.cip_y(),
+               SeriesExpansion.cip_sxy2()):
+        data = se.data
+
+        assert data.dtype == SeriesExpansion.TABLE_DTYPE
+
+        # At least four times smaller than one float64 per table column
+        assert 4 * data.nbytes < len(data) * 18 * 8
+
+        # Luni-solar-only terms lead the table and each block is grouped by
+        # the power of t
+        planetary = np.any(data['multipliers'][:, 5:] != 0, axis=1)
+
+        assert np.all(np.diff(planetary.astype(int)) >= 0)
+
+        for block in (data[~planetary], data[planetary]):
+            assert np.all(np.diff(block['power']) >= 0)
+
+        assert se._engine._n_luni_solar == np.count_nonzero(~planetary)
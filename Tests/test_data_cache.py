@@ -0,0 +1,81 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+from importlib import resources
+
+import numpy as np
+import pytest
+
+from TerraFrame.PrecessionNutation import SeriesExpansion
+from TerraFrame.Utilities import DataCache
+from TerraFrame.Utilities.TableRegistry import TableRegistry
+
+
+@pytest.fixture(autouse=True)
+def empty_registry(monkeypatch):
+    # Tables already shared in this process would bypass the cache files
+    monkeypatch.setattr(TableRegistry, '_entries', {})
+
+
+def test_series_table_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv(DataCache.CACHE_DIRECTORY_VARIABLE,
+                       str(tmp_path / 'cache'))
+
+    se_cip_x = SeriesExpansion.cip_x()
+
+    cache_file = tmp_path / 'cache' / 'tab5.2a.npz'
+    assert cache_file.exists()
+
+    # A second load must come from the binary file and not the text parser
+    def fail(_text):
+        raise AssertionError('The text table should not be parsed again.')
+
+    monkeypatch.setattr(SeriesExpansion.SeriesExpansion, '_parse_text',
+                        staticmethod(fail))
+    TableRegistry.clear()
+
+    se_cip_x_cached = SeriesExpansion.cip_x()
+
+    assert np.array_equal(se_cip_x.data, se_cip_x_cached.data)
+    assert se_cip_x.compute(0.1) == se_cip_x_cached.compute(0.1)
+
+
+def test_changed_source_invalidates_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv(DataCache.CACHE_DIRECTORY_VARIABLE,
+                       str(tmp_path / 'cache'))
+
+    source = resources.files("TerraFrame.Data").joinpath('tab5.2d.txt')
+    table_path = tmp_path / 'tab5.2d.txt'
+    table_path.write_bytes(source.read_bytes())
+
+    data = DataCache.load_array(table_path,
+                                SeriesExpansion.SeriesExpansion._parse_text)
+
+    # Drop the last term of the table
+    lines = table_path.read_text().rstrip().splitlines()
+    table_path.write_text('\n'.join(lines[:-1]) + '\n')
+
+    data_changed = DataCache.load_array(
+        table_path, SeriesExpansion.SeriesExpansion._parse_text)
+
+    rows = {x.tobytes() for x in data}
+    rows_changed = {x.tobytes() for x in data_changed}
+
+    assert data_changed.shape[0] == data.shape[0] - 1
+    assert rows_changed < rows
+
+
+@pytest.mark.parametrize('directory', ['', None])
+def test_cache_disabled_or_unwritable(tmp_path, monkeypatch, directory):
+    if directory is None:
+        # A regular file where the directory should be makes it unwritable
+        directory = tmp_path / 'not_a_directory'
+        directory.write_text('')
+
+    monkeypatch.setenv(DataCache.CACHE_DIRECTORY_VARIABLE, str(directory))
+
+    se_cip_sxy2 = SeriesExpansion.cip_sxy2()
+
+    assert se_cip_sxy2.data.shape == (66, )
+    assert se_cip_sxy2.data.dtype == SeriesExpansion.TABLE_DTYPE
@@ -0,0 +1,104 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import random
+
+import numpy as np
+import pytest
+
+import TerraFrame
+from TerraFrame.Ephemeris import HEADER_SIZE
+from TerraFrame.PrecessionNutation.SeriesExpansion import Accuracy
+from TerraFrame.QuaternionInterpolation import angular_distance
+from TerraFrame.Utilities import BulletinData
+from TerraFrame.Utilities.Time import JulianDate
+
+
+def test_ephemeris_table(tmp_path):
+    start = JulianDate.JulianDate.j2000() + random.uniform(0.0, 8000.0)
+    end = start + 1.0
+    step = 600.0
+
+    # Small chunks exercise the joins between chunks
+    table = TerraFrame.EphemerisTable.write(tmp_path / 'table.bin', start,
+                                            end, step, chunk_size=50)
+
+    assert len(table) == 145
+    assert isinstance(table._data, np.memmap)
+    assert table.header['eop_version'] == BulletinData.BulletinData().version
+    assert table.is_current()
+    assert table.verify()
+
+    assert 0.0 < table.max_error < table.estimated_max_error < 1e-10
+
+    ct = TerraFrame.CelestialTerrestrialTransformation()
+    times = [start + random.uniform(0.0, 0.999) for _ in range(50)]
+
+    error = table.estimated_max_error
+
+    assert (np.max(angular_distance(ct.itrs_to_gcrs_quaternion_many(times),
+                                    table(times))) < error)
+    assert (np.max(np.abs(table.matrices(times) -
+                          ct.itrs_to_gcrs_many(times))) < error)
+
+    # The nodes are the full model
+    node = start + step / 86400.0 * 17
+
+    assert angular_distance(table([node])[0],
+                            ct.itrs_to_gcrs_quaternion(node)) < 1e-15
+
+    # Opening the file again shares the same data
+    table_2 = TerraFrame.EphemerisTable(tmp_path / 'table.bin')
+
+    assert np.array_equal(table_2(times), table(times))
+
+    with pytest.raises(ValueError):
+        table([end])
+
+    with pytest.raises(ValueError):
+        table([start - 0.001])
+
+
+def test_ephemeris_table_settings(tmp_path):
+    start = JulianDate.JulianDate.j2000() + random.uniform(0.0, 8000.0)
+
+    ct = TerraFrame.CelestialTerrestrialTransformation(
+        accuracy=Accuracy.ARCSECOND)
+    table = TerraFrame.EphemerisTable.write(tmp_path / 'table.bin', start,
+                                            start + 0.1, 900.0,
+                                            transformation=ct)
+
+    assert table.header['accuracy'] == Accuracy.ARCSECOND.value
+    assert table.is_current(ct)
+
+    # A table of the truncated series doesn't stand in for the full model
+    assert not table.is_current()
+    assert not table.is_current(
+        TerraFrame.CelestialTerrestrialTransformation(
+            accuracy=Accuracy.ARCSECOND, time_span=(-0.5, 0.5)))
+
+
+def test_invalid_ephemeris_table(tmp_path):
+    start = JulianDate.JulianDate.j2000() + random.uniform(0.0, 8000.0)
+
+    file = tmp_path / 'table.bin'
+    TerraFrame.EphemerisTable.write(file, start, start + 0.1, 900.0)
+
+    # Change one of the rotations
+    content = bytearray(file.read_bytes())
+    content[HEADER_SIZE + 8] ^= 1
+    file.write_bytes(bytes(content))
+
+    assert not TerraFrame.EphemerisTable(file).verify()
+
+    file.write_bytes(b'not a table'.ljust(HEADER_SIZE))
+
+    with pytest.raises(ValueError):
+        TerraFrame.EphemerisTable(file)
+
+    with pytest.raises(ValueError):
+        TerraFrame.EphemerisTable.write(file, start, start - 0.1, 900.0)
+
+    # Nothing is left behind by a failed write
+    assert sorted(x.name for x in tmp_path.iterdir()) == ['table.bin']
@@ -0,0 +1,162 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import random
+
+import erfa
+import numpy as np
+
+from TerraFrame import EquinoxBased
+from TerraFrame.EquinoxBased import EquinoxTransformation
+from TerraFrame.PrecessionNutation import Precession, SeriesExpansion
+from TerraFrame.Utilities import BulletinData, Conversions
+from TerraFrame.Utilities.Time import JulianDate, TimeScales
+
+
+def _epochs(n, seed):
+    # TT Julian centuries and the same epochs as two-part Julian dates
+    rng = np.random.default_rng(seed)
+
+    t = rng.uniform(-1.0, 1.0, n)
+    days = t * 36525.0
+
+    jd1 = 2451545.0 + np.floor(days)
+    jd2 = days - np.floor(days)
+
+    return t, jd1, jd2
+
+
+def test_nutation():
+    t, jd1, jd2 = _epochs(1000, 3)
+
+    se_equinox = SeriesExpansion.equinox_nutation()
+
+    d_psi, d_epsilon, complementary_terms = se_equinox.compute_many(t)
+    d_psi_erfa, d_epsilon_erfa = erfa.nut06a(jd1, jd2)
+
+    # ERFA uses the MHB2000 expressions for some of the arguments
+    assert np.max(np.abs(d_psi - d_psi_erfa)) < Conversions.muas_to_rad(0.2)
+    assert (np.max(np.abs(d_epsilon - d_epsilon_erfa)) <
+            Conversions.muas_to_rad(0.2))
+    assert (np.max(np.abs(complementary_terms - erfa.eect00(jd1, jd2))) <
+            Conversions.muas_to_rad(0.001))
+
+    for i in range(3):
+        assert np.allclose(se_equinox.compute(t[i]),
+                           (d_psi[i], d_epsilon[i], complementary_terms[i]),
+                           rtol=0.0, atol=1e-18)
+
+
+def test_sidereal_time():
+    t, jd1, jd2 = _epochs(1000, 5)
+
+    et = EquinoxTransformation()
+
+    assert (np.max(np.abs(Precession.mean_obliquity(t) -
+                          erfa.obl06(jd1, jd2))) < 1e-15)
+
+    # GMST82 takes the UT1 date in either order
+    assert (np.max(np.abs(Precession.greenwich_mean_sidereal_time_1982(
+        jd1, jd2) - erfa.gmst82(jd2, jd1))) < 1e-12)
+
+    # ERFA's GAST comes from the equation of the origins, which differs
+    # from the equation of the equinoxes by well under a microarcsecond
+    ee = et.equation_of_the_equinoxes_centuries(t)
+
+    assert np.max(np.abs(ee - erfa.ee06a(jd1, jd2))) < Conversions.muas_to_rad(
+        1.5)
+
+    gast = et.greenwich_apparent_sidereal_time_centuries(t, jd1, jd2)
+    difference = np.angle(np.exp(1j * (gast - erfa.gst06a(jd1, jd2, jd1,
+                                                          jd2))))
+
+    assert np.max(np.abs(difference)) < Conversions.muas_to_rad(1.5)
+
+
+def test_gcrs_to_tod():
+    t, jd1, jd2 = _epochs(500, 7)
+
+    et = EquinoxTransformation()
+
+    t_tg = et.gcrs_to_tod_centuries(t)
+
+    assert t_tg.shape == (500, 3, 3)
+    assert np.max(np.abs(t_tg - erfa.pnm06a(jd1, jd2))) < 1e-12
+    assert np.array_equal(et.tod_to_gcrs_centuries(t),
+                          np.swapaxes(t_tg, 1, 2))
+
+    assert np.allclose(et.gcrs_to_tod_centuries(t[0]), t_tg[0], rtol=0.0,
+                       atol=1e-18)
+
+
+def test_itrs_to_teme():
+    _, jd1, jd2 = _epochs(500, 9)
+
+    rng = np.random.default_rng(9)
+    pm_x = Conversions.arcsec_to_rad(rng.uniform(-0.5, 0.5, 500))
+    pm_y = Conversions.arcsec_to_rad(rng.uniform(-0.5, 0.5, 500))
+
+    t_ei = EquinoxBased.teme_to_itrs_matrix(jd1, jd2, pm_x, pm_y)
+
+    # TEME -> ITRS: W R3(GMST82), with W the polar motion matrix without s'
+    t_ei_erfa = erfa.rxr(erfa.pom00(pm_x, pm_y, 0.0),
+                         erfa.rz(erfa.gmst82(jd1, jd2), np.eye(3)))
+
+    assert np.max(np.abs(t_ei - t_ei_erfa)) < 1e-12
+
+    t_ie = EquinoxBased.itrs_to_teme_matrix(jd1, jd2, pm_x, pm_y)
+
+    assert np.max(np.abs(t_ie @ t_ei - np.eye(3))) < 1e-15
+
+
+def test_julian_dates():
+    jd_utc = JulianDate.JulianDate.j2000() + random.uniform(0.0, 8000.0)
+    times = [jd_utc + 0.3 * i for i in range(5)]
+
+    jd_tt = [Conversions.any_to_tt(x) for x in times]
+    jd_ut1 = [Conversions.tt_to_ut1(x) for x in jd_tt]
+
+    tt1 = np.array([x.integer_part() for x in jd_tt], dtype=np.float64)
+    tt2 = np.array([x.fraction_part() for x in jd_tt])
+    ut11 = np.array([x.integer_part() for x in jd_ut1], dtype=np.float64)
+    ut12 = np.array([x.fraction_part() for x in jd_ut1])
+
+    et = EquinoxTransformation()
+
+    assert np.max(np.abs(et.gcrs_to_tod(times) -
+                         erfa.pnm06a(tt1, tt2))) < 1e-12
+    assert np.max(np.abs(et.gcrs_to_tod(times[0]) -
+                         erfa.pnm06a(tt1[0], tt2[0]))) < 1e-12
+
+    gast = et.greenwich_apparent_sidereal_time(times)
+    difference = np.angle(np.exp(1j * (gast - erfa.gst06a(ut11, ut12, tt1,
+                                                          tt2))))
+
+    assert np.max(np.abs(difference)) < Conversions.muas_to_rad(1.5)
+
+    # Polar motion comes from the IERS bulletin
+    bd = BulletinData.BulletinData()
+    mjd_utc = np.array([float(JulianDate.julian_date_to_modified_julian_date(
+        x)) for x in times])
+    pm_x = Conversions.arcsec_to_rad(bd.f_pm_x.evaluate_many(mjd_utc))
+    pm_y = Conversions.arcsec_to_rad(bd.f_pm_y.evaluate_many(mjd_utc))
+
+    t_ei = et.teme_to_itrs(times)
+    t_ei_erfa = erfa.rxr(erfa.pom00(pm_x, pm_y, 0.0),
+                         erfa.rz(erfa.gmst82(ut11, ut12), np.eye(3)))
+
+    assert np.max(np.abs(t_ei - t_ei_erfa)) < 1e-12
+    assert np.max(np.abs(et.itrs_to_teme(times) @ t_ei - np.eye(3))) < 1e-15
+
+    # Polar motion is about 0.3 arcseconds, about 10 m at the surface
+    t_ei_no_pm = EquinoxTransformation(user_polar_motion=False).teme_to_itrs(
+        times)
+
+    assert np.min(np.max(np.abs(t_ei - t_ei_no_pm), axis=(1, 2))) > 1e-7
+
+    # Epochs in other timescales give the same matrices
+    jd_tt_array = JulianDate.JulianDateArray(
+        tt1.astype(np.int64), tt2, TimeScales.TT)
+
+    assert np.max(np.abs(et.teme_to_itrs(jd_tt_array) - t_ei)) < 1e-12
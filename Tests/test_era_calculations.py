@@ -25,6 +25,19 @@ def test_era_angle_calculation():
     assert (np.abs(era - era_a) < 1e-10)
 
 
+def test_era_angle_before_j2000():
+    val = random.uniform(-10000.0, 0.0)
+    jd_ut1 = (JulianDate.JulianDate.j2000(
+        time_scale=JulianDate.TimeScales.UT1) + val)
+
+    era = Earth.earth_rotation_angle(jd_ut1)
+
+    jd1, jd2 = jd_ut1.integer_part(), jd_ut1.fraction_part()
+
+    assert 0.0 <= jd2 < 1.0
+    assert (np.abs(era - erfa.era00(jd1, jd2)) < 1e-10)
+
+
 def test_era_transformation_calculation():
     val = random.uniform(0, 100.0)
     jd_ut1 = (JulianDate.JulianDate.j2000(
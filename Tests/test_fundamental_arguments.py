@@ -0,0 +1,51 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import erfa
+import numpy as np
+
+from TerraFrame.PrecessionNutation import Arguments
+
+SCALAR_FUNCTIONS = (
+    Arguments.mean_anomaly_of_the_moon,
+    Arguments.mean_anomaly_of_the_sun,
+    Arguments.mean_longitude_moon_minus_ascending_node,
+    Arguments.mean_elongation_of_the_moon_from_the_sun,
+    Arguments.mean_longitude_of_the_ascending_node_of_the_moon,
+    Arguments.mean_longitude_of_mercury,
+    Arguments.mean_longitude_of_venus,
+    Arguments.mean_longitude_of_earth,
+    Arguments.mean_longitude_of_mars,
+    Arguments.mean_longitude_of_jupiter,
+    Arguments.mean_longitude_of_saturn,
+    Arguments.mean_longitude_of_uranus,
+    Arguments.mean_longitude_of_neptune,
+    Arguments.general_precession_in_longitude,
+)
+
+ERFA_FUNCTIONS = (erfa.fal03, erfa.falp03, erfa.faf03, erfa.fad03,
+                  erfa.faom03, erfa.fame03, erfa.fave03, erfa.fae03,
+                  erfa.fama03, erfa.faju03, erfa.fasa03, erfa.faur03,
+                  erfa.fane03, erfa.fapa03)
+
+
+def test_fundamental_arguments():
+    t = np.linspace(-2.0, 2.0, 201)
+
+    arguments = Arguments.fundamental_arguments(t)
+
+    assert arguments.shape == (201, 14)
+
+    for i, (f, f_erfa) in enumerate(zip(SCALAR_FUNCTIONS, ERFA_FUNCTIONS)):
+        # The scalar wrappers must match the batch evaluation exactly
+        scalar = np.array([f(x) for x in t.tolist()])
+
+        assert np.array_equal(scalar, arguments[:, i])
+        assert np.array_equal(f(t), arguments[:, i])
+
+        assert np.max(np.abs(arguments[:, i] - f_erfa(t))) < 1e-12
+
+    assert Arguments.fundamental_arguments(0.25).shape == (14, )
+    assert np.array_equal(Arguments.fundamental_arguments(t[3]),
+                          arguments[3])
@@ -109,3 +109,120 @@ def test_leap_second_against_astropy():
         itrs_basis_astro = itrs_basis_astro.cartesian.xyz.to_value()
 
         assert (np.max(np.abs(itrs_basis - itrs_basis_astro)) < 1e-10)
+
+
+def test_itrs_to_gcrs_many():
+    rng = np.random.default_rng(17)
+    time_scales = [JulianDate.TimeScales.UTC, JulianDate.TimeScales.TT,
+                   JulianDate.TimeScales.TAI, JulianDate.TimeScales.TDB,
+                   JulianDate.TimeScales.TCG]
+
+    # Epochs between 1980 and 2024 in a mix of timescales
+    times = [JulianDate.JulianDate(2451545, 0.0, time_scales[i % 5]) +
+             float(val) for i, val in enumerate(rng.uniform(-7300.0, 8700.0,
+                                                            60))]
+
+    # Every second around the leap second at the end of 2016
+    jd_utc_base = JulianDate.julian_date_from_datetime(2016, 12, 31, 23, 59,
+                                                       55)
+
+    for delta in np.arange(0.0, 10.0, 0.5):
+        jd_utc = jd_utc_base + Conversions.seconds_to_days(float(delta))
+
+        times.append(jd_utc)
+        times.append(Conversions.utc_to_tt(jd_utc))
+
+    ct = TerraFrame.CelestialTerrestrialTransformation()
+
+    t_gi = ct.itrs_to_gcrs_many(times)
+
+    assert t_gi.shape == (len(times), 3, 3)
+
+    for i, time in enumerate(times):
+        assert np.max(np.abs(t_gi[i] - ct.itrs_to_gcrs(time))) < 1e-15
+
+    assert np.array_equal(ct.gcrs_to_itrs_many(times),
+                          np.swapaxes(t_gi, 1, 2))
+
+    # A JulianDateArray gives the same matrices as the JulianDates in it
+    utc = [x for x in times if x.time_scale == JulianDate.TimeScales.UTC]
+    jd_array = JulianDate.JulianDateArray.from_julian_dates(utc)
+
+    assert np.array_equal(ct.itrs_to_gcrs_many(jd_array),
+                          ct.itrs_to_gcrs_many(utc))
+
+
+def test_transform_vectors():
+    rng = np.random.default_rng(23)
+
+    times = [JulianDate.JulianDate.j2000() + float(val)
+             for val in rng.uniform(0.0, 8000.0, 25)]
+
+    ct = TerraFrame.CelestialTerrestrialTransformation()
+    t_gi = ct.itrs_to_gcrs_many(times)
+
+    # One vector per epoch, and three objects sharing the epochs
+    vectors = rng.normal(size=(25, 3))
+    vectors_k = rng.normal(size=(3, 25, 3))
+
+    gcrs = ct.transform_vectors(vectors, times, chunk_size=7)
+
+    assert np.allclose(gcrs, np.einsum('nij,nj->ni', t_gi, vectors),
+                       rtol=0.0, atol=1e-15)
+
+    out = np.empty((3, 25, 3))
+    itrs = ct.transform_vectors(vectors_k, times,
+                                TerraFrame.TransformDirection.GCRS_TO_ITRS,
+                                out=out)
+
+    assert itrs is out
+
+    for k in range(3):
+        expected = np.einsum('nji,nj->ni', t_gi, vectors_k[k])
+
+        assert np.allclose(itrs[k], expected, rtol=0.0, atol=1e-15)
+
+    # GCRS -> ITRS undoes ITRS -> GCRS
+    assert np.allclose(ct.transform_vectors(
+        gcrs, times, TerraFrame.TransformDirection.GCRS_TO_ITRS), vectors,
+        rtol=0.0, atol=1e-14)
+
+
+def test_iter_itrs_to_gcrs():
+    rng = np.random.default_rng(29)
+
+    def stream():
+        # A generator, so the pipeline can't know the length up front
+        for val in rng.uniform(0.0, 8000.0, 23):
+            yield JulianDate.JulianDate.j2000() + float(val)
+
+    times = list(stream())
+    ct = TerraFrame.CelestialTerrestrialTransformation()
+    t_gi = ct.itrs_to_gcrs_many(times)
+
+    timings = TerraFrame.PipelineTimings()
+    matrices = list(ct.iter_itrs_to_gcrs(iter(times), chunk_size=5,
+                                         timings=timings))
+
+    assert len(matrices) == 23
+    assert np.array_equal(np.array(matrices), t_gi)
+
+    assert timings.batches == 5
+    assert timings.epochs == 23
+    assert timings.seconds['series'] > 0.0
+    assert timings.total() >= timings.seconds['series']
+
+    chunks = list(ct.iter_itrs_to_gcrs(
+        iter(times), chunk_size=10,
+        direction=TerraFrame.TransformDirection.GCRS_TO_ITRS, per_chunk=True))
+
+    assert [len(x) for x in chunks] == [10, 10, 3]
+    assert np.array_equal(np.concatenate(chunks), np.swapaxes(t_gi, 1, 2))
+
+    vectors = rng.normal(size=(23, 3))
+    rotated = list(ct.iter_itrs_to_gcrs(iter(times), chunk_size=4,
+                                        vectors=iter(vectors)))
+
+    assert np.allclose(np.array(rotated),
+                       np.einsum('nij,nj->ni', t_gi, vectors), rtol=0.0,
+                       atol=1e-15)
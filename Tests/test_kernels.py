@@ -0,0 +1,106 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import random
+
+import numpy as np
+import pytest
+
+import TerraFrame
+from TerraFrame.PrecessionNutation import Arguments, SeriesExpansion
+from TerraFrame.Utilities import Kernels, TransformationMatrices
+from TerraFrame.Utilities.Time import JulianDate
+
+# Without Numba, the kernels run as plain Python, which still checks that
+# they compute the same values as the NumPy path.
+
+
+@pytest.fixture
+def numpy_backend():
+    backend = Kernels.active_backend()
+    Kernels.set_backend(Kernels.Backend.NUMPY)
+
+    yield
+
+    Kernels.set_backend(backend)
+
+
+def test_backend_selection():
+    info = Kernels.diagnostics()
+
+    assert info['backend'] == Kernels.active_backend().name
+    assert info['numba_available'] == Kernels.numba_available()
+
+    if not Kernels.numba_available():
+        assert Kernels.active_backend() is Kernels.Backend.NUMPY
+
+        with pytest.raises(RuntimeError):
+            Kernels.set_backend(Kernels.Backend.NUMBA)
+
+
+def test_fundamental_arguments_kernel(numpy_backend):
+    t = np.linspace(-2.0, 2.0, 41)
+
+    values = Kernels.fundamental_arguments(
+        t, Arguments.POLYNOMIAL_COEFFICIENTS, Arguments.N_ARCSECOND_ARGUMENTS,
+        Arguments.N_REDUCED_ARGUMENTS)
+
+    assert values.shape == (41, 14)
+    assert np.max(np.abs(values - Arguments.fundamental_arguments(t))) < 1e-15
+
+
+def test_power_sums_kernel(numpy_backend):
+    se_cip_xys = SeriesExpansion.cip_xys()
+    arguments = SeriesExpansion.fundamental_arguments(
+        np.array([-0.3, 0.0, 0.2]))
+
+    values = Kernels.power_sums(arguments, se_cip_xys._multipliers,
+                                se_cip_xys._weights)
+
+    values_numpy = se_cip_xys._engine.power_sums(arguments)
+
+    # units are micro-arcseconds
+    assert values.shape == values_numpy.shape
+    assert np.max(np.abs(values - values_numpy)) < 1e-6
+
+
+def test_matrices_kernel(numpy_backend):
+    x, y, s = SeriesExpansion.cip_xys().compute(random.uniform(-1.0, 1.0))
+    era = random.uniform(0.0, 2.0 * np.pi)
+    pm_x, pm_y, sp = 1.2e-6, -2.3e-6, -1e-10
+
+    matrices = Kernels.celestial_terrestrial_matrices(x, y, s, era, pm_x,
+                                                      pm_y, sp)
+    matrices_numpy = TransformationMatrices.celestial_terrestrial_matrices(
+        x, y, s, era, pm_x, pm_y, sp)
+
+    assert np.max(np.abs(matrices - np.array(matrices_numpy))) < 1e-15
+
+
+@pytest.mark.parametrize('backend', list(Kernels.Backend))
+def test_backend_parity(backend, numpy_backend):
+    if backend is Kernels.Backend.NUMBA and not Kernels.numba_available():
+        pytest.skip('Numba is not installed.')
+
+    jd_tt = (JulianDate.JulianDate.j2000(time_scale=JulianDate.TimeScales.TT)
+             + random.uniform(0, 9000.0))
+
+    ct = TerraFrame.CelestialTerrestrialTransformation()
+    t_gi_numpy = ct.itrs_to_gcrs(jd_tt)
+
+    Kernels.set_backend(backend)
+
+    assert np.max(np.abs(ct.itrs_to_gcrs(jd_tt) - t_gi_numpy)) < 1e-15
+
+
+def test_compiled_rates(monkeypatch):
+    # The kernels run as plain Python without Numba
+    monkeypatch.setattr(Kernels, '_backend', Kernels.Backend.NUMBA)
+
+    se_cip_xys = SeriesExpansion.cip_xys()
+    t = random.uniform(-0.2, 0.2)
+
+    values, _ = se_cip_xys.compute_with_rates(t)
+
+    assert np.array_equal(values, se_cip_xys.compute(t))
@@ -0,0 +1,62 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import numpy as np
+
+from TerraFrame.PrecessionNutation import SeriesExpansion
+from TerraFrame.Utilities import Conversions
+
+
+def test_multi_rate_error_bound():
+    se_cip_xys = SeriesExpansion.cip_xys()
+    se_multi_rate = SeriesExpansion.MultiRateCipXys(se_cip_xys)
+
+    assert 0 < se_multi_rate.n_long_period < len(se_cip_xys)
+    assert (max(se_multi_rate.error_bound[:2]) <=
+            (1.0 + 1e-12) * se_multi_rate.tolerance)
+
+    rng = np.random.default_rng(11)
+
+    # Scattered epochs over the whole span and one densely sampled day
+    for t in (rng.uniform(-1.0, 1.0, 5000),
+              0.2 + np.linspace(0.0, 1.0, 5000) / 36525.0):
+        values = np.array(se_multi_rate.compute_many(t))
+        values_full = np.array(se_cip_xys.compute_many(t))
+
+        errors = np.max(np.abs(values - values_full), axis=1)
+
+        assert np.all(errors <= np.array(se_multi_rate.error_bound))
+
+    for t in (-0.5, 0.2, 0.2 + 1e-9, 0.2 + 1e-4):
+        values = np.ravel(se_multi_rate.compute_many(np.array([t])))
+
+        assert np.allclose(se_multi_rate.compute(t), values, rtol=0.0,
+                           atol=1e-18)
+
+
+def test_multi_rate_threshold():
+    se_cip_xys = SeriesExpansion.cip_xys()
+
+    se_month = SeriesExpansion.MultiRateCipXys(se_cip_xys)
+    se_year = SeriesExpansion.MultiRateCipXys(se_cip_xys,
+                                              period_threshold=365.25)
+
+    # Fewer, slower terms can be interpolated from coarser nodes
+    assert se_year.n_long_period < se_month.n_long_period
+    assert se_year.node_spacing > se_month.node_spacing
+
+    se_loose = SeriesExpansion.MultiRateCipXys(
+        se_cip_xys, tolerance=Conversions.muas_to_rad(10.0))
+
+    assert se_loose.node_spacing > se_month.node_spacing
+
+    # Without long-period terms the split changes nothing
+    se_exact = SeriesExpansion.MultiRateCipXys(se_cip_xys,
+                                               period_threshold=np.inf)
+
+    t = np.linspace(-1.0, 1.0, 101)
+
+    assert se_exact.n_long_period == 0
+    assert np.allclose(se_exact.compute_many(t), se_cip_xys.compute_many(t),
+                       rtol=0.0, atol=1e-18)
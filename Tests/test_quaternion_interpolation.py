@@ -0,0 +1,94 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import random
+
+import numpy as np
+import pytest
+
+import TerraFrame
+from TerraFrame import QuaternionInterpolation
+from TerraFrame.Utilities import TransformationMatrices
+from TerraFrame.Utilities.Time import JulianDate
+
+
+def test_matrix_quaternion_conversions():
+    # Random rotation matrices from the QR decomposition of random matrices
+    t_m, _ = np.linalg.qr(np.random.default_rng(11).normal(size=(1000, 3, 3)))
+    t_m *= np.sign(np.linalg.det(t_m))[:, None, None]
+
+    q = TransformationMatrices.quaternion_from_matrix(t_m)
+
+    assert q.shape == (1000, 4)
+    assert np.all(q[:, 0] >= 0.0)
+    assert np.max(np.abs(np.linalg.norm(q, axis=-1) - 1.0)) < 1e-15
+
+    assert (np.max(np.abs(TransformationMatrices.matrix_from_quaternion(q) -
+                          t_m)) < 1e-14)
+
+    # T v = q v q*
+    v = np.array([0.3, -0.2, 0.9])
+    q_v = np.concatenate([[0.0], v])
+    rotated = QuaternionInterpolation._multiply(
+        QuaternionInterpolation._multiply(q[0], q_v),
+        QuaternionInterpolation._conjugate(q[0]))
+
+    assert np.allclose(rotated[1:], t_m[0] @ v, rtol=0.0, atol=1e-15)
+
+
+def test_quaternion_output():
+    jd_utc = JulianDate.JulianDate.j2000() + random.uniform(0.0, 8000.0)
+
+    ct = TerraFrame.CelestialTerrestrialTransformation()
+
+    q = ct.itrs_to_gcrs_quaternion(jd_utc)
+
+    assert (np.max(np.abs(TransformationMatrices.matrix_from_quaternion(q) -
+                          ct.itrs_to_gcrs(jd_utc))) < 1e-15)
+
+    times = [jd_utc + 0.1 * i for i in range(5)]
+
+    assert np.allclose(ct.itrs_to_gcrs_quaternion_many(times)[0], q,
+                       rtol=0.0, atol=1e-15)
+
+
+def test_interpolator():
+    start = JulianDate.JulianDate.j2000() + random.uniform(0.0, 8000.0)
+    end = start + 0.25
+
+    errors = {}
+
+    for method in TerraFrame.InterpolationMethod:
+        interpolator = TerraFrame.QuaternionInterpolator(
+            start, end, node_spacing=600.0, method=method)
+
+        report = interpolator.error_report()
+
+        assert report['samples'] == 4 * (len(interpolator) - 1)
+        assert report['rms_error'] <= report['max_error']
+
+        # The reported error bounds the error at other epochs too
+        times = [start + random.uniform(0.0, 0.25) for _ in range(20)]
+        q_model = interpolator.transformation.itrs_to_gcrs_quaternion_many(
+            times)
+
+        assert (np.max(QuaternionInterpolation.angular_distance(
+            q_model, interpolator(times))) < 2.0 * report['max_error'])
+
+        # The nodes are reproduced exactly
+        assert QuaternionInterpolation.angular_distance(
+            interpolator([start])[0],
+            interpolator.transformation.itrs_to_gcrs_quaternion(start)) < 1e-15
+
+        errors[method] = report['max_error']
+
+    assert errors[TerraFrame.InterpolationMethod.SLERP] < 1e-10
+    assert (errors[TerraFrame.InterpolationMethod.SQUAD] <
+            errors[TerraFrame.InterpolationMethod.SLERP])
+
+    with pytest.raises(ValueError):
+        interpolator([end + 0.01])
+
+    with pytest.raises(ValueError):
+        TerraFrame.QuaternionInterpolator(end, start)
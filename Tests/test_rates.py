@@ -0,0 +1,67 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import random
+
+import numpy as np
+
+import TerraFrame
+from TerraFrame.PrecessionNutation import SeriesExpansion
+from TerraFrame.Utilities import Earth
+from TerraFrame.Utilities.Time import JulianDate
+
+
+def test_cip_rates():
+    h = 1e-8
+    t = random.uniform(-0.25, 0.25)
+
+    for strategy in SeriesExpansion.EvaluationStrategy:
+        se_cip_xys = SeriesExpansion.cip_xys(strategy=strategy)
+
+        values, rates = se_cip_xys.compute_with_rates(t)
+
+        assert np.array_equal(values, se_cip_xys.compute(t))
+
+        rates_fd = (np.array(se_cip_xys.compute(t + h)) -
+                    np.array(se_cip_xys.compute(t - h))) / (2.0 * h)
+
+        # X and Y change by about 1e-2 radians per century
+        assert np.max(np.abs(np.array(rates) - rates_fd)) < 1e-9
+
+        value, rate = SeriesExpansion.cip_x(
+            strategy=strategy).compute_with_rate(t)
+
+        assert value == values[0]
+        assert abs(rate - rates[0]) < 1e-15
+
+
+def test_itrs_to_gcrs_rate():
+    val = random.uniform(0, 9000.0)
+    jd_tt = (JulianDate.JulianDate.j2000(time_scale=JulianDate.TimeScales.TT)
+             + val)
+
+    ct = TerraFrame.CelestialTerrestrialTransformation()
+
+    t_gi, t_gi_rate = ct.itrs_to_gcrs_with_rate(jd_tt)
+
+    assert np.array_equal(t_gi, ct.itrs_to_gcrs(jd_tt))
+
+    # Central difference over one second. The Earth rotation rate is about
+    # 7.3e-5 rad/s and the length of day changes it by about 1e-12 rad/s.
+    h = 1.0
+    h_days = h / Earth.SECONDS_PER_DAY
+
+    t_gi_rate_fd = (ct.itrs_to_gcrs(jd_tt + h_days) -
+                    ct.itrs_to_gcrs(jd_tt - h_days)) / (2.0 * h)
+
+    assert np.max(np.abs(t_gi_rate - t_gi_rate_fd)) < 3e-13
+
+    t_ig, t_ig_rate = ct.gcrs_to_itrs_with_rate(jd_tt)
+
+    assert np.array_equal(t_ig_rate, t_gi_rate.T)
+
+    # The derivative of an orthogonal matrix satisfies T^T dT + dT^T T = 0
+    skew = t_gi.T @ t_gi_rate
+
+    assert np.max(np.abs(skew + skew.T)) < 1e-18
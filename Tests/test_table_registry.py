@@ -0,0 +1,88 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+import TerraFrame
+from TerraFrame.PrecessionNutation import SeriesExpansion
+from TerraFrame.Utilities.TableRegistry import TableRegistry
+
+
+def test_tables_are_shared():
+    ct_1 = TerraFrame.CelestialTerrestrialTransformation()
+    ct_2 = TerraFrame.CelestialTerrestrialTransformation()
+
+    assert ct_1.se_cip_xys is ct_2.se_cip_xys
+    assert ct_1.se_cip_xys.se_cip_x is SeriesExpansion.cip_x()
+
+    # Truncated series share the parsed table with the full series
+    se_cip_x_mas = SeriesExpansion.cip_x(
+        accuracy=SeriesExpansion.Accuracy.MILLIARCSECOND)
+
+    assert se_cip_x_mas is not SeriesExpansion.cip_x()
+    assert len(se_cip_x_mas) < len(SeriesExpansion.cip_x())
+
+    with pytest.raises(ValueError):
+        SeriesExpansion.cip_x().data[0] = SeriesExpansion.cip_x().data[1]
+
+    assert not ct_1.se_cip_xys._weights.sin_values.flags.writeable
+
+    usage = TableRegistry.memory_usage()
+
+    assert TableRegistry.nbytes() == sum(usage.values())
+    assert TableRegistry.nbytes() > 0
+
+
+def test_factory_runs_once(monkeypatch):
+    monkeypatch.setattr(TableRegistry, '_entries', {})
+
+    calls = []
+    barrier = threading.Barrier(8)
+
+    def factory():
+        calls.append(1)
+        return {'data': np.arange(10.0)}
+
+    def get(_):
+        barrier.wait()
+        return TableRegistry.get('test', factory)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        entries = list(executor.map(get, range(8)))
+
+    assert len(calls) == 1
+    assert all(x is entries[0] for x in entries)
+    assert not entries[0]['data'].flags.writeable
+    assert TableRegistry.nbytes() == 80
+
+
+def test_series_memory(monkeypatch):
+    monkeypatch.setattr(TableRegistry, '_entries', {})
+
+    se_cip_xys = SeriesExpansion.cip_xys()
+    se_cip_xys.compute(0.1)
+
+    coordinates = (se_cip_xys.se_cip_x, se_cip_xys.se_cip_y,
+                   se_cip_xys.se_cip_sxy2)
+
+    # The tables used to be held as one float64 per column: the power, the
+    # row number, the two amplitudes, and the 14 multipliers
+    baseline = sum(len(x.data) for x in coordinates) * 18 * 8
+
+    assert TableRegistry.nbytes() < baseline / 2
+
+    # The series evaluated through the fused series don't hold engines
+    usage = TableRegistry.memory_usage()
+    key = next(x for x in usage if x[0] == 'cip_x')
+
+    assert usage[key] == 0
+
+    se_cip_xys.se_cip_x.compute(0.1)
+
+    assert TableRegistry.memory_usage()[key] > 0
+    assert not se_cip_xys.se_cip_x._engine._multipliers.flags.writeable
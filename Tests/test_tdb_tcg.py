@@ -0,0 +1,112 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import os
+import random
+import subprocess
+import sys
+
+import erfa
+import numpy as np
+import pytest
+
+from TerraFrame.Utilities import Conversions, TransformationMatrices
+from TerraFrame.Utilities.Time import Deltas, JulianDate, TimeScales
+
+
+def test_tdb_tt_series():
+    # Julian millennia covering the default time span
+    t = np.random.default_rng(13).uniform(-0.1, 0.1, 20000)
+
+    reference = erfa.dtdb(2451545.0, t * Deltas.DAYS_PER_MILLENNIUM, 0.0,
+                          0.0, 0.0, 0.0)
+
+    for accuracy in Deltas.TdbAccuracy:
+        tdb_tt = Deltas.TdbTtDelta(accuracy)
+
+        errors = np.abs(tdb_tt.compute_many(t) - reference)
+
+        assert tdb_tt.truncation_error_bound <= accuracy.value
+        assert np.max(errors) <= tdb_tt.truncation_error_bound + 1e-15
+
+    tdb_tt = Deltas.TdbTtDelta()
+
+    assert np.allclose(tdb_tt.compute_many(t, chunk_size=7),
+                       tdb_tt.compute_many(t), rtol=0.0, atol=1e-17)
+    assert tdb_tt.compute_many(t.reshape(100, 200)).shape == (100, 200)
+
+
+def test_tdb_conversions():
+    val = random.uniform(-36525.0, 36525.0)
+    jd_tt = JulianDate.JulianDate.j2000(time_scale=TimeScales.TT) + val
+
+    jd_tdb = Conversions.tt_to_tdb(jd_tt)
+
+    assert jd_tdb.time_scale == TimeScales.TDB
+
+    tdb_tt = float(jd_tdb - jd_tt) * 86400.0
+    reference = erfa.dtdb(2451545.0, val, 0.0, 0.0, 0.0, 0.0)
+
+    # The two-part Julian date resolves about 1e-11 seconds
+    assert abs(tdb_tt - reference) < 1e-10
+
+    assert abs(float(Conversions.tdb_to_tt(jd_tdb) - jd_tt)) * 86400.0 < 1e-10
+    assert abs(float(Conversions.any_to_tt(jd_tdb) - jd_tt)) * 86400.0 < 1e-10
+
+    # s' accepts TDB as well as TT
+    jdc_tdb = JulianDate.julian_terrestrial_time_to_century(jd_tdb)
+
+    assert jdc_tdb.time_scale == TimeScales.TDB
+    assert (abs(TransformationMatrices.calculate_s_prime(jdc_tdb) -
+                erfa.sp00(2451545.0, val)) < 1e-18)
+
+
+def test_tcg_conversions():
+    val = random.uniform(-36525.0, 36525.0)
+    jd_tt = JulianDate.JulianDate.j2000(time_scale=TimeScales.TT) + val
+
+    jd_tcg = Conversions.tt_to_tcg(jd_tt)
+
+    assert jd_tcg.time_scale == TimeScales.TCG
+
+    tcg1, tcg2 = erfa.tttcg(2451545.0, val)
+
+    # Days since J2000, formed from the two parts to keep the precision
+    days = (jd_tcg.integer_part() - 2451545) + jd_tcg.fraction_part()
+
+    assert abs(days - ((tcg1 - 2451545.0) + tcg2)) < 1e-12
+
+    assert abs(float(Conversions.tcg_to_tt(jd_tcg) - jd_tt)) < 1e-14
+    assert abs(float(Conversions.any_to_tt(jd_tcg) - jd_tt)) < 1e-14
+
+
+@pytest.mark.parametrize('module', ['TerraFrame.Utilities.Time',
+                                    'TerraFrame.Utilities.Time.Deltas',
+                                    'TerraFrame.Utilities.Time.JulianDate',
+                                    'TerraFrame.Utilities.Conversions'])
+def test_import_order(module):
+    # Conversions and Deltas import each other, so neither may use the other
+    # at import time, whichever of them is imported first
+    code = (f'import {module}\n'
+            f'from TerraFrame.Utilities import Conversions\n'
+            f'from TerraFrame.Utilities.Time import JulianDate, TimeScales\n'
+            f'jd = JulianDate.JulianDate.j2000(time_scale=TimeScales.TT)\n'
+            f'Conversions.tdb_to_tt(Conversions.tt_to_tdb(jd))\n')
+
+    environment = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+
+    subprocess.run([sys.executable, '-c', code], check=True, env=environment)
+
+
+def test_tdb_tt_series_is_shared():
+    tdb_tt = Deltas.TdbTtDelta(Deltas.TdbAccuracy.FULL)
+
+    # Instances with the same truncation share one series
+    assert Deltas.TdbTtDelta()._weights is tdb_tt._weights
+    assert Deltas.TdbTtDelta(0.0)._frequencies is tdb_tt._frequencies
+    assert not tdb_tt._weights.flags.writeable
+
+    truncated = Deltas.TdbTtDelta(Deltas.TdbAccuracy.MICROSECOND)
+
+    assert len(truncated) < len(tdb_tt)
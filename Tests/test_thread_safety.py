@@ -0,0 +1,112 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+import TerraFrame
+from TerraFrame import CelestialTerrestrial
+from TerraFrame.Utilities import BulletinData, Interpolation
+from TerraFrame.Utilities.Time import JulianDate
+
+N_THREADS = 8
+
+
+def _run_concurrently(function, n_threads=N_THREADS):
+    # Every thread starts at the same time and gets its own seed
+    barrier = threading.Barrier(n_threads)
+
+    def run(seed):
+        barrier.wait()
+        return function(seed)
+
+    with ThreadPoolExecutor(max_workers=n_threads) as executor:
+        return list(executor.map(run, range(n_threads)))
+
+
+def test_interpolation_threads():
+    x = np.arange(1000.0)
+    f = Interpolation.Interpolation1D(x, np.sin(x))
+
+    def query(seed):
+        # Sorted queries keep hitting the index cache
+        xv = np.sort(np.random.default_rng(seed).uniform(-1.0, 1001.0, 5000))
+
+        return xv, np.array(f(list(xv)))
+
+    for xv, yv in _run_concurrently(query):
+        assert np.array_equal(yv, f.evaluate_many(xv))
+
+
+def test_shared_data_is_read_only():
+    bd = BulletinData.BulletinData()
+
+    with pytest.raises(ValueError):
+        bd.data[0, 1] = 0.0
+
+    assert bd.f_pm_x is BulletinData.BulletinData().f_pm_x
+
+
+@pytest.mark.parametrize('cache_size', [0, 64])
+def test_transformation_threads(cache_size):
+    jd_utc = JulianDate.JulianDate.j2000() + random.uniform(0.0, 8000.0)
+    times = [jd_utc + random.uniform(0.0, 30.0) for _ in range(50)]
+
+    ct_serial = TerraFrame.CelestialTerrestrialTransformation()
+
+    expected = np.array([ct_serial.itrs_to_gcrs(x) for x in times])
+    expected_many = ct_serial.itrs_to_gcrs_many(times)
+
+    ct = TerraFrame.CelestialTerrestrialTransformation(cache_size=cache_size)
+
+    def transform(seed):
+        # Each thread visits the epochs in its own order
+        order = np.random.default_rng(seed).permutation(len(times))
+        t_gi = np.empty((len(times), 3, 3))
+
+        for i in order:
+            t_gi[i] = ct.itrs_to_gcrs(times[i])
+
+        return t_gi, ct.itrs_to_gcrs_many(times)
+
+    for t_gi, t_gi_many in _run_concurrently(transform):
+        assert np.array_equal(t_gi, expected)
+        assert np.array_equal(t_gi_many, expected_many)
+
+
+def test_slow_component_threads():
+    tolerance = 1e-9
+    window = CelestialTerrestrial.slow_component_window_for_tolerance(
+        tolerance)
+
+    jd_tt = (JulianDate.JulianDate.j2000(JulianDate.TimeScales.TT) +
+             random.uniform(0.0, 8000.0))
+    times = [jd_tt + float(x) for x in np.linspace(0.0, 0.01, 40)]
+
+    ct_full = TerraFrame.CelestialTerrestrialTransformation()
+    expected = ct_full.itrs_to_gcrs_many(times)
+
+    ct = TerraFrame.CelestialTerrestrialTransformation(
+        slow_component_window=window)
+
+    def transform(seed):
+        order = np.random.default_rng(seed).permutation(len(times))
+        t_gi = np.empty((len(times), 3, 3))
+
+        for i in order:
+            t_gi[i] = ct.itrs_to_gcrs(times[i])
+
+        return t_gi
+
+    for t_gi in _run_concurrently(transform):
+        assert np.max(np.abs(t_gi - expected)) < tolerance
+
+    statistics = ct.slow_component_statistics()
+
+    assert (statistics['refreshes'] + statistics['reuses'] ==
+            N_THREADS * len(times))
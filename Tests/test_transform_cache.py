@@ -0,0 +1,110 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import random
+
+import numpy as np
+import pytest
+
+import TerraFrame
+from TerraFrame import CelestialTerrestrial
+from TerraFrame.Utilities import Conversions
+from TerraFrame.Utilities.Time import JulianDate
+from TerraFrame.Utilities.TransformCache import TransformCache
+
+
+def test_lru_eviction():
+    cache = TransformCache(2)
+
+    cache.put('a', 1)
+    cache.put('b', 2)
+
+    assert cache.get('a') == 1
+
+    # 'b' is now the least recently used entry
+    cache.put('c', 3)
+
+    assert cache.get('b') is None
+    assert cache.get('c') == 3
+    assert cache.statistics() == {'hits': 2, 'misses': 1, 'evictions': 1,
+                                  'size': 2, 'max_size': 2}
+
+    cache.clear()
+
+    assert len(cache) == 0
+    assert cache.statistics()['hits'] == 0
+
+    with pytest.raises(ValueError):
+        TransformCache(0)
+
+
+def test_cached_transformation():
+    jd_utc = JulianDate.JulianDate.j2000() + 1234.5678
+
+    ct = TerraFrame.CelestialTerrestrialTransformation(cache_size=4)
+    ct_uncached = TerraFrame.CelestialTerrestrialTransformation()
+
+    assert ct_uncached.cache_statistics() is None
+
+    t_gi = ct.itrs_to_gcrs(jd_utc)
+
+    assert np.array_equal(t_gi, ct_uncached.itrs_to_gcrs(jd_utc))
+    assert ct.cache_statistics()['misses'] == 1
+
+    # The same epoch in TT, and the inverse transformation, are served from
+    # the same entry
+    assert ct.itrs_to_gcrs(Conversions.utc_to_tt(jd_utc)) is t_gi
+    assert np.array_equal(ct.gcrs_to_itrs(jd_utc), t_gi.T)
+
+    # Epochs closer than the quantum share the entry as well
+    assert ct.itrs_to_gcrs(jd_utc + Conversions.seconds_to_days(1e-7)) is t_gi
+
+    statistics = ct.cache_statistics()
+
+    assert statistics['hits'] == 3
+    assert statistics['misses'] == 1
+
+    # Cached matrices are shared, so they can't be modified
+    with pytest.raises(ValueError):
+        t_gi[0, 0] = 0.0
+
+    for i in range(5):
+        ct.itrs_to_gcrs(jd_utc + float(i + 1))
+
+    statistics = ct.cache_statistics()
+
+    assert statistics['size'] == 4
+    assert statistics['evictions'] == 2
+
+
+def test_slow_components():
+    tolerance = 1e-9
+    window = CelestialTerrestrial.slow_component_window_for_tolerance(
+        tolerance)
+
+    ct = TerraFrame.CelestialTerrestrialTransformation(
+        slow_component_window=window)
+    ct_full = TerraFrame.CelestialTerrestrialTransformation()
+
+    jd_tt = (JulianDate.JulianDate.j2000(JulianDate.TimeScales.TT) +
+             random.uniform(0.0, 8000.0))
+
+    t_gi = ct.itrs_to_gcrs(jd_tt)
+
+    assert np.array_equal(t_gi, ct_full.itrs_to_gcrs(jd_tt))
+
+    # Within the window only the Earth rotation matrix is rebuilt
+    for seconds in np.linspace(-0.99 * window, 0.99 * window, 9):
+        jd = jd_tt + Conversions.seconds_to_days(float(seconds))
+
+        assert (np.max(np.abs(ct.itrs_to_gcrs(jd) -
+                              ct_full.itrs_to_gcrs(jd))) < tolerance)
+
+    assert ct.slow_component_statistics() == {'refreshes': 1, 'reuses': 9}
+
+    # Leaving the window refreshes the slow components
+    jd = jd_tt + Conversions.seconds_to_days(2.0 * window)
+
+    assert np.array_equal(ct.itrs_to_gcrs(jd), ct_full.itrs_to_gcrs(jd))
+    assert ct.slow_component_statistics()['refreshes'] == 2
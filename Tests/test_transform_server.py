@@ -0,0 +1,221 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+
+import numpy as np
+import pytest
+
+import TerraFrame
+from TerraFrame.Service import Protocol
+from TerraFrame.Utilities.Time import JulianDate, TimeScales
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, 'AF_UNIX'),
+                                reason='Unix domain sockets are required.')
+
+
+@pytest.fixture
+def server():
+    from TerraFrame.Service.Server import TransformServer
+
+    # Socket paths are limited to about 100 characters, so pytest's
+    # tmp_path may be too long
+    with tempfile.TemporaryDirectory() as directory:
+        with TransformServer(os.path.join(directory, 'terraframe.sock'),
+                             max_delay=0.05) as server:
+            yield server.start()
+
+
+def test_time_scale_codes():
+    assert Protocol.TIME_SCALE_CODES == {x.name: x.value for x in
+                                         TimeScales}
+
+
+def test_client(server):
+    from TerraFrame.Service.Client import TransformClient
+
+    jd_utc = JulianDate.JulianDate.j2000() + random.uniform(0.0, 8000.0)
+    times = [jd_utc + 0.1 * i for i in range(5)]
+
+    t_gi = TerraFrame.CelestialTerrestrialTransformation().itrs_to_gcrs_many(
+        times)
+
+    with TransformClient(server.socket_path) as client:
+        # The matrices depend on the batch at the level of rounding
+        assert np.max(np.abs(client.itrs_to_gcrs(times) - t_gi)) < 1e-15
+
+        # Two-part dates and float Julian dates in TT
+        jd_tt = [JulianDate.JulianDate(x.integer_part(), x.fraction_part(),
+                                       TimeScales.TT) for x in times]
+        t_ig = TerraFrame.CelestialTerrestrialTransformation(
+        ).gcrs_to_itrs_many(jd_tt)
+
+        assert np.max(np.abs(client.gcrs_to_itrs(
+            [(x.integer_part(), x.fraction_part()) for x in jd_tt], 'TT') -
+            t_ig)) < 1e-15
+        # A float Julian date resolves about 40 microseconds
+        assert np.max(np.abs(np.array(client.gcrs_to_itrs(
+            [float(x) for x in jd_tt], TimeScales.TT)) - t_ig)) < 1e-8
+
+        assert client.itrs_to_gcrs([]) == []
+
+        with pytest.raises(RuntimeError):
+            client._request(Protocol.Operation.ITRS_TO_GCRS, 99, [2451545],
+                            [0.0])
+
+        # The connection is still usable after an error
+        assert np.max(np.abs(client.itrs_to_gcrs(times[:1]) - t_gi[:1])) < 1e-15
+
+        statistics = client.statistics()
+
+    assert statistics['requests'] == 6
+    assert statistics['errors'] == 1
+    assert statistics['latency_max'] >= statistics['latency_p50'] > 0.0
+
+
+def test_coalescing(server):
+    from TerraFrame.Service.Client import TransformClient
+
+    jd_utc = JulianDate.JulianDate.j2000() + random.uniform(0.0, 8000.0)
+    n_threads = 8
+    barrier = threading.Barrier(n_threads)
+    results = [None] * n_threads
+
+    def request(k):
+        with TransformClient(server.socket_path) as client:
+            barrier.wait()
+            results[k] = client.itrs_to_gcrs([jd_utc + k, jd_utc - k])
+
+    threads = [threading.Thread(target=request, args=(k,))
+               for k in range(n_threads)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    ct = TerraFrame.CelestialTerrestrialTransformation()
+
+    for k in range(n_threads):
+        assert np.max(np.abs(results[k] - ct.itrs_to_gcrs_many(
+            [jd_utc + k, jd_utc - k]))) < 1e-15
+
+    statistics = server.statistics()
+
+    assert statistics['requests'] == n_threads
+    assert statistics['epochs'] == 2 * n_threads
+    assert statistics['batches'] < n_threads
+    assert statistics['mean_batch_requests'] > 1.0
+
+
+def test_request_errors(server):
+    from TerraFrame.Service.Client import TransformClient
+
+    jd_utc = JulianDate.JulianDate.j2000() + random.uniform(0.0, 8000.0)
+    barrier = threading.Barrier(2)
+    results = [None] * 2
+
+    def request(k, integer_parts, fraction_parts):
+        with TransformClient(server.socket_path) as client:
+            barrier.wait()
+
+            try:
+                results[k] = np.frombuffer(client._request(
+                    Protocol.Operation.ITRS_TO_GCRS, TimeScales.UTC.value,
+                    integer_parts, fraction_parts), '<f8').reshape(-1, 3, 3)
+            except RuntimeError as e:
+                results[k] = e
+
+    # A valid request and an invalid one sent at the same time. The client
+    # doesn't send a NaN fraction itself, so the request is made directly.
+    threads = [threading.Thread(target=request, args=(
+        0, [jd_utc.integer_part()], [jd_utc.fraction_part()])),
+        threading.Thread(target=request, args=(1, [2451545], [np.nan]))]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    ct = TerraFrame.CelestialTerrestrialTransformation()
+
+    assert np.max(np.abs(results[0] -
+                         ct.itrs_to_gcrs_many([jd_utc]))) < 1e-15
+    assert isinstance(results[1], RuntimeError)
+
+    with TransformClient(server.socket_path) as client:
+        for time_scale, integer_part in [(TimeScales.UTC, 2 ** 40),
+                                         (TimeScales.TT, -2 ** 40),
+                                         (TimeScales.UT1,
+                                          2451545)]:
+            with pytest.raises(RuntimeError):
+                client._request(Protocol.Operation.ITRS_TO_GCRS,
+                                time_scale.value, [integer_part], [0.0])
+
+    assert server.statistics()['errors'] == 4
+
+
+# The NaN fraction is cast to an integer part before the model fails
+@pytest.mark.filterwarnings('ignore:invalid value:RuntimeWarning')
+def test_batch_errors(server):
+    from concurrent.futures import Future
+
+    # A request that fails in a batch doesn't fail the others
+    utc = TimeScales.UTC
+    batch = [(utc, np.array([2451545]), np.array([0.25]), Future()),
+             (utc, np.array([2451545]), np.array([np.nan]), Future()),
+             (utc, np.array([2451546]), np.array([0.5]), Future())]
+
+    server._evaluate(batch, 3)
+
+    ct = TerraFrame.CelestialTerrestrialTransformation()
+
+    assert np.max(np.abs(batch[0][3].result() - ct.itrs_to_gcrs_many(
+        [JulianDate.JulianDate(2451545, 0.25)]))) < 1e-15
+    assert np.max(np.abs(batch[2][3].result() - ct.itrs_to_gcrs_many(
+        [JulianDate.JulianDate(2451546, 0.5)]))) < 1e-15
+    assert batch[1][3].exception() is not None
+
+
+def test_close_with_open_connection():
+    from TerraFrame.Service.Client import TransformClient
+    from TerraFrame.Service.Server import TransformServer
+
+    jd_utc = JulianDate.JulianDate.j2000() + random.uniform(0.0, 8000.0)
+
+    with tempfile.TemporaryDirectory() as directory:
+        server = TransformServer(os.path.join(directory, 'terraframe.sock'))
+        server.start()
+
+        with TransformClient(server.socket_path, timeout=10.0) as client:
+            client.itrs_to_gcrs([jd_utc])
+
+            server.close()
+
+            # The connection is still open, but its requests fail instead of
+            # waiting for the stopped batcher
+            with pytest.raises(RuntimeError):
+                client.itrs_to_gcrs([jd_utc])
+
+
+def test_lightweight_client():
+    # Importing the client doesn't import NumPy or the transformation
+    code = ('import sys; import TerraFrame.Service.Client; '
+            'print(sorted(x for x in sys.modules if x == "numpy" or '
+            'x.startswith("TerraFrame.") and "Service" not in x))')
+    environment = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+
+    output = subprocess.run([sys.executable, '-c', code], check=True,
+                            capture_output=True, text=True,
+                            env=environment).stdout
+
+    assert output.strip() == '[]'
@@ -2,20 +2,158 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
+import contextlib
 import datetime
+import itertools
+import threading
+from enum import Enum
+from time import perf_counter
+
+import numpy as np
 
 import TerraFrame.Utilities.Conversions
 from TerraFrame.PrecessionNutation import SeriesExpansion
-from TerraFrame.Utilities import (Conversions, Time, BulletinData,
+from TerraFrame.Utilities import (Conversions, Time, BulletinData, Earth,
                                   TransformationMatrices)
-from TerraFrame.Utilities.Time.JulianDate import JulianDate
+from TerraFrame.Utilities.Time.JulianDate import JulianDate, JulianDateArray
+from TerraFrame.Utilities.TransformCache import TransformCache
+
+# Number of SI seconds in a Julian century
+SECONDS_PER_CENTURY = 36525.0 * 86400.0
+
+# Number of epochs whose matrices are built at once by transform_vectors
+TRANSFORM_CHUNK_SIZE = 4096
+
+# Upper bound on how fast the CIRS to GCRS and ITRS to TIRS matrices change,
+# in radians per second. Precession moves the CIP by about 3e-12 rad/s and
+# the largest nutation terms add a few times 1e-12 rad/s; polar motion is
+# slower still.
+SLOW_COMPONENT_RATE_BOUND = 1e-11
+
+
+def slow_component_window_for_tolerance(tolerance):
+    """
+    This function converts an error tolerance on the slowly changing
+    matrices into the validity window used to reuse them. See
+    CelestialTerrestrialTransformation.
+
+    :param tolerance: Largest acceptable error in radians
+    :type tolerance: float
+    :return: Validity window in seconds
+    :rtype: float
+    """
+
+    return tolerance / SLOW_COMPONENT_RATE_BOUND
+
+
+class TransformDirection(Enum):
+    """
+    Direction of a transformation between the terrestrial and celestial
+    frames.
+    """
+    ITRS_TO_GCRS = 1
+    GCRS_TO_ITRS = 2
+
+
+class PipelineTimings:
+    """
+    This class accumulates the wall-clock time spent in each stage of the
+    batched ITRS to GCRS pipeline, summed over all micro-batches:
+
+        time_conversion: Conversions to TT, UTC, and UT1
+        series: CIP X, Y, and s series
+        eop_lookup: Interpolation of the IERS bulletin data
+        matrices: Earth rotation angle and matrix construction
+        vectors: Rotation of vectors, if any
+    """
+
+    STAGES = ('time_conversion', 'series', 'eop_lookup', 'matrices',
+              'vectors')
+
+    def __init__(self):
+        self.seconds = {x: 0.0 for x in PipelineTimings.STAGES}
+        self.batches = 0
+        self.epochs = 0
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        """
+        This function times the body of a with statement as the named
+        stage.
+
+        :param name: Stage name, one of STAGES
+        :type name: str
+        """
+
+        start = perf_counter()
+
+        try:
+            yield
+        finally:
+            self.seconds[name] += perf_counter() - start
+
+    def total(self):
+        """
+        :return: Time spent in all stages in seconds
+        :rtype: float
+        """
+
+        return sum(self.seconds.values())
+
+
+def _stage(timings, name):
+    if timings is None:
+        return contextlib.nullcontext()
+
+    return timings.stage(name)
 
 
 class CelestialTerrestrialTransformation:
-    def __init__(self, user_polar_motion=True, user_nutation_corrections=True):
-        self.se_cip_x = SeriesExpansion.cip_x()
-        self.se_cip_y = SeriesExpansion.cip_y()
-        self.se_cip_sxy2 = SeriesExpansion.cip_sxy2()
+    """
+    This class transforms between the ITRS and the GCRS with the IAU
+    2006/2000A CIO-based model.
+
+    An instance can be shared between threads. The series tables and Earth
+    orientation data are loaded once, shared, and read-only, every call
+    keeps its intermediate results local, and the optional cache and
+    reused slow components are updated atomically.
+    """
+
+    def __init__(self, user_polar_motion=True, user_nutation_corrections=True,
+                 accuracy=SeriesExpansion.Accuracy.FULL,
+                 time_span=SeriesExpansion.DEFAULT_TIME_SPAN, cache_size=0,
+                 cache_quantum=1e-6, slow_component_window=0.0):
+        """
+        :param user_polar_motion: Apply polar motion from the IERS bulletin
+        :param user_nutation_corrections: Apply the CIP corrections dX and
+            dY from the IERS bulletin
+        :param accuracy: Accuracy tier or maximum truncation error of the
+            CIP series
+        :param time_span: Julian centuries TT over which the accuracy holds
+        :param cache_size: Number of transformations kept in an LRU cache.
+            0 disables the cache.
+        :param cache_quantum: Epochs in TT are rounded to this many seconds
+            to form the cache key. Epochs that round to the same value share
+            a cache entry.
+        :param slow_component_window: Seconds of TT over which the CIRS to
+            GCRS and ITRS to TIRS matrices are reused. Within the window
+            only the Earth rotation matrix is recomputed, with UT1 - TT
+            extrapolated with the length of day. 0 disables the reuse. See
+            slow_component_window_for_tolerance.
+        :type user_polar_motion: bool
+        :type user_nutation_corrections: bool
+        :type accuracy: SeriesExpansion.Accuracy | float
+        :type time_span: tuple[float, float]
+        :type cache_size: int
+        :type cache_quantum: float
+        :type slow_component_window: float
+        """
+
+        # See SeriesExpansion.Accuracy for the worst-case error of each
+        # accuracy tier over the time span (Julian centuries TT).
+        self.se_cip_xys = SeriesExpansion.cip_xys(accuracy, time_span)
+        self._accuracy = accuracy
+        self._time_span = time_span
 
         self._user_polar_motion = user_polar_motion
         self._user_nutation_corrections = user_nutation_corrections
@@ -25,13 +163,77 @@ class CelestialTerrestrialTransformation:
         else:
             self.bd = BulletinData.BulletinData()
 
-        # Cached results
-        self.t_gi = None
-        self.t_gc = None
-        self.t_ct = None
-        self.t_ti = None
+        # Matrices of recent epochs. The matrices depend on the Earth
+        # orientation data, so the key includes its version.
+        if cache_size > 0:
+            self.cache = TransformCache(cache_size)
+        else:
+            self.cache = None
+
+        self._cache_quantum = cache_quantum
+        self._eop_version = BulletinData.BulletinData().version
+
+        # The slowly changing matrices, the TT epoch they were computed at,
+        # and UT1 - TT in days with its rate at that epoch
+        self._slow_component_window = slow_component_window
+        self._slow_components = None
+        self._slow_component_refreshes = 0
+        self._slow_component_reuses = 0
+        self._slow_component_lock = threading.Lock()
+
+    def cache_statistics(self):
+        """
+        This function reports the hit, miss, and eviction counters of the
+        transformation cache.
+
+        :return: Cache counters, or None if the cache is disabled
+        :rtype: dict[str, int] | None
+        """
+
+        if self.cache is None:
+            return None
+
+        return self.cache.statistics()
+
+    def slow_component_statistics(self):
+        """
+        This function reports how often the CIRS to GCRS and ITRS to TIRS
+        matrices were recomputed (refreshes) and reused (reuses).
+
+        :return: Refresh and reuse counters
+        :rtype: dict[str, int]
+        """
+
+        with self._slow_component_lock:
+            return {'refreshes': self._slow_component_refreshes,
+                    'reuses': self._slow_component_reuses}
 
     def itrs_to_gcrs(self, time):
+        t_gi, _ = self._itrs_to_gcrs(time, with_rate=False)
+
+        return t_gi
+
+    def itrs_to_gcrs_with_rate(self, time):
+        """
+        This function computes the ITRS to GCRS transformation matrix and its
+        time derivative. The derivatives of X, Y, and s come from the same
+        series evaluation as the values and the Earth rotation rate
+        includes the excess length of day from the IERS bulletin.
+
+        The polar motion matrix changes by a few milliarcseconds per day,
+        which contributes less than 1e-12 per second to the derivative, so
+        it's treated as constant. The rates of the nutation corrections are
+        neglected for the same reason.
+
+        :param time: Time of the transformation
+        :return: ITRS to GCRS matrix and its derivative per SI second
+        :type time: JulianDate | datetime.datetime
+        :rtype: tuple[np.ndarray, np.ndarray]
+        """
+
+        return self._itrs_to_gcrs(time, with_rate=True)
+
+    def _itrs_to_gcrs(self, time, with_rate):
         if isinstance(time, datetime.datetime):
             time = Time.JulianDate.julian_date_from_pydatetime(time)
 
@@ -39,6 +241,22 @@ class CelestialTerrestrialTransformation:
 
         jd_tt = Conversions.any_to_tt(time)
 
+        # The cache only holds the matrices, so rates are always computed
+        if self.cache is not None:
+            cache_key = self._cache_key(jd_tt)
+
+            if not with_rate:
+                matrices = self.cache.get(cache_key)
+
+                if matrices is not None:
+                    return matrices[3], None
+
+        if self._slow_component_window > 0.0 and not with_rate:
+            t_gi = self._itrs_to_gcrs_from_slow_components(jd_tt)
+
+            if t_gi is not None:
+                return t_gi, None
+
         if time.time_scale == Time.TimeScales.UTC:
             jd_utc = time
         else:
@@ -56,11 +274,13 @@ class CelestialTerrestrialTransformation:
 
         # For the given terrestrial time (TT), call the routines to obtain the
         # IAU 2006/2000A X and Y from series. Then calculate "s" which is the
-        # CIO locator
-        cip_x = self.se_cip_x.compute(jdc_tt)
-        cip_y = self.se_cip_y.compute(jdc_tt)
-        sxy2 = self.se_cip_sxy2.compute(jdc_tt)
-        cip_s = sxy2 - cip_x * cip_y / 2.0
+        # CIO locator. The three series share one evaluation of the
+        # fundamental arguments.
+        if with_rate:
+            (cip_x, cip_y, cip_s), cip_rates = (
+                self.se_cip_xys.compute_with_rates(jdc_tt))
+        else:
+            cip_x, cip_y, cip_s = self.se_cip_xys.compute(jdc_tt)
 
         # Any CIP corrections ∆X, ∆Y can now be applied, and the corrected
         # X, Y, and s can be used to construct the Celestial Intermediate
@@ -74,14 +294,11 @@ class CelestialTerrestrialTransformation:
             cip_x += Conversions.mas_to_rad(dx)
             cip_y += Conversions.mas_to_rad(dy)
 
-        # Create the first transformation matrix
-        t_gc = TransformationMatrices.cirs_to_gcrs(cip_x, cip_y, cip_s)
-
-        # The Earth rotation matrix is the transformation from the Terrestrial
-        # Intermediate Reference System (TIRS) to the Celestial Intermediate
-        # Reference System (CIRS): TIRS -> CIRS.
+        # The Earth rotation angle gives the transformation from the
+        # Terrestrial Intermediate Reference System (TIRS) to the Celestial
+        # Intermediate Reference System (CIRS): TIRS -> CIRS.
         # This function uses normal JD time in UT1.
-        t_ct = TransformationMatrices.earth_rotation_matrix(jd_ut1)
+        era = Earth.earth_rotation_angle(jd_ut1)
 
         # Given polar motion offsets pm_x and pm_y, along with the Terrestrial
         # Intermediate Origin (TIO) locator (s prime or sp), the International
@@ -100,19 +317,386 @@ class CelestialTerrestrialTransformation:
         pm_x = TerraFrame.Utilities.Conversions.arcsec_to_rad(pm_x)
         pm_y = TerraFrame.Utilities.Conversions.arcsec_to_rad(pm_y)
 
-        t_ti = TransformationMatrices.itrs_to_tirs(pm_x, pm_y, sp)
+        # Create the three transformation matrices and the final
+        # transformation matrix: ITRS -> GCRS
+        t_gc, t_ct, t_ti, t_gi = (
+            TransformationMatrices.celestial_terrestrial_matrices(
+                cip_x, cip_y, cip_s, era, pm_x, pm_y, sp))
+
+        if self.cache is not None:
+            # Cached matrices are shared between callers
+            for matrix in (t_gc, t_ct, t_ti, t_gi):
+                matrix.flags.writeable = False
+
+            self.cache.put(cache_key, (t_gc, t_ct, t_ti, t_gi))
+
+        if self._slow_component_window > 0.0:
+            bd = self.bd if self.bd is not None else BulletinData.BulletinData()
+
+            # UT1 runs slower than TT by the excess length of day
+            ut1_tt = _days_between(jd_ut1, jd_tt)
+            ut1_tt_rate = -bd.f_lod(float(mjd_utc)) / 1000.0 / 86400.0
+
+            # The components are replaced as a whole so concurrent callers
+            # never see a partially updated set
+            self._slow_components = (jd_tt, t_gc, t_ti, ut1_tt, ut1_tt_rate)
+
+            with self._slow_component_lock:
+                self._slow_component_refreshes += 1
+
+        if not with_rate:
+            return t_gi, None
+
+        # The series rates are per Julian century of TT
+        x_rate, y_rate, s_rate = (x / SECONDS_PER_CENTURY for x in cip_rates)
+
+        t_gc_rate = TransformationMatrices.cirs_to_gcrs_rate(
+            cip_x, cip_y, cip_s, x_rate, y_rate, s_rate)
+
+        bd = self.bd if self.bd is not None else BulletinData.BulletinData()
+
+        # The bulletin gives the excess length of day in milliseconds
+        length_of_day = bd.f_lod(float(mjd_utc)) / 1000.0
+
+        t_ct_rate = TransformationMatrices.earth_rotation_matrix_rate(
+            jd_ut1, length_of_day)
+
+        t_gi_rate = (t_gc_rate @ t_ct + t_gc @ t_ct_rate) @ t_ti
+
+        return t_gi, t_gi_rate
+
+    def itrs_to_gcrs_many(self, times):
+        """
+        This function computes the ITRS to GCRS transformation matrix at
+        many epochs at once. The time conversions, the IERS bulletin
+        lookups, the series, and the matrices are all evaluated with
+        whole-array operations, and the result matches itrs_to_gcrs
+        element for element.
+
+        The epochs may mix timescales; each timescale is processed as one
+        batch.
+
+        :param times: Times of the transformation
+        :return: ITRS to GCRS matrices, shape (N, 3, 3)
+        :type times: JulianDateArray | Sequence[JulianDate |
+            datetime.datetime]
+        :rtype: np.ndarray
+        """
+
+        return self._itrs_to_gcrs_grouped(times, None)
+
+    def gcrs_to_itrs_many(self, times):
+        """
+        This function computes the GCRS to ITRS transformation matrix at
+        many epochs at once. See itrs_to_gcrs_many.
+
+        :param times: Times of the transformation
+        :return: GCRS to ITRS matrices, shape (N, 3, 3)
+        :type times: JulianDateArray | Sequence[JulianDate |
+            datetime.datetime]
+        :rtype: np.ndarray
+        """
+
+        return np.swapaxes(self.itrs_to_gcrs_many(times), -1, -2)
 
-        # Construct the final transformation matrix: ITRS -> GCRS
+    def transform_vectors(self, vectors, times,
+                          direction=TransformDirection.ITRS_TO_GCRS, out=None,
+                          chunk_size=TRANSFORM_CHUNK_SIZE):
+        """
+        This function rotates vectors between the ITRS and the GCRS, one
+        epoch per vector. The last two axes of vectors are (epochs, 3), and
+        any leading axes (for example one per object) share the epochs, so
+        each epoch's matrix is computed once. The matrices are built and
+        applied a chunk of epochs at a time and are never returned.
+
+        :param vectors: Vectors, shape (N, 3) or (..., N, 3)
+        :param times: The N epochs, see itrs_to_gcrs_many
+        :param direction: Direction of the transformation
+        :param out: Optional array for the result, same shape as vectors
+        :param chunk_size: Number of epochs per chunk
+        :return: Rotated vectors, shape of vectors
+        :type vectors: np.ndarray
+        :type times: JulianDateArray | Sequence[JulianDate |
+            datetime.datetime]
+        :type direction: TransformDirection
+        :type out: np.ndarray | None
+        :type chunk_size: int
+        :rtype: np.ndarray
+        """
+
+        vectors = np.asarray(vectors, dtype=np.float64)
+
+        if vectors.ndim < 2 or vectors.shape[-1] != 3:
+            raise ValueError('The vectors must have shape (..., N, 3).')
+
+        if vectors.shape[-2] != len(times):
+            raise ValueError('There must be one epoch per vector.')
+
+        if out is None:
+            out = np.empty(vectors.shape)
+        elif out.shape != vectors.shape:
+            raise ValueError('The output array must have the shape of the '
+                             'vectors.')
+
+        direction = TransformDirection(direction)
+
+        # The matrix is transposed for GCRS -> ITRS
+        if direction is TransformDirection.ITRS_TO_GCRS:
+            subscripts = 'nij,...nj->...ni'
+        else:
+            subscripts = 'nji,...nj->...ni'
+
+        for start in range(0, len(times), chunk_size):
+            chunk = slice(start, start + chunk_size)
+
+            t_gi = self.itrs_to_gcrs_many(times[chunk])
+
+            np.einsum(subscripts, t_gi, vectors[..., chunk, :],
+                      out=out[..., chunk, :])
+
+        return out
+
+    def iter_itrs_to_gcrs(self, times, chunk_size=256, vectors=None,
+                          direction=TransformDirection.ITRS_TO_GCRS,
+                          per_chunk=False, timings=None):
+        """
+        This function transforms a stream of epochs of any length. Epochs
+        are pulled lazily from times and processed in micro-batches of
+        chunk_size epochs with the batched pipeline of itrs_to_gcrs_many,
+        so memory use is bounded by the chunk size.
+
+        Without vectors the transformation matrices are yielded. With
+        vectors, which must yield one 3-vector per epoch, the rotated
+        vectors are yielded instead.
+
+        :param times: Epochs of the stream
+        :param chunk_size: Number of epochs per micro-batch
+        :param vectors: Optional vectors, one per epoch
+        :param direction: Direction of the transformation
+        :param per_chunk: Yield one array per micro-batch instead of one
+            result per epoch
+        :param timings: Optional object that accumulates the time spent in
+            each stage of the pipeline
+        :return: Generator of matrices (3, 3) or vectors (3, ), or of
+            arrays of them per micro-batch
+        :type times: Iterable[JulianDate | datetime.datetime]
+        :type chunk_size: int
+        :type vectors: Iterable[np.ndarray] | None
+        :type direction: TransformDirection
+        :type per_chunk: bool
+        :type timings: PipelineTimings | None
+        :rtype: Iterator[np.ndarray]
+        """
+
+        direction = TransformDirection(direction)
+
+        times = iter(times)
+
+        if vectors is not None:
+            vectors = iter(vectors)
+
+        while True:
+            chunk = list(itertools.islice(times, chunk_size))
+
+            if len(chunk) == 0:
+                return
+
+            t_gi = self._itrs_to_gcrs_grouped(chunk, timings)
+
+            if direction is TransformDirection.GCRS_TO_ITRS:
+                t_gi = np.swapaxes(t_gi, 1, 2)
+
+            if vectors is None:
+                result = t_gi
+            else:
+                with _stage(timings, 'vectors'):
+                    chunk_vectors = np.array(
+                        list(itertools.islice(vectors, len(chunk))),
+                        dtype=np.float64)
+
+                    if chunk_vectors.shape != (len(chunk), 3):
+                        raise ValueError('There must be one 3-vector per '
+                                         'epoch.')
+
+                    result = np.einsum('nij,nj->ni', t_gi, chunk_vectors)
+
+            if timings is not None:
+                timings.batches += 1
+                timings.epochs += len(chunk)
+
+            if per_chunk:
+                yield result
+            else:
+                yield from result
+
+    def _itrs_to_gcrs_grouped(self, times, timings):
+        # Batches times by timescale, since a JulianDateArray holds a single
+        # timescale
+        if isinstance(times, JulianDateArray):
+            return self._itrs_to_gcrs_many(times, timings)
+
+        times = [Time.JulianDate.julian_date_from_pydatetime(x)
+                 if isinstance(x, datetime.datetime) else x for x in times]
+
+        t_gi = np.empty((len(times), 3, 3))
+
+        for time_scale in {x.time_scale for x in times}:
+            indices = [i for i, x in enumerate(times)
+                       if x.time_scale == time_scale]
+
+            t_gi[indices] = self._itrs_to_gcrs_many(
+                JulianDateArray.from_julian_dates([times[i]
+                                                   for i in indices]),
+                timings)
+
+        return t_gi
+
+    def _itrs_to_gcrs_many(self, time, timings=None):
+        # The batched form of _itrs_to_gcrs, step for step
+        with _stage(timings, 'time_conversion'):
+            jd_tt = Conversions.any_to_tt_many(time)
+
+            if time.time_scale == Time.TimeScales.UTC:
+                jd_utc = time
+            else:
+                jd_utc = Conversions.tt_to_utc_many(jd_tt)
+
+            mjd_utc = Time.JulianDate.julian_date_to_modified_julian_date(
+                jd_utc).as_float()
+
+            jd_ut1 = Conversions.tt_to_ut1_many(jd_tt)
+
+            jdc_tt = Time.JulianDate.julian_terrestrial_time_to_century(
+                jd_tt).as_float()
+
+        with _stage(timings, 'series'):
+            cip_x, cip_y, cip_s = self.se_cip_xys.compute_many(jdc_tt)
+
+        with _stage(timings, 'eop_lookup'):
+            if self._user_nutation_corrections:
+                dx = self.bd.f_nc_dx.evaluate_many(mjd_utc)
+                dy = self.bd.f_nc_dy.evaluate_many(mjd_utc)
+
+                cip_x = cip_x + Conversions.mas_to_rad(dx)
+                cip_y = cip_y + Conversions.mas_to_rad(dy)
+
+            if self._user_polar_motion:
+                pm_x = self.bd.f_pm_x.evaluate_many(mjd_utc)
+                pm_y = self.bd.f_pm_y.evaluate_many(mjd_utc)
+            else:
+                pm_x = np.zeros(jdc_tt.shape)
+                pm_y = np.zeros(jdc_tt.shape)
+
+        with _stage(timings, 'matrices'):
+            era = Earth.earth_rotation_angle_many(jd_ut1.integer_part(),
+                                                  jd_ut1.fraction_part())
+
+            sp = TransformationMatrices.calculate_s_prime_many(jdc_tt)
+
+            pm_x = Conversions.arcsec_to_rad(pm_x)
+            pm_y = Conversions.arcsec_to_rad(pm_y)
+
+            _, _, _, t_gi = (
+                TransformationMatrices.celestial_terrestrial_matrices_many(
+                    cip_x, cip_y, cip_s, era, pm_x, pm_y, sp))
+
+        return t_gi
+
+    def _itrs_to_gcrs_from_slow_components(self, jd_tt):
+        # Reuse the slowly changing matrices if they are recent enough and
+        # only rebuild the Earth rotation matrix
+        slow_components = self._slow_components
+
+        if slow_components is None:
+            return None
+
+        jd_tt_0, t_gc, t_ti, ut1_tt, ut1_tt_rate = slow_components
+
+        elapsed = _days_between(jd_tt, jd_tt_0)
+
+        if abs(elapsed) * 86400.0 > self._slow_component_window:
+            return None
+
+        jd_ut1 = jd_tt + (ut1_tt + ut1_tt_rate * elapsed)
+        jd_ut1.time_scale = Time.TimeScales.UT1
+
+        t_ct = TransformationMatrices.earth_rotation_matrix(jd_ut1)
         t_gi = t_gc @ t_ct @ t_ti
 
-        self.t_gi = t_gi
-        self.t_gc = t_gc
-        self.t_ct = t_ct
-        self.t_ti = t_ti
+        with self._slow_component_lock:
+            self._slow_component_reuses += 1
 
         return t_gi
 
+    def _cache_key(self, jd_tt):
+        # The epoch in whole days and quanta of the day, with the settings
+        # that change the matrices
+        quanta_per_day = 86400.0 / self._cache_quantum
+        quanta = round(jd_tt.fraction_part() * quanta_per_day)
+        day = jd_tt.integer_part()
+
+        if quanta >= round(quanta_per_day):
+            day += 1
+            quanta = 0
+
+        return (day, quanta, self._user_polar_motion,
+                self._user_nutation_corrections, self._eop_version)
+
+    def itrs_to_gcrs_quaternion(self, time):
+        """
+        This function computes the ITRS to GCRS transformation as a unit
+        quaternion [w, x, y, z]. See
+        TransformationMatrices.quaternion_from_matrix for the convention.
+        The GCRS to ITRS quaternion is its conjugate.
+
+        :param time: Time of the transformation
+        :return: ITRS to GCRS quaternion, shape (4, )
+        :type time: JulianDate | datetime.datetime
+        :rtype: np.ndarray
+        """
+
+        return TransformationMatrices.quaternion_from_matrix(
+            self.itrs_to_gcrs(time))
+
+    def itrs_to_gcrs_quaternion_many(self, times):
+        """
+        This function computes the ITRS to GCRS transformation as a unit
+        quaternion at many epochs at once. See itrs_to_gcrs_many and
+        itrs_to_gcrs_quaternion.
+
+        :param times: Times of the transformation
+        :return: ITRS to GCRS quaternions, shape (N, 4)
+        :type times: JulianDateArray | Sequence[JulianDate |
+            datetime.datetime]
+        :rtype: np.ndarray
+        """
+
+        return TransformationMatrices.quaternion_from_matrix(
+            self.itrs_to_gcrs_many(times))
+
     def gcrs_to_itrs(self, time):
         t_gi = self.itrs_to_gcrs(time)
 
         return t_gi.T
+
+    def gcrs_to_itrs_with_rate(self, time):
+        """
+        This function computes the GCRS to ITRS transformation matrix and its
+        time derivative. See itrs_to_gcrs_with_rate.
+
+        :param time: Time of the transformation
+        :return: GCRS to ITRS matrix and its derivative per SI second
+        :type time: JulianDate | datetime.datetime
+        :rtype: tuple[np.ndarray, np.ndarray]
+        """
+
+        t_gi, t_gi_rate = self.itrs_to_gcrs_with_rate(time)
+
+        return t_gi.T, t_gi_rate.T
+
+
+def _days_between(jd_a, jd_b):
+    # Difference of two Julian dates in days, formed from the two parts to
+    # keep the precision
+    return ((jd_a.integer_part() - jd_b.integer_part()) +
+            (jd_a.fraction_part() - jd_b.fraction_part()))
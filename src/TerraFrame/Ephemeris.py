@@ -0,0 +1,419 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import hashlib
+import json
+import math
+import os
+import tempfile
+from importlib import resources
+from pathlib import Path
+
+import numpy as np
+
+from TerraFrame.CelestialTerrestrial import (CelestialTerrestrialTransformation,
+                                             TRANSFORM_CHUNK_SIZE)
+from TerraFrame.PrecessionNutation import SeriesExpansion
+from TerraFrame.QuaternionInterpolation import (_seconds_between, _squad,
+                                                _squad_controls,
+                                                angular_distance)
+from TerraFrame.Utilities import (BulletinData, Conversions, DataCache,
+                                  TransformationMatrices)
+from TerraFrame.Utilities.Time.JulianDate import JulianDate, JulianDateArray
+from TerraFrame.Utilities.Time.TimeScales import TimeScales
+
+# Version of the file layout written by EphemerisTable.write
+FILE_FORMAT_VERSION = 2
+
+# First bytes of every ephemeris table file
+FILE_MAGIC = b'TFEPHEM\n'
+
+# Size of the header in bytes. The rotations start right after it, aligned
+# to a memory page.
+HEADER_SIZE = 4096
+
+# The estimated maximum error is the largest error seen between the nodes
+# times this factor, to allow for the epochs that weren't checked
+ERROR_ESTIMATE_FACTOR = 2.0
+
+# Data files the model is computed from, apart from the Earth orientation
+# data
+MODEL_DATA_FILES = ('tab5.2a.txt', 'tab5.2b.txt', 'tab5.2d.txt',
+                    'TAI_UTC_Delta.txt')
+
+
+def model_data_checksums():
+    """
+    This function computes the checksums of the installed model data files.
+
+    :return: Checksum of each file in MODEL_DATA_FILES
+    :rtype: dict[str, str]
+    """
+
+    data = resources.files("TerraFrame.Data")
+
+    return {x: DataCache.checksum(data.joinpath(x).read_bytes())
+            for x in MODEL_DATA_FILES}
+
+
+class EphemerisTable:
+    """
+    This class serves the ITRS to GCRS rotation from a file precomputed over
+    a range of time, so jobs that need the rotation over the same range
+    don't each evaluate the full model. The file is memory mapped read-only,
+    so processes that open the same file share its pages.
+
+    The file starts with a header of HEADER_SIZE bytes: FILE_MAGIC followed
+    by a JSON document padded with spaces. The header holds the format
+    version, the time range and step in TT, the settings of the
+    transformation, the version of the Earth orientation data and the
+    checksums of the model data files the table was computed from, the
+    checksum of the rotations, and the estimated maximum error.
+
+    The rotations follow as a little-endian float64 array of shape (N, 2,
+    4). For each node, evenly spaced in TT, it holds the ITRS to GCRS unit
+    quaternion [w, x, y, z] and its SQUAD control point, which plays the
+    role of the cubic Hermite coefficient on the unit sphere. Epochs between
+    the nodes are interpolated as in QuaternionInterpolator.
+    """
+
+    def __init__(self, file):
+        """
+        :param file: Table written by write
+        :type file: str | os.PathLike
+        """
+
+        self.file = Path(file)
+
+        with open(self.file, 'rb') as f:
+            header = f.read(HEADER_SIZE)
+
+        if len(header) != HEADER_SIZE or not header.startswith(FILE_MAGIC):
+            raise ValueError(f'{self.file} is not an ephemeris table.')
+
+        self.header = json.loads(header[len(FILE_MAGIC):].decode('utf-8'))
+
+        if self.header['format_version'] != FILE_FORMAT_VERSION:
+            raise ValueError(f'Unsupported ephemeris table version: '
+                             f'{self.header["format_version"]}')
+
+        self.start = JulianDate(*self.header['start'],
+                                time_scale=TimeScales.TT)
+        self.end = JulianDate(*self.header['end'], time_scale=TimeScales.TT)
+        self.step = float(self.header['step'])
+        self.span = float(self.header['span'])
+        self.max_error = float(self.header['max_error'])
+        self.estimated_max_error = float(
+            self.header['estimated_max_error'])
+
+        self._data = np.memmap(self.file, dtype='<f8', mode='r',
+                               offset=HEADER_SIZE,
+                               shape=tuple(self.header['shape']))
+
+    def __len__(self):
+        return self._data.shape[0]
+
+    @classmethod
+    def write(cls, file, start, end, step, transformation=None,
+              samples_per_interval=1, chunk_size=TRANSFORM_CHUNK_SIZE):
+        """
+        This function evaluates the full model at nodes spaced by step over
+        [start, end) and writes the table. The interpolation is then
+        compared with the full model at samples_per_interval evenly spaced
+        epochs between each pair of nodes, and the estimated maximum error
+        is the largest error seen times ERROR_ESTIMATE_FACTOR. It is an
+        estimate, not a bound: the epochs that weren't checked can have
+        larger errors.
+
+        The table is written to a temporary file that replaces file once
+        it's complete, so readers never see a partially written table.
+
+        :param file: Path of the table
+        :param start: First epoch of the range
+        :param end: End of the range, not included
+        :param step: Spacing of the nodes in seconds of TT
+        :param transformation: Transformation used at the nodes. Defaults to
+            CelestialTerrestrialTransformation with its default settings.
+        :param samples_per_interval: Number of epochs checked between each
+            pair of nodes
+        :param chunk_size: Number of epochs evaluated at once
+        :return: The written table
+        :type file: str | os.PathLike
+        :type start: JulianDate
+        :type end: JulianDate
+        :type step: float
+        :type transformation: CelestialTerrestrialTransformation | None
+        :type samples_per_interval: int
+        :type chunk_size: int
+        :rtype: EphemerisTable
+        """
+
+        if step <= 0.0:
+            raise ValueError('The step must be positive.')
+
+        if samples_per_interval < 1:
+            raise ValueError('At least one epoch per interval must be '
+                             'checked.')
+
+        if transformation is None:
+            transformation = CelestialTerrestrialTransformation()
+
+        start = Conversions.any_to_tt(start)
+        end = Conversions.any_to_tt(end)
+        span = _seconds_between(end, start)
+
+        if span <= 0.0:
+            raise ValueError('The end of the range must be after the start.')
+
+        step = float(step)
+        shape = (math.ceil(span / step) + 1, 2, 4)
+
+        start_dates = JulianDateArray(start.integer_part(),
+                                      start.fraction_part(), TimeScales.TT)
+
+        def evaluate(seconds):
+            return transformation.itrs_to_gcrs_quaternion_many(
+                start_dates + Conversions.seconds_to_days(seconds))
+
+        file = Path(file)
+
+        fd, tmp_path = tempfile.mkstemp(suffix='.tmp',
+                                        dir=file.absolute().parent)
+
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.truncate(HEADER_SIZE + 8 * math.prod(shape))
+
+            data = np.memmap(tmp_path, dtype='<f8', mode='r+',
+                             offset=HEADER_SIZE, shape=shape)
+
+            _fill(data, step, evaluate, chunk_size)
+            data.flush()
+
+            max_error, max_error_seconds = _check(
+                data, step, span, evaluate, samples_per_interval, chunk_size)
+
+            header = {
+                'format_version': FILE_FORMAT_VERSION,
+                'time_scale': TimeScales.TT.name,
+                'start': [start.integer_part(), start.fraction_part()],
+                'end': [end.integer_part(), end.fraction_part()],
+                'step': step,
+                'span': span,
+                'dtype': '<f8',
+                'shape': list(shape),
+                'eop_version': BulletinData.BulletinData().version,
+                'table_checksums': model_data_checksums(),
+                'data_checksum': _checksum(data, chunk_size),
+                'max_error': max_error,
+                'max_error_seconds': max_error_seconds,
+                'estimated_max_error': ERROR_ESTIMATE_FACTOR * max_error,
+                'samples_per_interval': int(samples_per_interval),
+                **_settings(transformation)}
+
+            del data
+
+            header = FILE_MAGIC + json.dumps(header, indent=1,
+                                             sort_keys=True).encode('utf-8')
+
+            if len(header) > HEADER_SIZE:
+                raise ValueError('The ephemeris table header is too long.')
+
+            with open(tmp_path, 'r+b') as f:
+                f.write(header.ljust(HEADER_SIZE, b' '))
+
+            os.replace(tmp_path, file)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+        return cls(file)
+
+    def __call__(self, times):
+        """
+        This function interpolates the ITRS to GCRS quaternion.
+
+        :param times: Epochs within the range of the table, in one timescale
+        :return: Unit quaternions [w, x, y, z], shape (N, 4)
+        :type times: JulianDateArray | Sequence[JulianDate]
+        :rtype: np.ndarray
+        """
+
+        if not isinstance(times, JulianDateArray):
+            times = JulianDateArray.from_julian_dates(list(times))
+
+        jd_tt = Conversions.any_to_tt_many(times)
+
+        return self.interpolate_seconds(_seconds_between(jd_tt, self.start))
+
+    def matrices(self, times):
+        """
+        This function interpolates the ITRS to GCRS matrix.
+
+        :param times: Epochs within the range of the table, in one timescale
+        :return: ITRS to GCRS matrices, shape (N, 3, 3)
+        :type times: JulianDateArray | Sequence[JulianDate]
+        :rtype: np.ndarray
+        """
+
+        return TransformationMatrices.matrix_from_quaternion(self(times))
+
+    def interpolate_seconds(self, seconds):
+        """
+        This function interpolates the ITRS to GCRS quaternion at epochs
+        given as seconds of TT since the start of the table.
+
+        :param seconds: Seconds of TT since the start, in [0, span)
+        :return: Unit quaternions [w, x, y, z], shape seconds.shape + (4, )
+        :type seconds: float | np.ndarray
+        :rtype: np.ndarray
+        """
+
+        seconds = np.asarray(seconds, dtype=np.float64)
+
+        if np.any(seconds < 0.0) or np.any(seconds >= self.span):
+            raise ValueError('The epochs must be within the range of the '
+                             'ephemeris table.')
+
+        return _interpolate(self._data, self.step, seconds)
+
+    def is_current(self, transformation=None):
+        """
+        This function checks whether the table was computed from the
+        installed Earth orientation data and model data files, with the
+        settings of transformation.
+
+        :param transformation: Transformation the table should match.
+            Defaults to CelestialTerrestrialTransformation with its default
+            settings.
+        :return: True if the checksums and settings in the header match the
+            installed data and transformation
+        :type transformation: CelestialTerrestrialTransformation | None
+        :rtype: bool
+        """
+
+        if transformation is None:
+            transformation = CelestialTerrestrialTransformation()
+
+        settings = _settings(transformation)
+
+        return (self.header['eop_version'] ==
+                BulletinData.BulletinData().version and
+                self.header['table_checksums'] == model_data_checksums() and
+                all(self.header[x] == settings[x] for x in settings))
+
+    def verify(self, chunk_size=TRANSFORM_CHUNK_SIZE):
+        """
+        This function checks the rotations against the checksum in the
+        header. It reads the whole table.
+
+        :param chunk_size: Number of nodes read at once
+        :return: True if the rotations are intact
+        :type chunk_size: int
+        :rtype: bool
+        """
+
+        return _checksum(self._data, chunk_size) == self.header[
+            'data_checksum']
+
+
+def _settings(transformation):
+    # Settings of the transformation that change the rotations, in the form
+    # they take in the header
+    accuracy = transformation._accuracy
+
+    if isinstance(accuracy, SeriesExpansion.Accuracy):
+        accuracy = accuracy.value
+
+    return {'accuracy': float(accuracy),
+            'time_span': [float(x) for x in transformation._time_span],
+            'user_polar_motion': transformation._user_polar_motion,
+            'user_nutation_corrections':
+                transformation._user_nutation_corrections}
+
+
+def _fill(data, step, evaluate, chunk_size):
+    count = data.shape[0]
+
+    # The nodes just outside the table give the control points of the first
+    # and last nodes
+    before = evaluate(np.array([-step]))
+    previous = before
+
+    for a in range(0, count, chunk_size):
+        b = min(a + chunk_size, count)
+
+        q = _continue_signs(evaluate(step * np.arange(a, b)), previous[-1])
+
+        data[a:b, 0] = q
+        previous = q
+
+    after = _continue_signs(evaluate(np.array([step * count])),
+                            previous[-1])
+
+    for a in range(0, count, chunk_size):
+        b = min(a + chunk_size, count)
+
+        window = np.concatenate([before if a == 0 else data[a - 1:a, 0],
+                                 data[a:b, 0],
+                                 after if b == count else data[b:b + 1, 0]])
+
+        data[a:b, 1] = _squad_controls(window)[1:-1]
+
+
+def _continue_signs(q, q_previous):
+    # q and -q are the same rotation. Pick the signs so that each
+    # quaternion is in the same hemisphere as the one before it.
+    dots = np.sum(q * np.concatenate([q_previous[None], q[:-1]]), axis=-1)
+    signs = np.cumprod(np.where(dots < 0.0, -1.0, 1.0))
+
+    return q * signs[:, None]
+
+
+def _check(data, step, span, evaluate, samples_per_interval, chunk_size):
+    offsets = (np.arange(1, samples_per_interval + 1) /
+               (samples_per_interval + 1))
+
+    max_error = 0.0
+    max_error_seconds = 0.0
+
+    for a in range(0, data.shape[0] - 1, chunk_size):
+        b = min(a + chunk_size, data.shape[0] - 1)
+
+        seconds = step * (np.arange(a, b)[:, None] + offsets).reshape(-1)
+        seconds = seconds[seconds < span]
+
+        if len(seconds) == 0:
+            continue
+
+        errors = angular_distance(evaluate(seconds),
+                                  _interpolate(data, step, seconds))
+        worst = int(np.argmax(errors))
+
+        if errors[worst] > max_error:
+            max_error = float(errors[worst])
+            max_error_seconds = float(seconds[worst])
+
+    return max_error, max_error_seconds
+
+
+def _interpolate(data, step, seconds):
+    position = seconds / step
+    index = np.clip(np.floor(position).astype(np.intp), 0,
+                    data.shape[0] - 2)
+    u = (position - index)[..., None]
+
+    return _squad(data[index, 0], data[index + 1, 0], data[index, 1],
+                  data[index + 1, 1], u)
+
+
+def _checksum(data, chunk_size):
+    # Same digest as DataCache.checksum of the raw bytes, without reading
+    # the whole table into memory at once
+    digest = hashlib.sha256()
+
+    for a in range(0, data.shape[0], chunk_size):
+        digest.update(np.ascontiguousarray(data[a:a + chunk_size]).tobytes())
+
+    return digest.hexdigest()
@@ -0,0 +1,385 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import datetime
+import math
+
+import numpy as np
+
+from TerraFrame.PrecessionNutation import Precession, SeriesExpansion
+from TerraFrame.Utilities import (BulletinData, Conversions, Earth, Time,
+                                  TransformationMatrices)
+from TerraFrame.Utilities.Time.JulianDate import JulianDate, JulianDateArray
+
+
+class EquinoxTransformation:
+    """
+    This class provides the classical, equinox-based transformations: the
+    nutation angles, the equation of the equinoxes, Greenwich apparent
+    sidereal time (GAST), the Geocentric Celestial Reference System (GCRS)
+    to true of date (TOD) transformation, and the International Terrestrial
+    Reference System (ITRS) to True Equator Mean Equinox (TEME)
+    transformation used with SGP4.
+
+    As in CelestialTerrestrialTransformation, the epochs are JulianDate,
+    JulianDateArray, or datetime objects in any supported timescale. TT and
+    UT1 are derived with Conversions and polar motion is interpolated in
+    the IERS bulletin. A single epoch gives a single result and a
+    JulianDateArray or a sequence of epochs gives one result per epoch.
+
+    The functions ending in _centuries are a lower-level interface that
+    takes terrestrial time (TT) in Julian centuries since J2000 as floats
+    or arrays, and UT1 as a Julian date, optionally split into two parts
+    to preserve precision. See also itrs_to_teme_matrix.
+
+    The nutation in longitude and obliquity and the complementary terms of
+    the equation of the equinoxes are evaluated as one fused series, so the
+    fundamental arguments are computed once per epoch. The precession is
+    IAU 2006 and the nutation is IAU 2000A with the IAU 2006 adjustments.
+    """
+
+    def __init__(self, user_polar_motion=True,
+                 accuracy=SeriesExpansion.Accuracy.FULL,
+                 time_span=SeriesExpansion.DEFAULT_TIME_SPAN):
+        """
+        :param user_polar_motion: Apply polar motion from the IERS bulletin
+            in the TEME transformations
+        :param accuracy: Accuracy tier or maximum truncation error of the
+            nutation series
+        :param time_span: Julian centuries TT over which the accuracy holds
+        :type user_polar_motion: bool
+        :type accuracy: SeriesExpansion.Accuracy | float
+        :type time_span: tuple[float, float]
+        """
+
+        # See SeriesExpansion.Accuracy for the worst-case error of each
+        # accuracy tier over the time span (Julian centuries TT).
+        self.se_equinox = SeriesExpansion.equinox_nutation(accuracy,
+                                                           time_span)
+
+        self._user_polar_motion = user_polar_motion
+
+        if self._user_polar_motion:
+            self.bd = BulletinData.BulletinData()
+        else:
+            self.bd = None
+
+    def nutation(self, times):
+        """
+        This function computes the nutation in longitude and obliquity.
+
+        :param times: Epochs of the nutation
+        :return: Delta psi and Delta epsilon in radians
+        :type times: JulianDate | JulianDateArray | datetime.datetime |
+            Sequence[JulianDate | datetime.datetime]
+        :rtype: tuple[float | np.ndarray, float | np.ndarray]
+        """
+
+        times, single = _julian_date_array(times)
+
+        d_psi, d_epsilon = self.nutation_centuries(_centuries(times))
+
+        return _result(d_psi, single), _result(d_epsilon, single)
+
+    def nutation_centuries(self, t):
+        """
+        This function computes the nutation in longitude and obliquity.
+
+        :param t: Terrestrial time measured in Julian centuries
+        :return: Delta psi and Delta epsilon in radians
+        :type t: float | np.ndarray
+        :rtype: tuple[np.ndarray, np.ndarray]
+        """
+
+        d_psi, d_epsilon, _ = self.se_equinox.compute_many(t)
+
+        return d_psi, d_epsilon
+
+    def equation_of_the_equinoxes(self, times):
+        """
+        This function computes the equation of the equinoxes, the difference
+        between apparent and mean sidereal time, including the
+        complementary terms of IERS Conventions (2003).
+
+        :param times: Epochs of the equation of the equinoxes
+        :return: Equation of the equinoxes in radians
+        :type times: JulianDate | JulianDateArray | datetime.datetime |
+            Sequence[JulianDate | datetime.datetime]
+        :rtype: float | np.ndarray
+        """
+
+        times, single = _julian_date_array(times)
+
+        return _result(self.equation_of_the_equinoxes_centuries(
+            _centuries(times)), single)
+
+    def equation_of_the_equinoxes_centuries(self, t):
+        """
+        This function computes the equation of the equinoxes. See
+        equation_of_the_equinoxes.
+
+        :param t: Terrestrial time measured in Julian centuries
+        :return: Equation of the equinoxes in radians
+        :type t: float | np.ndarray
+        :rtype: np.ndarray
+        """
+
+        d_psi, _, complementary_terms = self.se_equinox.compute_many(t)
+
+        return _equation_of_the_equinoxes(t, d_psi, complementary_terms)
+
+    def greenwich_apparent_sidereal_time(self, times):
+        """
+        This function computes Greenwich apparent sidereal time as the IAU
+        2006 mean sidereal time plus the equation of the equinoxes.
+
+        :param times: Epochs of the sidereal time
+        :return: GAST in radians, in [0, 2 pi)
+        :type times: JulianDate | JulianDateArray | datetime.datetime |
+            Sequence[JulianDate | datetime.datetime]
+        :rtype: float | np.ndarray
+        """
+
+        times, single = _julian_date_array(times)
+
+        jd_tt = Conversions.any_to_tt_many(times)
+        jd_ut1 = Conversions.tt_to_ut1_many(jd_tt)
+
+        return _result(self.greenwich_apparent_sidereal_time_centuries(
+            _centuries(jd_tt), jd_ut1.integer_part(),
+            jd_ut1.fraction_part()), single)
+
+    def greenwich_apparent_sidereal_time_centuries(self, t, jd_ut1,
+                                                   jd_ut1_fraction=0.0):
+        """
+        This function computes Greenwich apparent sidereal time. See
+        greenwich_apparent_sidereal_time.
+
+        :param t: Terrestrial time measured in Julian centuries
+        :param jd_ut1: Julian date in UT1, or its integer part
+        :param jd_ut1_fraction: Fraction part of the Julian date
+        :return: GAST in radians, in [0, 2 pi)
+        :type t: float | np.ndarray
+        :type jd_ut1: float | np.ndarray
+        :type jd_ut1_fraction: float | np.ndarray
+        :rtype: np.ndarray
+        """
+
+        era = Earth.earth_rotation_angle_many(jd_ut1, jd_ut1_fraction)
+        gmst = Precession.greenwich_mean_sidereal_time(t, era)
+
+        gast = gmst + self.equation_of_the_equinoxes_centuries(t)
+
+        return np.mod(gast, 2.0 * math.pi)
+
+    def gcrs_to_tod(self, times):
+        """
+        This function computes the transformation matrix from the GCRS to
+        the true equator and equinox of date (TOD). It includes the frame
+        bias, the precession, and the nutation.
+
+        :param times: Epochs of the transformation
+        :return: GCRS to TOD matrices, shape (3, 3) or (N, 3, 3)
+        :type times: JulianDate | JulianDateArray | datetime.datetime |
+            Sequence[JulianDate | datetime.datetime]
+        :rtype: np.ndarray
+        """
+
+        times, single = _julian_date_array(times)
+
+        return _result(self.gcrs_to_tod_centuries(_centuries(times)),
+                       single)
+
+    def gcrs_to_tod_centuries(self, t):
+        """
+        This function computes the transformation matrix from the GCRS to
+        TOD. See gcrs_to_tod.
+
+        :param t: Terrestrial time measured in Julian centuries
+        :return: GCRS to TOD matrices, shape t.shape + (3, 3)
+        :type t: float | np.ndarray
+        :rtype: np.ndarray
+        """
+
+        t = np.asarray(t, dtype=np.float64)
+
+        d_psi, d_epsilon, _ = self.se_equinox.compute_many(t)
+
+        gamma_bar, phi_bar, psi_bar, epsilon_a = (
+            Precession.precession_angles(t))
+
+        return Precession.fukushima_williams_matrix(
+            gamma_bar, phi_bar, psi_bar + d_psi, epsilon_a + d_epsilon)
+
+    def tod_to_gcrs(self, times):
+        """
+        This function computes the transformation matrix from the true
+        equator and equinox of date (TOD) to the GCRS. See gcrs_to_tod.
+
+        :param times: Epochs of the transformation
+        :return: TOD to GCRS matrices, shape (3, 3) or (N, 3, 3)
+        :type times: JulianDate | JulianDateArray | datetime.datetime |
+            Sequence[JulianDate | datetime.datetime]
+        :rtype: np.ndarray
+        """
+
+        return np.swapaxes(self.gcrs_to_tod(times), -1, -2)
+
+    def tod_to_gcrs_centuries(self, t):
+        """
+        This function computes the transformation matrix from TOD to the
+        GCRS. See gcrs_to_tod.
+
+        :param t: Terrestrial time measured in Julian centuries
+        :return: TOD to GCRS matrices, shape t.shape + (3, 3)
+        :type t: float | np.ndarray
+        :rtype: np.ndarray
+        """
+
+        return np.swapaxes(self.gcrs_to_tod_centuries(t), -1, -2)
+
+    def itrs_to_teme(self, times):
+        """
+        This function computes the transformation matrix from the ITRS to
+        the True Equator Mean Equinox (TEME) frame of SGP4. UT1 comes from
+        Conversions and polar motion from the IERS bulletin, unless the
+        transformation was created without polar motion. See
+        itrs_to_teme_matrix.
+
+        :param times: Epochs of the transformation
+        :return: ITRS to TEME matrices, shape (3, 3) or (N, 3, 3)
+        :type times: JulianDate | JulianDateArray | datetime.datetime |
+            Sequence[JulianDate | datetime.datetime]
+        :rtype: np.ndarray
+        """
+
+        times, single = _julian_date_array(times)
+
+        jd_tt = Conversions.any_to_tt_many(times)
+        jd_ut1 = Conversions.tt_to_ut1_many(jd_tt)
+
+        if self._user_polar_motion:
+            if times.time_scale == Time.TimeScales.UTC:
+                jd_utc = times
+            else:
+                jd_utc = Conversions.tt_to_utc_many(jd_tt)
+
+            mjd_utc = Time.JulianDate.julian_date_to_modified_julian_date(
+                jd_utc).as_float()
+
+            pm_x = Conversions.arcsec_to_rad(
+                self.bd.f_pm_x.evaluate_many(mjd_utc))
+            pm_y = Conversions.arcsec_to_rad(
+                self.bd.f_pm_y.evaluate_many(mjd_utc))
+        else:
+            pm_x = np.zeros(len(times))
+            pm_y = np.zeros(len(times))
+
+        return _result(itrs_to_teme_matrix(
+            jd_ut1.integer_part(), jd_ut1.fraction_part(), pm_x, pm_y),
+            single)
+
+    def teme_to_itrs(self, times):
+        """
+        This function computes the transformation matrix from the True
+        Equator Mean Equinox (TEME) frame of SGP4 to the ITRS. See
+        itrs_to_teme.
+
+        :param times: Epochs of the transformation
+        :return: TEME to ITRS matrices, shape (3, 3) or (N, 3, 3)
+        :type times: JulianDate | JulianDateArray | datetime.datetime |
+            Sequence[JulianDate | datetime.datetime]
+        :rtype: np.ndarray
+        """
+
+        return np.swapaxes(self.itrs_to_teme(times), -1, -2)
+
+
+def itrs_to_teme_matrix(jd_ut1, jd_ut1_fraction, pm_x, pm_y):
+    """
+    This function computes the transformation matrix from the ITRS to the
+    True Equator Mean Equinox (TEME) frame of SGP4 from UT1 and polar
+    motion given explicitly. TEME is rotated from the pseudo Earth fixed
+    frame by the IAU 1982 Greenwich mean sidereal time, and the pseudo Earth
+    fixed frame differs from the ITRS by polar motion. See Vallado et al.
+    (2006), "Revisiting Spacetrack Report #3".
+
+    :param jd_ut1: Julian date in UT1, or its integer part
+    :param jd_ut1_fraction: Fraction part of the Julian date
+    :param pm_x: Polar motion x coordinate in radians
+    :param pm_y: Polar motion y coordinate in radians
+    :return: ITRS to TEME matrices, shape jd_ut1.shape + (3, 3)
+    :type jd_ut1: float | np.ndarray
+    :type jd_ut1_fraction: float | np.ndarray
+    :type pm_x: float | np.ndarray
+    :type pm_y: float | np.ndarray
+    :rtype: np.ndarray
+    """
+
+    gmst = Precession.greenwich_mean_sidereal_time_1982(jd_ut1,
+                                                        jd_ut1_fraction)
+
+    # ITRS -> PEF: R2(x_p) R1(y_p), the polar motion matrix without s'
+    t_pi = (TransformationMatrices.rotation_stack(2, pm_x) @
+            TransformationMatrices.rotation_stack(1, pm_y))
+
+    return TransformationMatrices.rotation_stack(3, -gmst) @ t_pi
+
+
+def teme_to_itrs_matrix(jd_ut1, jd_ut1_fraction, pm_x, pm_y):
+    """
+    This function computes the transformation matrix from the True Equator
+    Mean Equinox (TEME) frame of SGP4 to the ITRS from UT1 and polar motion
+    given explicitly. See itrs_to_teme_matrix.
+
+    :param jd_ut1: Julian date in UT1, or its integer part
+    :param jd_ut1_fraction: Fraction part of the Julian date
+    :param pm_x: Polar motion x coordinate in radians
+    :param pm_y: Polar motion y coordinate in radians
+    :return: TEME to ITRS matrices, shape jd_ut1.shape + (3, 3)
+    :type jd_ut1: float | np.ndarray
+    :type jd_ut1_fraction: float | np.ndarray
+    :type pm_x: float | np.ndarray
+    :type pm_y: float | np.ndarray
+    :rtype: np.ndarray
+    """
+
+    return np.swapaxes(itrs_to_teme_matrix(jd_ut1, jd_ut1_fraction, pm_x,
+                                           pm_y), -1, -2)
+
+
+def _julian_date_array(times):
+    # The epochs as one JulianDateArray, and whether a single epoch was
+    # given. A JulianDateArray holds a single timescale, so a sequence that
+    # mixes timescales is converted to TT.
+    if isinstance(times, JulianDateArray):
+        return times, False
+
+    if isinstance(times, (JulianDate, datetime.datetime)):
+        return _julian_date_array([times])[0], True
+
+    times = [Time.JulianDate.julian_date_from_pydatetime(x)
+             if isinstance(x, datetime.datetime) else x for x in times]
+
+    if len({x.time_scale for x in times}) > 1:
+        times = [Conversions.any_to_tt(x) for x in times]
+
+    return JulianDateArray.from_julian_dates(times), False
+
+
+def _centuries(times):
+    jd_tt = Conversions.any_to_tt_many(times)
+
+    return Time.JulianDate.julian_terrestrial_time_to_century(
+        jd_tt).as_float()
+
+
+def _result(values, single):
+    return values[0] if single else values
+
+
+def _equation_of_the_equinoxes(t, d_psi, complementary_terms):
+    epsilon_a = Precession.mean_obliquity(t)
+
+    return d_psi * np.cos(epsilon_a) + complementary_terms
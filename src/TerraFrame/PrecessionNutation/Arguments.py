@@ -4,95 +4,283 @@
 
 import math
 
-from TerraFrame.Utilities import Conversions
+import numpy as np
+
+from TerraFrame.Utilities import Conversions, Kernels
+
+# Polynomial coefficients of the 14 fundamental arguments, lowest power
+# first, in the order used by the IERS series tables. The luni-solar
+# arguments (the first five rows) are in arcseconds. The planetary arguments
+# and the general precession in longitude are in radians.
+POLYNOMIAL_COEFFICIENTS = np.array([
+    [485868.24903600005, 1717915923.217800, 31.879200, 0.05163500,
+     -0.0002447000],  # l
+    [1287104.793048, 129596581.0481, -0.5532, 0.0001360,
+     -0.00001149],  # l'
+    [335779.526232, 1739527262.8478, -12.75120, -0.001037,
+     0.00000417],  # F
+    [1072260.7036920001, 1602961601.2090, -6.3706, 0.006593,
+     -0.00003169],  # D
+    [450160.39803599997, -6962890.5431, 7.4722, 0.0077020,
+     -0.00005939],  # Ω
+    [4.402608842, 2608.7903141574, 0.0, 0.0, 0.0],  # L_Me
+    [3.176146697, 1021.3285546211, 0.0, 0.0, 0.0],  # L_Ve
+    [1.753470314, 628.3075849991, 0.0, 0.0, 0.0],  # L_E
+    [6.203480913, 334.0612426700, 0.0, 0.0, 0.0],  # L_Ma
+    [0.599546497, 52.9690962641, 0.0, 0.0, 0.0],  # L_J
+    [0.874016757, 21.3299104960, 0.0, 0.0, 0.0],  # L_Sa
+    [5.481293872, 7.4781598567, 0.0, 0.0, 0.0],  # L_U
+    [5.311886287, 3.8133035638, 0.0, 0.0, 0.0],  # L_Ne
+    [0.0, 0.02438175, 0.00000538691, 0.0, 0.0],  # p_A
+])
+
+# Number of leading rows of POLYNOMIAL_COEFFICIENTS that are in arcseconds
+N_ARCSECOND_ARGUMENTS = 5
+
+# Number of leading rows of POLYNOMIAL_COEFFICIENTS that are reduced to a
+# single turn. The general precession in longitude is not reduced.
+N_REDUCED_ARGUMENTS = 13
+
+# The coefficients as plain floats for the scalar path
+_COEFFICIENT_ROWS = tuple(tuple(x) for x in POLYNOMIAL_COEFFICIENTS.tolist())
+
+# Coefficients of the time derivatives of the argument polynomials
+_RATE_COEFFICIENTS = (POLYNOMIAL_COEFFICIENTS[:, 1:] *
+                      np.arange(1, POLYNOMIAL_COEFFICIENTS.shape[1]))
+
+
+def fundamental_arguments(time):
+    """
+    This function computes the 14 fundamental arguments of the nutation
+    theory per IERS Conventions (2010) for one or many epochs. The order is
+    the one used by the IERS series tables: l, l', F, D, Ω, L_Me, L_Ve, L_E,
+    L_Ma, L_J, L_Sa, L_U, L_Ne, p_A.
+
+    The polynomials are evaluated with Horner's method. The luni-solar
+    arguments are reduced to a single turn while still in arcseconds to
+    maintain accuracy, and the planetary arguments are reduced to a single
+    turn in radians.
+
+    :type time: float | np.ndarray
+    :param time: TT or TDB measured in Julian centuries.
+    :return: Fundamental arguments in radians. The shape is the shape of time
+        with an extra trailing axis of length 14.
+    :rtype: np.ndarray
+    """
 
+    if np.ndim(time) == 0:
+        time = float(time)
 
-def mean_anomaly_of_the_moon(time):
-    """
-    This function computes the mean anomaly of the Moon per IERS Conventions
-    (2010)
+    if Kernels.use_compiled():
+        return Kernels.fundamental_arguments(time, POLYNOMIAL_COEFFICIENTS,
+                                             N_ARCSECOND_ARGUMENTS,
+                                             N_REDUCED_ARGUMENTS)
 
-    Note that technically, per IERS Conventions (2010), the input time should
-    be Barycentric Dynamical Time (TDB) but the difference between TDB and TT is
-    already small. Additionally, we do not consider effects outside the
-    Geocentric Celestial Reference System (GCRS) and the primary driver of the
-    TDB vs TT difference is earth's mean anomaly in its orbit. The error from
-    this simplication is less than a microarcsecond in nutation.
+    t = np.asarray(time, dtype=np.float64)[..., np.newaxis]
 
-    :type time: float
-    :param time: Terrestrial time measured in Julian centuries.
-    :return:
+    values = POLYNOMIAL_COEFFICIENTS[:, -1] * t + POLYNOMIAL_COEFFICIENTS[:, -2]
+
+    for k in range(POLYNOMIAL_COEFFICIENTS.shape[1] - 3, -1, -1):
+        values *= t
+        values += POLYNOMIAL_COEFFICIENTS[:, k]
+
+    values[..., :N_ARCSECOND_ARGUMENTS] = Conversions.arcsec_to_rad(
+        np.fmod(values[..., :N_ARCSECOND_ARGUMENTS], 360 * 60 * 60))
+
+    values[..., N_ARCSECOND_ARGUMENTS:N_REDUCED_ARGUMENTS] = np.fmod(
+        values[..., N_ARCSECOND_ARGUMENTS:N_REDUCED_ARGUMENTS], 2.0 * math.pi)
+
+    return values
+
+
+def fundamental_argument_rates(time):
     """
+    This function computes the time derivatives of the 14 fundamental
+    arguments for one or many epochs. The order matches
+    fundamental_arguments.
+
+    :type time: float | np.ndarray
+    :param time: TT or TDB measured in Julian centuries.
+    :return: Argument rates in radians per Julian century. The shape is the
+        shape of time with an extra trailing axis of length 14.
+    :rtype: np.ndarray
+    """
+
+    if np.ndim(time) == 0:
+        time = float(time)
 
-    # The polynomial is in arcseconds
-    value = (485868.24903600005 + 1717915923.217800 * time +
-             31.879200 * time ** 2 + 0.05163500 * time ** 3 -
-             0.0002447000 * time ** 4)
+    t = np.asarray(time, dtype=np.float64)[..., np.newaxis]
 
-    # Take the modulus before convertion to maintain accuracy
-    value = math.fmod(value, 360 * 60 * 60)
+    values = _RATE_COEFFICIENTS[:, -1] * t + _RATE_COEFFICIENTS[:, -2]
 
-    value = Conversions.arcsec_to_rad(value)
+    for k in range(_RATE_COEFFICIENTS.shape[1] - 3, -1, -1):
+        values *= t
+        values += _RATE_COEFFICIENTS[:, k]
+
+    values[..., :N_ARCSECOND_ARGUMENTS] = Conversions.arcsec_to_rad(
+        values[..., :N_ARCSECOND_ARGUMENTS])
+
+    return values
+
+
+def _argument(time, index):
+    # Evaluates a single fundamental argument with exactly the same
+    # operations as fundamental_arguments, so both paths agree to the bit.
+    if np.ndim(time) > 0:
+        return fundamental_arguments(time)[..., index]
+
+    time = float(time)
+    coefficients = _COEFFICIENT_ROWS[index]
+
+    value = coefficients[-1] * time + coefficients[-2]
+
+    for k in range(len(coefficients) - 3, -1, -1):
+        value = value * time + coefficients[k]
+
+    if index < N_ARCSECOND_ARGUMENTS:
+        value = Conversions.arcsec_to_rad(math.fmod(value, 360 * 60 * 60))
+    elif index < N_REDUCED_ARGUMENTS:
+        value = math.fmod(value, 2.0 * math.pi)
 
     return value
 
 
-def mean_anomaly_of_the_sun(time):
+def fundamental_argument_differences(time, step):
     """
-    This function computes the mean anomaly of the Sun per IERS Conventions
-    (2010)
+    This function computes the first and second forward differences of the
+    14 fundamental arguments:
+        a(t + h) - a(t)
+        a(t + 2h) - 2 a(t + h) + a(t)
 
-    Note that technically, per IERS Conventions (2010), the input time should
-    be Barycentric Dynamical Time (TDB) but the difference between TDB and TT is
-    already small. Additionally, we do not consider effects outside the
-    Geocentric Celestial Reference System (GCRS) and the primary driver of the
-    TDB vs TT difference is earth's mean anomaly in its orbit. The error from
-    this simplication is less than a microarcsecond in nutation.
+    The differences are formed from the polynomial coefficients without
+    subtracting the (large) argument values, so they keep full relative
+    precision for small steps. No modulus is taken.
 
     :type time: float
-    :param time: Terrestrial time measured in Julian centuries.
-    :return:
+    :type step: float
+    :param time: TT or TDB measured in Julian centuries.
+    :param step: Time step measured in Julian centuries.
+    :return: First and second differences in radians, each of shape (14, )
+    :rtype: tuple[np.ndarray, np.ndarray]
     """
 
-    # The polynomial is in arcseconds
-    value = (1287104.793048 + 129596581.0481 * time - 0.5532 * time ** 2 +
-             0.0001360 * time ** 3 - 0.00001149 * time ** 4)
+    t = float(time)
+    h = float(step)
 
-    # Take the modulus before convertion to maintain accuracy
-    value = math.fmod(value, 360 * 60 * 60)
+    first = POLYNOMIAL_COEFFICIENTS @ _power_differences(t, h)
+    first_next = POLYNOMIAL_COEFFICIENTS @ _power_differences(t + h, h)
+    second = first_next - first
 
-    value = Conversions.arcsec_to_rad(value)
+    for value in (first, second):
+        value[:N_ARCSECOND_ARGUMENTS] = Conversions.arcsec_to_rad(
+            value[:N_ARCSECOND_ARGUMENTS])
 
-    return value
+    return first, second
 
 
-def mean_longitude_moon_minus_ascending_node(time):
+def fundamental_argument_difference_bounds(t_max, step):
     """
-    This function computes Mean longitude of the Moon minus the ascending node
-    per IERS Conventions (2010).
+    This function bounds the third and fourth forward differences of the 14
+    fundamental arguments for epochs with |t| <= t_max. The arguments are
+    quartic in t, so the fourth difference is constant and the higher ones
+    vanish:
+        (t + h)^3 has a third difference of 6 h^3
+        (t + h)^4 has a third difference of 24 t h^3 + 36 h^4 and a fourth
+        difference of 24 h^4
+
+    :type t_max: float
+    :type step: float
+    :param t_max: Largest magnitude of t in Julian centuries
+    :param step: Time step measured in Julian centuries.
+    :return: Bounds on the magnitudes of the third and fourth differences
+        in radians, each of shape (14, )
+    :rtype: tuple[np.ndarray, np.ndarray]
+    """
+
+    t_max = abs(float(t_max))
+    h = abs(float(step))
+
+    c_3 = np.abs(POLYNOMIAL_COEFFICIENTS[:, 3])
+    c_4 = np.abs(POLYNOMIAL_COEFFICIENTS[:, 4])
+
+    third = (6.0 * c_3 + (24.0 * t_max + 36.0 * h) * c_4) * h ** 3
+    fourth = 24.0 * c_4 * h ** 4
+
+    for value in (third, fourth):
+        value[:N_ARCSECOND_ARGUMENTS] = Conversions.arcsec_to_rad(
+            value[:N_ARCSECOND_ARGUMENTS])
+
+    return third, fourth
+
+
+def _power_differences(t, h):
+    # (t + h)^k - t^k for k = 0 to 4, using
+    # (t + h)^k - t^k = h * sum_j (t + h)^j * t^(k - 1 - j)
+    t_h = t + h
+    differences = np.zeros((POLYNOMIAL_COEFFICIENTS.shape[1], ))
+
+    for k in range(1, len(differences)):
+        differences[k] = h * sum(t_h ** j * t ** (k - 1 - j)
+                                 for j in range(k))
+
+    return differences
+
+
+def mean_anomaly_of_the_moon(time):
+    """
+    This function computes the mean anomaly of the Moon per IERS Conventions
+    (2010)
 
     Note that technically, per IERS Conventions (2010), the input time should
-    be Barycentric Dynamical Time (TDB) but the difference between TDB and TT is
-    already small. Additionally, we do not consider effects outside the
-    Geocentric Celestial Reference System (GCRS) and the primary driver of the
-    TDB vs TT difference is earth's mean anomaly in its orbit. The error from
-    this simplication is less than a microarcsecond in nutation.
+    be Barycentric Dynamical Time (TDB). TDB is available through
+    Conversions.tt_to_tdb, but TT can be used instead: TDB - TT stays below 2
+    milliseconds, and the error from this simplification is less than a
+    microarcsecond in nutation.
+
+    :type time: float | np.ndarray
+    :param time: TT or TDB measured in Julian centuries.
+    :return: Argument in radians
+    """
 
-    :type time: float
-    :param time: Terrestrial time measured in Julian centuries.
-    :return:
+    return _argument(time, 0)
+
+
+def mean_anomaly_of_the_sun(time):
     """
+    This function computes the mean anomaly of the Sun per IERS Conventions
+    (2010)
 
-    # The polynomial is in arcseconds
-    value = (335779.526232 + 1739527262.8478 * time - 12.75120 * time ** 2 -
-             0.001037 * time ** 3 + 0.00000417 * time ** 4)
+    Note that technically, per IERS Conventions (2010), the input time should
+    be Barycentric Dynamical Time (TDB). TDB is available through
+    Conversions.tt_to_tdb, but TT can be used instead: TDB - TT stays below 2
+    milliseconds, and the error from this simplification is less than a
+    microarcsecond in nutation.
+
+    :type time: float | np.ndarray
+    :param time: TT or TDB measured in Julian centuries.
+    :return: Argument in radians
+    """
 
-    # Take the modulus before convertion to maintain accuracy
-    value = math.fmod(value, 360 * 60 * 60)
+    return _argument(time, 1)
 
-    value = Conversions.arcsec_to_rad(value)
 
-    return value
+def mean_longitude_moon_minus_ascending_node(time):
+    """
+    This function computes Mean longitude of the Moon minus the ascending node
+    per IERS Conventions (2010).
+
+    Note that technically, per IERS Conventions (2010), the input time should
+    be Barycentric Dynamical Time (TDB). TDB is available through
+    Conversions.tt_to_tdb, but TT can be used instead: TDB - TT stays below 2
+    milliseconds, and the error from this simplification is less than a
+    microarcsecond in nutation.
+
+    :type time: float | np.ndarray
+    :param time: TT or TDB measured in Julian centuries.
+    :return: Argument in radians
+    """
+
+    return _argument(time, 2)
 
 
 def mean_elongation_of_the_moon_from_the_sun(time):
@@ -101,27 +289,17 @@ def mean_elongation_of_the_moon_from_the_sun(time):
     Conventions (2010).
 
     Note that technically, per IERS Conventions (2010), the input time should
-    be Barycentric Dynamical Time (TDB) but the difference between TDB and TT is
-    already small. Additionally, we do not consider effects outside the
-    Geocentric Celestial Reference System (GCRS) and the primary driver of the
-    TDB vs TT difference is earth's mean anomaly in its orbit. The error from
-    this simplication is less than a microarcsecond in nutation.
-
-    :type time: float
-    :param time: Terrestrial time measured in Julian centuries.
-    :return:
+    be Barycentric Dynamical Time (TDB). TDB is available through
+    Conversions.tt_to_tdb, but TT can be used instead: TDB - TT stays below 2
+    milliseconds, and the error from this simplification is less than a
+    microarcsecond in nutation.
+
+    :type time: float | np.ndarray
+    :param time: TT or TDB measured in Julian centuries.
+    :return: Argument in radians
     """
 
-    # The polynomial is in arcseconds
-    value = (1072260.7036920001 + 1602961601.2090 * time -
-             6.3706 * time ** 2 + 0.006593 * time ** 3 - 0.00003169 * time ** 4)
-
-    # Take the modulus before convertion to maintain accuracy
-    value = math.fmod(value, 360 * 60 * 60)
-
-    value = Conversions.arcsec_to_rad(value)
-
-    return value
+    return _argument(time, 3)
 
 
 def mean_longitude_of_the_ascending_node_of_the_moon(time):
@@ -130,27 +308,17 @@ def mean_longitude_of_the_ascending_node_of_the_moon(time):
     IERS Conventions (2010).
 
     Note that technically, per IERS Conventions (2010), the input time should
-    be Barycentric Dynamical Time (TDB) but the difference between TDB and TT is
-    already small. Additionally, we do not consider effects outside the
-    Geocentric Celestial Reference System (GCRS) and the primary driver of the
-    TDB vs TT difference is earth's mean anomaly in its orbit. The error from
-    this simplication is less than a microarcsecond in nutation.
-
-    :type time: float
-    :param time: Terrestrial time measured in Julian centuries.
-    :return:
+    be Barycentric Dynamical Time (TDB). TDB is available through
+    Conversions.tt_to_tdb, but TT can be used instead: TDB - TT stays below 2
+    milliseconds, and the error from this simplification is less than a
+    microarcsecond in nutation.
+
+    :type time: float | np.ndarray
+    :param time: TT or TDB measured in Julian centuries.
+    :return: Argument in radians
     """
 
-    # The polynomial is in arcseconds
-    value = (450160.39803599997 - 6962890.5431 * time + 7.4722 * time ** 2 +
-             0.0077020 * time ** 3 - 0.00005939 * time ** 4)
-
-    # Take the modulus before convertion to maintain accuracy
-    value = math.fmod(value, 360 * 60 * 60)
-
-    value = Conversions.arcsec_to_rad(value)
-
-    return value
+    return _argument(time, 4)
 
 
 def mean_longitude_of_mercury(time):
@@ -159,24 +327,17 @@ def mean_longitude_of_mercury(time):
     (2010).
 
     Note that technically, per IERS Conventions (2010), the input time should
-    be Barycentric Dynamical Time (TDB) but the difference between TDB and TT is
-    already small. Additionally, we do not consider effects outside the
-    Geocentric Celestial Reference System (GCRS) and the primary driver of the
-    TDB vs TT difference is earth's mean anomaly in its orbit. The error from
-    this simplication is less than a microarcsecond in nutation.
-
-    :type time: float
-    :param time: Terrestrial time measured in Julian centuries.
-    :return:
+    be Barycentric Dynamical Time (TDB). TDB is available through
+    Conversions.tt_to_tdb, but TT can be used instead: TDB - TT stays below 2
+    milliseconds, and the error from this simplification is less than a
+    microarcsecond in nutation.
+
+    :type time: float | np.ndarray
+    :param time: TT or TDB measured in Julian centuries.
+    :return: Argument in radians
     """
 
-    # The polynomial is in radians
-    value = 4.402608842 + 2608.7903141574 * time
-
-    # Take the modulus before convertion to maintain accuracy
-    value = math.fmod(value, 2.0 * math.pi)
-
-    return value
+    return _argument(time, 5)
 
 
 def mean_longitude_of_venus(time):
@@ -185,24 +346,17 @@ def mean_longitude_of_venus(time):
     (2010).
 
     Note that technically, per IERS Conventions (2010), the input time should
-    be Barycentric Dynamical Time (TDB) but the difference between TDB and TT is
-    already small. Additionally, we do not consider effects outside the
-    Geocentric Celestial Reference System (GCRS) and the primary driver of the
-    TDB vs TT difference is earth's mean anomaly in its orbit. The error from
-    this simplication is less than a microarcsecond in nutation.
-
-    :type time: float
-    :param time: Terrestrial time measured in Julian centuries.
-    :return:
+    be Barycentric Dynamical Time (TDB). TDB is available through
+    Conversions.tt_to_tdb, but TT can be used instead: TDB - TT stays below 2
+    milliseconds, and the error from this simplification is less than a
+    microarcsecond in nutation.
+
+    :type time: float | np.ndarray
+    :param time: TT or TDB measured in Julian centuries.
+    :return: Argument in radians
     """
 
-    # The polynomial is in radians
-    value = 3.176146697 + 1021.3285546211 * time
-
-    # Take the modulus before convertion to maintain accuracy
-    value = math.fmod(value, 2.0 * math.pi)
-
-    return value
+    return _argument(time, 6)
 
 
 def mean_longitude_of_earth(time):
@@ -211,24 +365,17 @@ def mean_longitude_of_earth(time):
     (2010).
 
     Note that technically, per IERS Conventions (2010), the input time should
-    be Barycentric Dynamical Time (TDB) but the difference between TDB and TT is
-    already small. Additionally, we do not consider effects outside the
-    Geocentric Celestial Reference System (GCRS) and the primary driver of the
-    TDB vs TT difference is earth's mean anomaly in its orbit. The error from
-    this simplication is less than a microarcsecond in nutation.
-
-    :type time: float
-    :param time: Terrestrial time measured in Julian centuries.
-    :return:
+    be Barycentric Dynamical Time (TDB). TDB is available through
+    Conversions.tt_to_tdb, but TT can be used instead: TDB - TT stays below 2
+    milliseconds, and the error from this simplification is less than a
+    microarcsecond in nutation.
+
+    :type time: float | np.ndarray
+    :param time: TT or TDB measured in Julian centuries.
+    :return: Argument in radians
     """
 
-    # The polynomial is in radians
-    value = 1.753470314 + 628.3075849991 * time
-
-    # Take the modulus before convertion to maintain accuracy
-    value = math.fmod(value, 2.0 * math.pi)
-
-    return value
+    return _argument(time, 7)
 
 
 def mean_longitude_of_mars(time):
@@ -237,24 +384,17 @@ def mean_longitude_of_mars(time):
     (2010).
 
     Note that technically, per IERS Conventions (2010), the input time should
-    be Barycentric Dynamical Time (TDB) but the difference between TDB and TT is
-    already small. Additionally, we do not consider effects outside the
-    Geocentric Celestial Reference System (GCRS) and the primary driver of the
-    TDB vs TT difference is earth's mean anomaly in its orbit. The error from
-    this simplication is less than a microarcsecond in nutation.
-
-    :type time: float
-    :param time: Terrestrial time measured in Julian centuries.
-    :return:
+    be Barycentric Dynamical Time (TDB). TDB is available through
+    Conversions.tt_to_tdb, but TT can be used instead: TDB - TT stays below 2
+    milliseconds, and the error from this simplification is less than a
+    microarcsecond in nutation.
+
+    :type time: float | np.ndarray
+    :param time: TT or TDB measured in Julian centuries.
+    :return: Argument in radians
     """
 
-    # The polynomial is in radians
-    value = 6.203480913 + 334.0612426700 * time
-
-    # Take the modulus before convertion to maintain accuracy
-    value = math.fmod(value, 2.0 * math.pi)
-
-    return value
+    return _argument(time, 8)
 
 
 def mean_longitude_of_jupiter(time):
@@ -263,24 +403,17 @@ def mean_longitude_of_jupiter(time):
     (2010).
 
     Note that technically, per IERS Conventions (2010), the input time should
-    be Barycentric Dynamical Time (TDB) but the difference between TDB and TT is
-    already small. Additionally, we do not consider effects outside the
-    Geocentric Celestial Reference System (GCRS) and the primary driver of the
-    TDB vs TT difference is earth's mean anomaly in its orbit. The error from
-    this simplication is less than a microarcsecond in nutation.
-
-    :type time: float
-    :param time: Terrestrial time measured in Julian centuries.
-    :return:
+    be Barycentric Dynamical Time (TDB). TDB is available through
+    Conversions.tt_to_tdb, but TT can be used instead: TDB - TT stays below 2
+    milliseconds, and the error from this simplification is less than a
+    microarcsecond in nutation.
+
+    :type time: float | np.ndarray
+    :param time: TT or TDB measured in Julian centuries.
+    :return: Argument in radians
     """
 
-    # The polynomial is in radians
-    value = 0.599546497 + 52.9690962641 * time
-
-    # Take the modulus before convertion to maintain accuracy
-    value = math.fmod(value, 2.0 * math.pi)
-
-    return value
+    return _argument(time, 9)
 
 
 def mean_longitude_of_saturn(time):
@@ -289,24 +422,17 @@ def mean_longitude_of_saturn(time):
     (2010).
 
     Note that technically, per IERS Conventions (2010), the input time should
-    be Barycentric Dynamical Time (TDB) but the difference between TDB and TT is
-    already small. Additionally, we do not consider effects outside the
-    Geocentric Celestial Reference System (GCRS) and the primary driver of the
-    TDB vs TT difference is earth's mean anomaly in its orbit. The error from
-    this simplication is less than a microarcsecond in nutation.
-
-    :type time: float
-    :param time: Terrestrial time measured in Julian centuries.
-    :return:
+    be Barycentric Dynamical Time (TDB). TDB is available through
+    Conversions.tt_to_tdb, but TT can be used instead: TDB - TT stays below 2
+    milliseconds, and the error from this simplification is less than a
+    microarcsecond in nutation.
+
+    :type time: float | np.ndarray
+    :param time: TT or TDB measured in Julian centuries.
+    :return: Argument in radians
     """
 
-    # The polynomial is in radians
-    value = 0.874016757 + 21.3299104960 * time
-
-    # Take the modulus before convertion to maintain accuracy
-    value = math.fmod(value, 2.0 * math.pi)
-
-    return value
+    return _argument(time, 10)
 
 
 def mean_longitude_of_uranus(time):
@@ -315,24 +441,17 @@ def mean_longitude_of_uranus(time):
     (2010).
 
     Note that technically, per IERS Conventions (2010), the input time should
-    be Barycentric Dynamical Time (TDB) but the difference between TDB and TT is
-    already small. Additionally, we do not consider effects outside the
-    Geocentric Celestial Reference System (GCRS) and the primary driver of the
-    TDB vs TT difference is earth's mean anomaly in its orbit. The error from
-    this simplication is less than a microarcsecond in nutation.
-
-    :type time: float
-    :param time: Terrestrial time measured in Julian centuries.
-    :return:
+    be Barycentric Dynamical Time (TDB). TDB is available through
+    Conversions.tt_to_tdb, but TT can be used instead: TDB - TT stays below 2
+    milliseconds, and the error from this simplification is less than a
+    microarcsecond in nutation.
+
+    :type time: float | np.ndarray
+    :param time: TT or TDB measured in Julian centuries.
+    :return: Argument in radians
     """
 
-    # The polynomial is in radians
-    value = 5.481293872 + 7.4781598567 * time
-
-    # Take the modulus before convertion to maintain accuracy
-    value = math.fmod(value, 2.0 * math.pi)
-
-    return value
+    return _argument(time, 11)
 
 
 def mean_longitude_of_neptune(time):
@@ -341,24 +460,17 @@ def mean_longitude_of_neptune(time):
     (2010).
 
     Note that technically, per IERS Conventions (2010), the input time should
-    be Barycentric Dynamical Time (TDB) but the difference between TDB and TT is
-    already small. Additionally, we do not consider effects outside the
-    Geocentric Celestial Reference System (GCRS) and the primary driver of the
-    TDB vs TT difference is earth's mean anomaly in its orbit. The error from
-    this simplication is less than a microarcsecond in nutation.
-
-    :type time: float
-    :param time: Terrestrial time measured in Julian centuries.
-    :return:
+    be Barycentric Dynamical Time (TDB). TDB is available through
+    Conversions.tt_to_tdb, but TT can be used instead: TDB - TT stays below 2
+    milliseconds, and the error from this simplification is less than a
+    microarcsecond in nutation.
+
+    :type time: float | np.ndarray
+    :param time: TT or TDB measured in Julian centuries.
+    :return: Argument in radians
     """
 
-    # The polynomial is in radians
-    value = 5.311886287 + 3.8133035638 * time
-
-    # Take the modulus before convertion to maintain accuracy
-    value = math.fmod(value, 2.0 * math.pi)
-
-    return value
+    return _argument(time, 12)
 
 
 def general_precession_in_longitude(time):
@@ -367,18 +479,14 @@ def general_precession_in_longitude(time):
     Conventions (2010).
 
     Note that technically, per IERS Conventions (2010), the input time should
-    be Barycentric Dynamical Time (TDB) but the difference between TDB and TT is
-    already small. Additionally, we do not consider effects outside the
-    Geocentric Celestial Reference System (GCRS) and the primary driver of the
-    TDB vs TT difference is earth's mean anomaly in its orbit. The error from
-    this simplication is less than a microarcsecond in nutation.
-
-    :type time: float
-    :param time: Terrestrial time measured in Julian centuries.
-    :return:
+    be Barycentric Dynamical Time (TDB). TDB is available through
+    Conversions.tt_to_tdb, but TT can be used instead: TDB - TT stays below 2
+    milliseconds, and the error from this simplification is less than a
+    microarcsecond in nutation.
+
+    :type time: float | np.ndarray
+    :param time: TT or TDB measured in Julian centuries.
+    :return: Argument in radians
     """
 
-    # The polynomial is in radians
-    value = 0.02438175 * time + 0.00000538691 * time ** 2
-
-    return value
+    return _argument(time, 13)
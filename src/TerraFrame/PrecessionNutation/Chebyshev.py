@@ -0,0 +1,377 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import math
+
+import numpy as np
+from numpy.polynomial import chebyshev
+
+from TerraFrame.PrecessionNutation import Arguments, SeriesExpansion
+from TerraFrame.Utilities import Conversions
+
+# Version of the file layout written by ChebyshevCipXys.save
+FILE_FORMAT_VERSION = 2
+
+# Bernstein ellipse parameters tried when bounding the error of a segment.
+# The smallest bound is used.
+ELLIPSE_PARAMETERS = 1.0 + np.geomspace(1e-3, 1e2, 64)
+
+
+class ChebyshevCipXys:
+    """
+    This class is a piecewise Chebyshev representation of the Celestial
+    Intermediate Pole (CIP) coordinates X and Y and the Celestial
+    Intermediate Origin (CIO) locator s over a fixed range of terrestrial
+    time (TT).
+
+    Segments are fitted by interpolating the full IAU 2006/2000A series at
+    Chebyshev nodes and are bisected until a bound on their error is below
+    the requested tolerance. The series is analytic, so the error of a
+    degree n interpolant is at most 4 M rho^-n / (rho - 1), where M bounds
+    the series on the Bernstein ellipse with parameter rho around the
+    segment (Trefethen, Approximation Theory and Approximation Practice,
+    Theorem 8.2). M follows from the amplitudes of the terms and the
+    polynomials of their arguments. An allowance for rounding in the
+    Chebyshev evaluation is added. Once fitted, a query costs a segment
+    lookup and a few dozen multiply-adds.
+
+    The coefficients are stored in radians. Time is measured in Julian
+    centuries of TT since J2000.
+    """
+
+    def __init__(self, boundaries, coefficients, tolerance, error_bound,
+                 max_error):
+        """
+        :param boundaries: Segment boundaries, shape (n + 1, )
+        :param coefficients: Chebyshev coefficients, shape (n, 3, degree + 1)
+        :param tolerance: Requested maximum error in radians
+        :param error_bound: Largest bound on the error of a segment in
+            radians
+        :param max_error: Largest error seen while checking the fit
+        :type boundaries: np.ndarray
+        :type coefficients: np.ndarray
+        :type tolerance: float
+        :type error_bound: float
+        :type max_error: float
+        """
+
+        self.boundaries = np.asarray(boundaries, dtype=np.float64)
+        self.coefficients = np.asarray(coefficients, dtype=np.float64)
+        self.tolerance = float(tolerance)
+        self.error_bound = float(error_bound)
+        self.max_error = float(max_error)
+
+        if (self.coefficients.ndim != 3 or self.coefficients.shape[1] != 3 or
+                self.coefficients.shape[0] != len(self.boundaries) - 1):
+            raise ValueError('The Chebyshev coefficients do not match the '
+                             'segment boundaries.')
+
+    def __len__(self):
+        return self.coefficients.shape[0]
+
+    @property
+    def degree(self):
+        return self.coefficients.shape[2] - 1
+
+    @property
+    def t_start(self):
+        return float(self.boundaries[0])
+
+    @property
+    def t_end(self):
+        return float(self.boundaries[-1])
+
+    @classmethod
+    def fit(cls, t_start, t_end, tolerance=Conversions.muas_to_rad(1.0),
+            degree=16, se_cip_xys=None, check_factor=4,
+            min_segment_length=1e-7):
+        """
+        This function fits a piecewise Chebyshev representation of X, Y, and
+        s over [t_start, t_end]. The error relative to se_cip_xys is
+        guaranteed to be below tolerance. The fit is also compared with the
+        series on a check grid, and the largest error seen is reported as
+        max_error.
+
+        :param t_start: Start of the range in Julian centuries TT
+        :param t_end: End of the range in Julian centuries TT
+        :param tolerance: Maximum allowed error in radians. Defaults to 1
+            microarcsecond.
+        :param degree: Degree of the Chebyshev polynomial in each segment
+        :param se_cip_xys: Series to fit. Defaults to the full IAU
+            2006/2000A series.
+        :param check_factor: The error in each segment is checked at
+            check_factor * (degree + 1) points.
+        :param min_segment_length: Segments are never bisected below this
+            length in Julian centuries.
+        :return: Fitted representation
+        :type t_start: float
+        :type t_end: float
+        :type tolerance: float
+        :type degree: int
+        :type se_cip_xys: SeriesExpansion.CipXys | None
+        :type check_factor: int
+        :type min_segment_length: float
+        :rtype: ChebyshevCipXys
+        """
+
+        t_start = float(t_start)
+        t_end = float(t_end)
+
+        if not t_end > t_start:
+            raise ValueError('The end of the fit range must be after the '
+                             'start.')
+
+        if se_cip_xys is None:
+            se_cip_xys = SeriesExpansion.cip_xys()
+
+        magnitudes = [_series_magnitudes(x) for x in (
+            se_cip_xys.se_cip_x, se_cip_xys.se_cip_y,
+            se_cip_xys.se_cip_sxy2)]
+
+        # Chebyshev nodes of the first kind and the error check grid, both on
+        # the [-1, 1] reference interval. The check grid includes the ends.
+        nodes = np.cos(np.pi * (np.arange(degree + 1) + 0.5) / (degree + 1))
+        checks = np.linspace(-1.0, 1.0, check_factor * (degree + 1))
+        vandermonde = chebyshev.chebvander(nodes, degree)
+
+        pending = [(t_start, t_end)]
+        accepted = []
+
+        while len(pending) > 0:
+            segments = np.array(pending)
+            mid = 0.5 * (segments[:, 0] + segments[:, 1])
+            half = 0.5 * (segments[:, 1] - segments[:, 0])
+
+            # Evaluate every pending segment in one batch
+            t_nodes = mid[:, np.newaxis] + half[:, np.newaxis] * nodes
+            t_checks = mid[:, np.newaxis] + half[:, np.newaxis] * checks
+
+            values = np.stack(se_cip_xys.compute_many(t_nodes), axis=-1)
+            truth = np.stack(se_cip_xys.compute_many(t_checks), axis=-1)
+
+            # Shape (segments, 3, degree + 1)
+            coefficients = np.linalg.solve(vandermonde, values).transpose(
+                (0, 2, 1))
+            coefficients = np.ascontiguousarray(coefficients)
+
+            approx = _clenshaw(coefficients[:, np.newaxis, :, :],
+                               checks[np.newaxis, :, np.newaxis])
+            errors = np.max(np.abs(approx - truth), axis=(1, 2))
+
+            # Clenshaw's recurrence is backward stable, so its rounding
+            # error is a small multiple of the unit roundoff times the sum
+            # of the absolute coefficients
+            rounding = np.max(4.0 * (degree + 1) * np.finfo(np.float64).eps *
+                              np.sum(np.abs(coefficients), axis=-1), axis=-1)
+
+            pending = []
+
+            for i, (a, b) in enumerate(segments):
+                # The bound is at least the error seen on the check grid,
+                # so it's only computed for segments that pass the check
+                if errors[i] <= tolerance:
+                    bound = rounding[i] + _interpolation_error_bound(
+                        magnitudes, mid[i], half[i], degree)
+                else:
+                    bound = np.inf
+
+                if bound <= tolerance:
+                    accepted.append((a, b, coefficients[i], bound,
+                                     errors[i]))
+                elif b - a < 2.0 * min_segment_length:
+                    raise RuntimeError(f'Unable to meet a tolerance of '
+                                       f'{tolerance} rad with degree {degree} '
+                                       f'Chebyshev segments.')
+                else:
+                    pending.append((a, 0.5 * (a + b)))
+                    pending.append((0.5 * (a + b), b))
+
+        accepted.sort(key=lambda x: x[0])
+
+        boundaries = np.array([x[0] for x in accepted] + [accepted[-1][1], ])
+        coefficients = np.array([x[2] for x in accepted])
+        error_bound = max(x[3] for x in accepted)
+        max_error = max(x[4] for x in accepted)
+
+        return cls(boundaries, coefficients, tolerance, error_bound,
+                   max_error)
+
+    def compute(self, t):
+        """
+        This function computes X, Y, and s at a single epoch.
+
+        :param t: Terrestrial time measured in Julian centuries
+        :return: X, Y, and s in radians
+        :type t: float | JulianBase
+        :rtype: tuple[float, float, float]
+        """
+
+        t = float(t)
+
+        if not self.boundaries[0] <= t <= self.boundaries[-1]:
+            raise ValueError('The requested time is outside the range of '
+                             'the Chebyshev fit.')
+
+        index = int(np.searchsorted(self.boundaries, t, side='right')) - 1
+        index = min(max(index, 0), len(self) - 1)
+
+        a = float(self.boundaries[index])
+        b = float(self.boundaries[index + 1])
+        x = (2.0 * t - (a + b)) / (b - a)
+
+        # Plain floats are much faster than NumPy for a single epoch
+        values = [_clenshaw_scalar(c, x)
+                  for c in self.coefficients[index].tolist()]
+
+        return values[0], values[1], values[2]
+
+    def compute_many(self, t):
+        """
+        This function computes X, Y, and s at many epochs at once.
+
+        :param t: Terrestrial time measured in Julian centuries
+        :return: X, Y, and s in radians, each with the same shape as t
+        :type t: float | np.ndarray
+        :rtype: tuple[np.ndarray, np.ndarray, np.ndarray]
+        """
+
+        t = np.asarray(t, dtype=np.float64)
+
+        if np.any(t < self.boundaries[0]) or np.any(t > self.boundaries[-1]):
+            raise ValueError('The requested time is outside the range of '
+                             'the Chebyshev fit.')
+
+        index = np.searchsorted(self.boundaries, t, side='right') - 1
+        index = np.clip(index, 0, len(self) - 1)
+
+        a = self.boundaries[index]
+        b = self.boundaries[index + 1]
+        x = (2.0 * t - (a + b)) / (b - a)
+
+        values = _clenshaw(self.coefficients[index], x[..., np.newaxis])
+
+        return values[..., 0], values[..., 1], values[..., 2]
+
+    def save(self, file):
+        """
+        This function saves the fitted coefficients to a .npz file.
+
+        :param file: File name or open file
+        :type file: str | os.PathLike | IO[bytes]
+        """
+
+        np.savez(file, version=FILE_FORMAT_VERSION,
+                 boundaries=self.boundaries, coefficients=self.coefficients,
+                 tolerance=self.tolerance, error_bound=self.error_bound,
+                 max_error=self.max_error)
+
+    @classmethod
+    def load(cls, file):
+        """
+        This function loads coefficients written by save.
+
+        :param file: File name or open file
+        :type file: str | os.PathLike | IO[bytes]
+        :return: Fitted representation
+        :rtype: ChebyshevCipXys
+        """
+
+        with np.load(file, allow_pickle=False) as f:
+            if int(f['version']) != FILE_FORMAT_VERSION:
+                raise ValueError(f'Unsupported Chebyshev file version: '
+                                 f'{int(f["version"])}')
+
+            return cls(f['boundaries'], f['coefficients'],
+                       float(f['tolerance']), float(f['error_bound']),
+                       float(f['max_error']))
+
+
+def _series_magnitudes(coordinate):
+    # Absolute coefficients of the polynomial of each term argument in
+    # radians, absolute amplitudes and powers of t of the terms, and absolute
+    # coefficients of the polynomial part, in the units of the series
+    coefficients = Arguments.POLYNOMIAL_COEFFICIENTS.copy()
+    n = Arguments.N_ARCSECOND_ARGUMENTS
+    coefficients[:n] = Conversions.arcsec_to_rad(coefficients[:n])
+
+    arguments = np.abs(coordinate._multipliers.astype(np.float64) @
+                       coefficients)
+    amplitudes = (np.abs(coordinate._sin_amplitudes) +
+                  np.abs(coordinate._cos_amplitudes))
+
+    return (arguments, amplitudes, coordinate._powers,
+            np.abs(np.asarray(coordinate._polynomial_coefficients)))
+
+
+def _max_modulus(magnitudes, t_max, imaginary_max):
+    # Bound on the modulus of a series, in radians, at complex t with
+    # |t| <= t_max and |Im(t)| <= imaginary_max. At t = u + iv the imaginary
+    # part of a term argument is the sum of the odd terms of its Taylor
+    # series around u, and |sin(a + ib)| and |cos(a + ib)| are at most
+    # cosh(b).
+    arguments, amplitudes, powers, polynomial = magnitudes
+    degree = arguments.shape[1] - 1
+
+    # Weight of the coefficient of t^k in the bound on the imaginary part,
+    # for each ellipse
+    weights = np.zeros((degree + 1, len(t_max)))
+
+    for k in range(1, degree + 1):
+        for order in range(1, k + 1, 2):
+            weights[k] += (math.perm(k, order) * t_max ** (k - order) *
+                           imaginary_max ** order / math.factorial(order))
+
+    imaginary = arguments @ weights
+
+    terms = (amplitudes @ (t_max[np.newaxis, :] ** powers[:, np.newaxis] *
+                           np.cosh(imaginary)))
+
+    return Conversions.muas_to_rad(
+        terms + SeriesExpansion.horner(polynomial, t_max))
+
+
+def _interpolation_error_bound(magnitudes, mid, half, degree):
+    # Bound on the error of the degree n interpolant at Chebyshev nodes of
+    # the first kind on [mid - half, mid + half]. The Bernstein ellipse with
+    # parameter rho maps to the points with |t - mid| <= half * (rho +
+    # 1 / rho) / 2 and |Im(t)| <= half * (rho - 1 / rho) / 2.
+    rho = ELLIPSE_PARAMETERS
+
+    t_max = abs(mid) + half * (rho + 1.0 / rho) / 2.0
+    imaginary_max = half * (rho - 1.0 / rho) / 2.0
+
+    # Large ellipses overflow cosh. Their bounds are infinite and unused.
+    with np.errstate(over='ignore', invalid='ignore'):
+        m_x, m_y, m_sxy2 = [_max_modulus(x, t_max, imaginary_max)
+                            for x in magnitudes]
+
+        # s = (s + XY/2) - XY/2
+        m = np.maximum(np.maximum(m_x, m_y), m_sxy2 + m_x * m_y / 2.0)
+
+        bounds = 4.0 * m * rho ** -float(degree) / (rho - 1.0)
+
+    return float(np.nanmin(bounds))
+
+
+def _clenshaw(coefficients, x):
+    # Evaluates Chebyshev series with Clenshaw's recurrence. The last axis
+    # of coefficients holds the series coefficients and x must broadcast
+    # against the remaining axes.
+    b1 = 0.0
+    b2 = 0.0
+
+    for k in range(coefficients.shape[-1] - 1, 0, -1):
+        b1, b2 = coefficients[..., k] + 2.0 * x * b1 - b2, b1
+
+    return coefficients[..., 0] + x * b1 - b2
+
+
+def _clenshaw_scalar(coefficients, x):
+    b1 = 0.0
+    b2 = 0.0
+
+    for k in range(len(coefficients) - 1, 0, -1):
+        b1, b2 = coefficients[k] + 2.0 * x * b1 - b2, b1
+
+    return coefficients[0] + x * b1 - b2
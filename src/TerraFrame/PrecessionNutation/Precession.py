@@ -0,0 +1,143 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import math
+
+import numpy as np
+
+from TerraFrame.PrecessionNutation import SeriesExpansion
+from TerraFrame.Utilities import Conversions, TransformationMatrices
+
+# Polynomial coefficients, lowest power first, in arcseconds and Julian
+# centuries TT. See Hilton et al. (2006) and Capitaine et al. (2005).
+
+# Mean obliquity of the ecliptic, IAU 2006
+MEAN_OBLIQUITY_COEFFICIENTS = (84381.406, -46.836769, -0.0001831, 0.00200340,
+                               -0.000000576, -0.0000000434)
+
+# Fukushima-Williams bias-precession angles gamma_bar, phi_bar, and psi_bar
+GAMMA_BAR_COEFFICIENTS = (-0.052928, 10.556378, 0.4932044, -0.00031238,
+                          -0.000002788, 0.0000000260)
+PHI_BAR_COEFFICIENTS = (84381.412819, -46.811016, 0.0511268, 0.00053289,
+                        -0.000000440, -0.0000000176)
+PSI_BAR_COEFFICIENTS = (-0.041775, 5038.481484, 1.5584175, -0.00018522,
+                        -0.000026452, -0.0000000148)
+
+# Greenwich mean sidereal time minus the Earth rotation angle, IAU 2006
+GMST_COEFFICIENTS = (0.014506, 4612.156534, 1.3915817, -0.00000044,
+                     -0.000029956, -0.0000000368)
+
+# Greenwich mean sidereal time at 0h UT1, IAU 1982, in seconds of time and
+# Julian centuries UT1. The constant is shifted by 12 hours because Julian
+# dates start at noon.
+GMST_1982_COEFFICIENTS = (24110.54841 - 43200.0, 8640184.812866, 0.093104,
+                          -6.2e-6)
+
+# Radians per second of time
+SECOND_OF_TIME_TO_RAD = 2.0 * math.pi / 86400.0
+
+
+def mean_obliquity(t):
+    """
+    This function computes the mean obliquity of the ecliptic, IAU 2006.
+
+    :param t: Terrestrial time measured in Julian centuries
+    :return: Mean obliquity in radians
+    :type t: float | np.ndarray
+    :rtype: float | np.ndarray
+    """
+
+    return Conversions.arcsec_to_rad(
+        SeriesExpansion.horner(MEAN_OBLIQUITY_COEFFICIENTS, t))
+
+
+def precession_angles(t):
+    """
+    This function computes the four Fukushima-Williams angles of the IAU
+    2006 precession, including the frame bias.
+
+    :param t: Terrestrial time measured in Julian centuries
+    :return: gamma_bar, phi_bar, psi_bar, and the mean obliquity epsilon_A
+        in radians
+    :type t: float | np.ndarray
+    :rtype: tuple[float | np.ndarray, ...]
+    """
+
+    gamma_bar, phi_bar, psi_bar = (
+        Conversions.arcsec_to_rad(SeriesExpansion.horner(c, t))
+        for c in (GAMMA_BAR_COEFFICIENTS, PHI_BAR_COEFFICIENTS,
+                  PSI_BAR_COEFFICIENTS))
+
+    return gamma_bar, phi_bar, psi_bar, mean_obliquity(t)
+
+
+def fukushima_williams_matrix(gamma, phi, psi, epsilon):
+    """
+    This function forms the rotation matrix from the Fukushima-Williams
+    angles: R1(-epsilon) R3(-psi) R1(phi) R3(gamma). With the precession
+    angles it is the GCRS to mean of date matrix. Adding the nutation to psi
+    and epsilon gives the GCRS to true of date matrix.
+
+    :param gamma: F-W angle gamma_bar in radians
+    :param phi: F-W angle phi_bar in radians
+    :param psi: F-W angle psi in radians
+    :param epsilon: F-W angle epsilon in radians
+    :return: Rotation matrices, shape gamma.shape + (3, 3)
+    :type gamma: float | np.ndarray
+    :type phi: float | np.ndarray
+    :type psi: float | np.ndarray
+    :type epsilon: float | np.ndarray
+    :rtype: np.ndarray
+    """
+
+    return (TransformationMatrices.rotation_stack(1, -epsilon) @
+            TransformationMatrices.rotation_stack(3, -psi) @
+            TransformationMatrices.rotation_stack(1, phi) @
+            TransformationMatrices.rotation_stack(3, gamma))
+
+
+def greenwich_mean_sidereal_time(t, era):
+    """
+    This function computes the Greenwich mean sidereal time, IAU 2006, from
+    the Earth rotation angle.
+
+    :param t: Terrestrial time measured in Julian centuries
+    :param era: Earth rotation angle in radians
+    :return: Greenwich mean sidereal time in radians, in [0, 2 pi)
+    :type t: float | np.ndarray
+    :type era: float | np.ndarray
+    :rtype: float | np.ndarray
+    """
+
+    gmst = era + Conversions.arcsec_to_rad(
+        SeriesExpansion.horner(GMST_COEFFICIENTS, t))
+
+    return np.mod(gmst, 2.0 * math.pi)
+
+
+def greenwich_mean_sidereal_time_1982(jd_ut1, jd_ut1_fraction=0.0):
+    """
+    This function computes the Greenwich mean sidereal time, IAU 1982. This
+    is the sidereal time that defines the TEME frame used by SGP4.
+
+    :param jd_ut1: Julian date in UT1, or its integer part
+    :param jd_ut1_fraction: Fraction part of the Julian date
+    :return: Greenwich mean sidereal time in radians, in [0, 2 pi)
+    :type jd_ut1: float | np.ndarray
+    :type jd_ut1_fraction: float | np.ndarray
+    :rtype: np.ndarray
+    """
+
+    jd_ut1 = np.asarray(jd_ut1, dtype=np.float64)
+    jd_ut1_fraction = np.asarray(jd_ut1_fraction, dtype=np.float64)
+
+    t = ((jd_ut1 - 2451545.0) + jd_ut1_fraction) / 36525.0
+
+    # The polynomial gives GMST at 0h UT1, so the time of day is added
+    seconds = 86400.0 * (np.fmod(jd_ut1, 1.0) + np.fmod(jd_ut1_fraction, 1.0))
+
+    gmst = SECOND_OF_TIME_TO_RAD * (
+        SeriesExpansion.horner(GMST_1982_COEFFICIENTS, t) + seconds)
+
+    return np.mod(gmst, 2.0 * math.pi)
@@ -2,15 +2,99 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
+import math
 import re
+import threading
+import timeit
 from abc import ABC, abstractmethod
+from enum import Enum
 
 import numpy as np
 
 from TerraFrame.PrecessionNutation import Arguments
-from TerraFrame.Utilities import Conversions
+from TerraFrame.Utilities import Conversions, DataCache, Kernels
+from TerraFrame.Utilities.TableRegistry import TableRegistry
 from importlib import resources
 
+# Upper bound on the number of (epoch, term) values evaluated at once by the
+# batch routines. Each chunk holds a few arrays of this size.
+MAX_CHUNK_ELEMENTS = 2 ** 18
+
+# Default time span, in Julian centuries TT, over which truncated series are
+# guaranteed to meet their accuracy target: the years 1900 to 2100.
+DEFAULT_TIME_SPAN = (-1.0, 1.0)
+
+# Default number of steps between re-anchors to the exact series in
+# CipXys.iter_steps
+DEFAULT_REANCHOR_INTERVAL = 1000
+
+# Default shortest period, in days, of the terms that MultiRateCipXys
+# interpolates instead of summing exactly
+DEFAULT_PERIOD_THRESHOLD = 30.0
+
+# Default bound, in radians, on the interpolation error of MultiRateCipXys
+DEFAULT_MULTI_RATE_TOLERANCE = Conversions.muas_to_rad(0.1)
+
+# Number of days in a Julian century
+DAYS_PER_CENTURY = 36525.0
+
+# Factors applied to the IAU 2000A nutation for consistency with the IAU 2006
+# precession: the secular change of J2, per Julian century, and the change
+# of the precession rate. See Wallace & Capitaine (2006), equation 5.
+J2_RATE_FACTOR = -2.7774e-6
+PRECESSION_RATE_FACTOR = 0.4697e-6
+
+# Record layout of a parsed series table. The argument multipliers are small
+# integers, so they're stored as int8.
+TABLE_DTYPE = np.dtype([('power', np.int8),
+                        ('sin_amplitude', np.float64),
+                        ('cos_amplitude', np.float64),
+                        ('multipliers', np.int8, (14, ))])
+
+
+class Accuracy(Enum):
+    """
+    Accuracy tiers for the precession-nutation series. The value of each
+    tier is the worst-case error, in microarcseconds, of each truncated
+    series (X, Y, and s + XY/2) relative to the full IAU 2006/2000A series
+    over the requested time span.
+
+    Terms are dropped in order of their largest amplitude over the time
+    span, smallest first, for as long as the sum of the dropped amplitudes
+    stays within the tier's error. The sum is a strict bound on the
+    truncation error. The error in s is additionally affected through the
+    XY/2 product, but X and Y are below 0.02 rad for the default time span
+    so that contribution is below 2% of the tier's error.
+
+    Approximate number of terms kept for X, Y, and s + XY/2 over the default
+    time span:
+        FULL: 1600, 1275, 66
+        MICROARCSECOND: 1589, 1265, 58
+        MILLIARCSECOND: 311, 258, 1
+        ARCSECOND: 2, 2, 0
+    """
+    FULL = 0.0
+    MICROARCSECOND = 1.0
+    MILLIARCSECOND = 1e3
+    ARCSECOND = 1e6
+
+
+class EvaluationStrategy(Enum):
+    """
+    Strategies for evaluating the sin and cos of every term argument.
+
+    DIRECT: Each term's argument is formed with a matrix product and passed
+        to sin and cos.
+    RECURRENCE: sin and cos are evaluated only for the 14 fundamental
+        arguments. The integer multiples needed by the table are built with
+        the angle-addition recurrence on complex phasors, and each term's
+        phasor is the product of the phasors of its multiples.
+
+    Use compare_strategies to time the strategies on the current machine.
+    """
+    DIRECT = 1
+    RECURRENCE = 2
+
 
 class SeriesExpansion(ABC):
     def __init__(self, data_file_path):
@@ -18,29 +102,89 @@ class SeriesExpansion(ABC):
         self.data = []
 
         self._parse_file()
+        self._init_terms()
 
     def _parse_file(self):
-        with open(self.data_file_path, 'r') as f:
-            file_content = f.readlines()
+        # The parsed table is cached in binary form so that the text only
+        # needs to be parsed again when it changes. Within a process, every
+        # series built from the same file shares one read-only copy.
+        self.data = TableRegistry.get(
+            ('series_table', str(self.data_file_path)),
+            lambda: DataCache.load_array(self.data_file_path,
+                                         self._parse_text))
+
+    @staticmethod
+    def _parse_text(text):
+        # Each table row is: i, a_s, a_c, and the 14 argument multipliers.
+        # The power of t, j, comes from the section headers.
+        rows = []
+
+        j = -1
+
+        for line in text.splitlines():
+            # Search for a header line that set's the j value
+            result = re.search(r'j\s*=\s*(\d+)\s+Number of terms',
+                               line.strip(), re.IGNORECASE)
+
+            if result:
+                j = int(result.group(1))
+
+            if j >= 0 and len(line.strip()) > 0:
+                try:
+                    values = [float(x) for x in line.split()]
+                except ValueError:
+                    continue
+
+                rows.append((j, values[1], values[2], values[3:]))
 
-            j = -1
+        data = np.array(rows, dtype=TABLE_DTYPE)
 
-            for line in file_content:
-                # Search for a header line that set's the j value
-                result = re.search(r'j\s*=\s*(\d+)\s+Number of terms',
-                                   line.strip(), re.IGNORECASE)
+        # Terms that only use the five luni-solar arguments form one
+        # contiguous block at the start, and each block is grouped by the
+        # power of t. The sort is stable, so the table order is kept within
+        # a group.
+        planetary = np.any(
+            data['multipliers'][:, Arguments.N_ARCSECOND_ARGUMENTS:] != 0,
+            axis=1)
+        order = np.lexsort((data['power'], planetary))
 
-                if result:
-                    j = int(result.group(1))
+        return data[order]
 
-                if j >= 0 and len(line.strip()) > 0:
-                    try:
-                        self.data.append([j, ] + [float(x)
-                                                  for x in line.split()])
-                    except ValueError:
-                        pass
+    def _truncate(self, max_error, time_span):
+        # Drop the terms with the smallest maximum amplitude over the time
+        # span while the sum of the dropped amplitudes stays within
+        # max_error (micro-arcseconds).
+        t_max = max(abs(float(time_span[0])), abs(float(time_span[1])))
 
-            self.data = np.array(self.data )
+        amplitudes = (np.hypot(self._sin_amplitudes, self._cos_amplitudes) *
+                      t_max ** self._powers)
+
+        order = np.argsort(amplitudes, kind='stable')
+        dropped_sums = np.cumsum(amplitudes[order])
+        n_dropped = int(np.searchsorted(dropped_sums, max_error,
+                                        side='right'))
+
+        keep = np.sort(order[n_dropped:])
+
+        self.data = self.data[keep]
+        self._init_terms()
+
+        if n_dropped > 0:
+            return float(dropped_sums[n_dropped - 1])
+        else:
+            return 0.0
+
+    def _init_terms(self):
+        # Views of the table columns, so nothing is copied. See TABLE_DTYPE
+        # for the record layout.
+        self._powers = self.data['power']
+        self._sin_amplitudes = self.data['sin_amplitude']
+        self._cos_amplitudes = self.data['cos_amplitude']
+        self._multipliers = self.data['multipliers']
+        self._n_powers = int(self._powers.max(initial=-1)) + 1
+
+    def __len__(self):
+        return len(self._powers)
 
     @abstractmethod
     def compute(self, t):
@@ -48,69 +192,1354 @@ class SeriesExpansion(ABC):
 
 
 class CipCoordinate(SeriesExpansion):
-    def __init__(self, data_file_path, polynomial_coefficients):
+    def __init__(self, data_file_path, polynomial_coefficients,
+                 accuracy=Accuracy.FULL, time_span=DEFAULT_TIME_SPAN,
+                 strategy=EvaluationStrategy.DIRECT):
+        """
+        :param data_file_path: Path to the IERS series table
+        :param polynomial_coefficients: Coefficients of the polynomial part
+            in microarcseconds, lowest power first
+        :param accuracy: Accuracy tier or maximum truncation error in
+            microarcseconds
+        :param time_span: Range of Julian centuries TT over which the
+            accuracy target must hold
+        :param strategy: Strategy used to evaluate the trigonometric terms
+        :type data_file_path: Path | importlib.resources.abc.Traversable
+        :type polynomial_coefficients: Sequence[float]
+        :type accuracy: Accuracy | float
+        :type time_span: tuple[float, float]
+        :type strategy: EvaluationStrategy
+        """
+
         super().__init__(data_file_path)
         self._polynomial_coefficients = polynomial_coefficients
 
+        if isinstance(accuracy, Accuracy):
+            accuracy = accuracy.value
+
+        # Bound on the truncation error in radians
+        self.truncation_error_bound = 0.0
+
+        if accuracy > 0.0:
+            self.truncation_error_bound = Conversions.muas_to_rad(
+                self._truncate(accuracy, time_span))
+
+        self.strategy = strategy
+        self._term_engine = None
+        self._engine_lock = threading.Lock()
+
+    @property
+    def _engine(self):
+        # The engine is only built when the series is evaluated on its own.
+        # Series that are only evaluated through a FusedSeries never need
+        # one.
+        engine = self._term_engine
+
+        if engine is None:
+            with self._engine_lock:
+                if self._term_engine is None:
+                    weights = PowerWeights(np.arange(len(self)), self._powers,
+                                           self._sin_amplitudes,
+                                           self._cos_amplitudes,
+                                           self._n_powers)
+                    engine = term_engine(self.strategy, self._multipliers,
+                                         weights)
+
+                    # The series may be a shared registry entry
+                    TableRegistry.make_read_only(engine)
+                    self._term_engine = engine
+
+                engine = self._term_engine
+
+        return engine
+
     def compute(self, t):
         t = float(t)
 
+        arguments = fundamental_arguments(t)
+
+        total = self._evaluate(t, arguments)
+
+        total = Conversions.muas_to_rad(total)
+
+        return total
+
+    def compute_with_rate(self, t):
+        """
+        This function computes the series and its time derivative at a
+        single epoch. The derivative comes from the same sin and cos
+        evaluations as the value.
+
+        :param t: Terrestrial time measured in Julian centuries
+        :return: Value in radians and rate in radians per Julian century
+        :type t: float | JulianBase
+        :rtype: tuple[float, float]
+        """
+
+        t = float(t)
+
+        power_sums, rate_sums = self._engine.power_sums_and_rates(
+            fundamental_arguments(t), Arguments.fundamental_argument_rates(t))
+
         # units are micro-arcseconds
-        poly_part = 0.0
+        value, rate = _series_value_and_rate(self._polynomial_coefficients,
+                                             power_sums, rate_sums, t)
 
-        for j in range(len(self._polynomial_coefficients)):
-            poly_part += self._polynomial_coefficients[j] * t ** j
+        return Conversions.muas_to_rad(value), Conversions.muas_to_rad(rate)
 
-        # Initialize all the argument parameters. "argument" is the term that
-        # IERS uses to refer to the input to the trigonometric functions. The
-        # order is tightly coupled with the file format.
-        arguments = np.zeros((14, ))
+    def compute_many(self, t, chunk_size=None):
+        """
+        This function evaluates the series at many epochs at once. The
+        (epochs x terms) work is split into chunks so that memory use stays
+        bounded for any number of epochs.
 
-        arguments[0] = Arguments.mean_anomaly_of_the_moon(t) # l
-        arguments[1] = Arguments.mean_anomaly_of_the_sun(t) # l'
-        arguments[2] = Arguments.mean_longitude_moon_minus_ascending_node(t) # F
-        arguments[3] = Arguments.mean_elongation_of_the_moon_from_the_sun(t) # D
-        arguments[4] = (
-            Arguments.mean_longitude_of_the_ascending_node_of_the_moon(t)) # Ω
-        arguments[5] = Arguments.mean_longitude_of_mercury(t) # L_Me
-        arguments[6] = Arguments.mean_longitude_of_venus(t) # L_Ve
-        arguments[7] = Arguments.mean_longitude_of_earth(t) # L_E
-        arguments[8] = Arguments.mean_longitude_of_mars(t) # L_Ma
-        arguments[9] = Arguments.mean_longitude_of_jupiter(t) # L_J
-        arguments[10] = Arguments.mean_longitude_of_saturn(t) # L_Sa
-        arguments[11] = Arguments.mean_longitude_of_uranus(t) # L_U
-        arguments[12] = Arguments.mean_longitude_of_neptune(t) # L_Ne
-        arguments[13] = Arguments.general_precession_in_longitude(t) # p_A
+        :param t: Terrestrial time measured in Julian centuries
+        :param chunk_size: Number of epochs per chunk. Defaults to a size
+            based on the number of terms in the series.
+        :return: Series values in radians with the same shape as t
+        :type t: float | np.ndarray
+        :type chunk_size: int | None
+        :rtype: np.ndarray
+        """
 
-        non_poly_part = 0.0
+        t = np.asarray(t, dtype=np.float64)
+        t_flat = t.reshape(-1)
+        values = np.empty(t_flat.shape)
 
-        for row in self.data:
-            j = row[0]
-            a_s = row[2]
-            a_c = row[3]
+        for start, stop in chunk_bounds(len(t_flat), len(self), chunk_size):
+            t_chunk = t_flat[start:stop]
+            arguments = fundamental_arguments(t_chunk)
 
-            arg = np.linalg.vecdot(row[4:], arguments)
+            values[start:stop] = self._evaluate(t_chunk, arguments)
 
-            non_poly_part += (a_s * np.sin(arg) + a_c * np.cos(arg)) * t ** j
+        values = Conversions.muas_to_rad(values)
 
-        total = poly_part + non_poly_part
+        return values.reshape(t.shape)
 
-        total = Conversions.muas_to_rad(total)
+    def _evaluate(self, t, arguments):
+        # The argument array is either (14, ) for a single epoch or (n, 14)
+        # for n epochs.
+        power_sums = self._engine.power_sums(arguments)
 
-        return total
+        # units are micro-arcseconds
+        poly_part = horner(self._polynomial_coefficients, t)
+        non_poly_part = horner(power_sums.T, t)
+
+        return poly_part + non_poly_part
+
+
+class FusedSeries:
+    """
+    This class evaluates several series tables together. The fundamental
+    arguments are computed once per epoch and argument combinations that
+    appear in more than one table share a single sin and cos evaluation.
+    """
+
+    def __init__(self, series, strategy=EvaluationStrategy.DIRECT):
+        """
+        :param series: Series to evaluate together
+        :param strategy: Strategy used to evaluate the trigonometric terms
+        :type series: Sequence[CipCoordinate]
+        :type strategy: EvaluationStrategy
+        """
+
+        self._coordinates = tuple(series)
+
+        multipliers = np.concatenate([c._multipliers
+                                      for c in self._coordinates])
+
+        # Each row of the fused table is a unique argument combination.
+        # The luni-solar-only combinations are moved to the front so that
+        # they form one contiguous block, as in the individual tables.
+        unique_multipliers, inverse = np.unique(multipliers, axis=0,
+                                                return_inverse=True)
+
+        planetary = np.any(
+            unique_multipliers[:, Arguments.N_ARCSECOND_ARGUMENTS:] != 0,
+            axis=1)
+        order = np.argsort(planetary, kind='stable')
+
+        self._multipliers = np.ascontiguousarray(unique_multipliers[order])
+
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(order))
+        inverse = rank[inverse.reshape(-1)]
+
+        # The power sums of all the series are laid out side by side.
+        # Series k owns the columns offsets[k] to offsets[k + 1].
+        self._power_offsets = np.cumsum(
+            [0, ] + [c._n_powers for c in self._coordinates])
+
+        columns = np.concatenate(
+            [offset + c._powers.astype(np.intp)
+             for c, offset in zip(self._coordinates, self._power_offsets)])
+
+        self._weights = PowerWeights(
+            inverse, columns,
+            np.concatenate([c._sin_amplitudes for c in self._coordinates]),
+            np.concatenate([c._cos_amplitudes for c in self._coordinates]),
+            int(self._power_offsets[-1]))
+
+        self.strategy = strategy
+        self._engine = term_engine(strategy, self._multipliers, self._weights)
+
+    def __len__(self):
+        return len(self._multipliers)
+
+    def _series_values(self, t, power_sums):
+        # Put the power index first so that each series' block of columns
+        # can be passed straight to Horner's method.
+        power_sums = power_sums.T
+
+        values = []
+
+        for k, coordinate in enumerate(self._coordinates):
+            block = power_sums[self._power_offsets[k]:
+                               self._power_offsets[k + 1]]
+
+            # units are micro-arcseconds
+            value = (horner(coordinate._polynomial_coefficients, t) +
+                     horner(block, t))
+
+            values.append(Conversions.muas_to_rad(value))
+
+        return values
+
+
+class CipXys(FusedSeries):
+    """
+    This class evaluates the X and Y coordinates of the Celestial
+    Intermediate Pole (CIP) and the Celestial Intermediate Origin (CIO)
+    locator s together. s is computed from the tabulated s + XY/2 series.
+
+    The three series are fused: the fundamental arguments are computed once
+    per epoch and argument combinations that appear in more than one table
+    share a single sin and cos evaluation.
+    """
+
+    def __init__(self, x, y, sxy2, strategy=EvaluationStrategy.DIRECT):
+        self.se_cip_x = x
+        self.se_cip_y = y
+        self.se_cip_sxy2 = sxy2
+
+        super().__init__((x, y, sxy2), strategy)
+
+    def compute(self, t):
+        """
+        This function computes X, Y, and s at a single epoch.
+
+        :param t: Terrestrial time measured in Julian centuries
+        :return: X, Y, and s in radians
+        :type t: float | JulianBase
+        :rtype: tuple[float, float, float]
+        """
+
+        t = float(t)
+
+        arguments = fundamental_arguments(t)
+
+        return self._evaluate(t, arguments)
+
+    def compute_with_rates(self, t):
+        """
+        This function computes X, Y, and s and their time derivatives at a
+        single epoch. The derivatives come from the same sin and cos
+        evaluations as the values, so they add only a few matrix products.
+
+        :param t: Terrestrial time measured in Julian centuries
+        :return: X, Y, and s in radians and their rates in radians per
+            Julian century
+        :type t: float | JulianBase
+        :rtype: tuple[tuple[float, float, float], tuple[float, float, float]]
+        """
+
+        t = float(t)
+
+        power_sums, rate_sums = self._engine.power_sums_and_rates(
+            fundamental_arguments(t), Arguments.fundamental_argument_rates(t))
+
+        values = []
+        rates = []
+
+        for k, coordinate in enumerate(self._coordinates):
+            columns = slice(self._power_offsets[k], self._power_offsets[k + 1])
+
+            # units are micro-arcseconds
+            value, rate = _series_value_and_rate(
+                coordinate._polynomial_coefficients, power_sums[columns],
+                rate_sums[columns], t)
+
+            values.append(Conversions.muas_to_rad(value))
+            rates.append(Conversions.muas_to_rad(rate))
+
+        cip_x, cip_y, sxy2 = values
+        cip_x_rate, cip_y_rate, sxy2_rate = rates
+
+        cip_s = sxy2 - cip_x * cip_y / 2.0
+        cip_s_rate = sxy2_rate - (cip_x_rate * cip_y + cip_x * cip_y_rate) / 2.0
+
+        return (cip_x, cip_y, cip_s), (cip_x_rate, cip_y_rate, cip_s_rate)
+
+    def compute_many(self, t, chunk_size=None):
+        """
+        This function computes X, Y, and s at many epochs at once. See
+        CipCoordinate.compute_many for the chunking behavior.
+
+        :param t: Terrestrial time measured in Julian centuries
+        :param chunk_size: Number of epochs per chunk
+        :return: X, Y, and s in radians, each with the same shape as t
+        :type t: float | np.ndarray
+        :type chunk_size: int | None
+        :rtype: tuple[np.ndarray, np.ndarray, np.ndarray]
+        """
+
+        t = np.asarray(t, dtype=np.float64)
+        t_flat = t.reshape(-1)
+        values = np.empty((3, len(t_flat)))
+
+        for start, stop in chunk_bounds(len(t_flat), len(self), chunk_size):
+            t_chunk = t_flat[start:stop]
+            arguments = fundamental_arguments(t_chunk)
+
+            values[:, start:stop] = self._evaluate(t_chunk, arguments)
+
+        cip_x, cip_y, cip_s = (v.reshape(t.shape) for v in values)
+
+        return cip_x, cip_y, cip_s
+
+    def iter_steps(self, t0, dt, n,
+                   reanchor_interval=DEFAULT_REANCHOR_INTERVAL):
+        """
+        This generator computes X, Y, and s at the uniformly spaced epochs
+        t0 + k * dt for k = 0 to n - 1.
+
+        Instead of evaluating sin and cos for every term at every step, the
+        complex phasor exp(i * ARG) of each term is advanced by
+        multiplication. The phasor is advanced with a rotation that is
+        itself advanced with the second difference of the argument at the
+        last anchor. The arguments are quartic in t, so the second
+        difference isn't constant: the phase error grows as k^3 in the
+        number of steps k since the anchor, on top of the rounding drift.
+        Every reanchor_interval steps the phasors are recomputed from the
+        exact series, so that both errors stay below
+        step_drift_bound(dt, reanchor_interval).
+
+        The cost per step is a few multiply-adds per term and no
+        trigonometric functions.
+
+        :param t0: First epoch in Julian centuries TT
+        :param dt: Time step in Julian centuries
+        :param n: Number of steps
+        :param reanchor_interval: Number of steps between re-anchors to the
+            exact series
+        :return: Generator of X, Y, and s in radians
+        :type t0: float | JulianBase
+        :type dt: float
+        :type n: int
+        :type reanchor_interval: int
+        :rtype: Iterator[tuple[float, float, float]]
+        """
+
+        if reanchor_interval < 1:
+            raise ValueError('The re-anchor interval must be a positive '
+                             'integer.')
+
+        t0 = float(t0)
+        dt = float(dt)
+
+        phasors = None
+        rotations = None
+        accelerations = None
+
+        for k in range(n):
+            t = t0 + k * dt
+
+            if k % reanchor_interval == 0:
+                term_arguments = self._multipliers @ fundamental_arguments(t)
+                phasors = np.cos(term_arguments) + 1j * np.sin(term_arguments)
+
+                first, second = Arguments.fundamental_argument_differences(
+                    t, dt)
+                first = self._multipliers @ first
+                second = self._multipliers @ second
+
+                rotations = np.cos(first) + 1j * np.sin(first)
+                accelerations = np.cos(second) + 1j * np.sin(second)
+            else:
+                phasors *= rotations
+                rotations *= accelerations
+
+            power_sums = self._weights.power_sums(phasors.imag, phasors.real)
+
+            cip_x, cip_y, cip_s = self._combine(t, power_sums)
+
+            yield float(cip_x), float(cip_y), float(cip_s)
+
+    def step_drift_bound(self, dt, reanchor_interval=DEFAULT_REANCHOR_INTERVAL,
+                         t_max=1.0):
+        """
+        This function returns a bound on the error of iter_steps relative to
+        the exact series.
+
+        Rounding: a complex multiplication has a relative error of at most
+        sqrt(5) unit roundoffs and the initial phasors carry at most two.
+        After k steps the rotations have been multiplied k times and the
+        phasors accumulate the rotation errors, so the relative error of
+        each phasor grows as k^2 / 2.
+
+        Truncation: the rotations follow the first and second differences
+        of the arguments at the anchor. By Newton's forward formula, the
+        phase after k steps is then off by C(k, 3) times the third
+        difference plus C(k, 4) times the fourth difference of the term
+        argument, and a phasor is off by at most its phase error.
+
+        Each phasor error is scaled by the amplitudes of its term.
+
+        :param dt: Time step in Julian centuries
+        :param reanchor_interval: Number of steps between re-anchors
+        :param t_max: Largest magnitude of t in Julian centuries
+        :return: Bounds on the X, Y, and s errors in radians
+        :type dt: float
+        :type reanchor_interval: int
+        :type t_max: float
+        :rtype: tuple[float, float, float]
+        """
+
+        unit_roundoff = np.finfo(np.float64).eps / 2.0
+        gamma = math.sqrt(5.0) * unit_roundoff
+        initial = 2.0 * unit_roundoff
+
+        k = reanchor_interval - 1
+        relative = initial + (initial + gamma) * (k + k * (k - 1) / 2.0)
+
+        third, fourth = Arguments.fundamental_argument_difference_bounds(
+            t_max, dt)
+        multipliers = np.abs(self._multipliers)
+        phase_errors = (math.comb(k, 3) * (multipliers @ third) +
+                        math.comb(k, 4) * (multipliers @ fourth))
+
+        # Largest error of each power of t
+        weights = self._weights
+        amplitudes = weights.column_sums(
+            (relative + phase_errors[weights.rows]) *
+            (np.abs(weights.sin_values) + np.abs(weights.cos_values)))
+
+        bounds = []
+
+        for k in range(len(self._coordinates)):
+            block = amplitudes[self._power_offsets[k]:
+                               self._power_offsets[k + 1]]
+            bound = horner(block, abs(float(t_max)))
+
+            bounds.append(Conversions.muas_to_rad(bound))
+
+        bound_x, bound_y, bound_sxy2 = bounds
+
+        # |X| and |Y| are far below one radian
+        bound_s = bound_sxy2 + (bound_x + bound_y) / 2.0
+
+        return bound_x, bound_y, bound_s
+
+    def _evaluate(self, t, arguments):
+        power_sums = self._engine.power_sums(arguments)
+
+        return self._combine(t, power_sums)
+
+    def _combine(self, t, power_sums):
+        values = self._series_values(t, power_sums)
+
+        cip_x, cip_y, sxy2 = values
+        cip_s = sxy2 - cip_x * cip_y / 2.0
+
+        return cip_x, cip_y, cip_s
+
+
+class EquinoxNutation(FusedSeries):
+    """
+    This class evaluates the nutation in longitude and obliquity (Delta psi
+    and Delta epsilon) of the IAU 2000A model with the IAU 2006 adjustments
+    of Wallace & Capitaine (2006), together with the complementary terms of
+    the equation of the equinoxes. These are the series needed for the
+    classical, equinox-based transformations.
+
+    The three series are fused in the same way as in CipXys.
+    """
+
+    def __init__(self, longitude, obliquity, complementary_terms,
+                 strategy=EvaluationStrategy.DIRECT):
+        self.se_longitude = longitude
+        self.se_obliquity = obliquity
+        self.se_complementary_terms = complementary_terms
+
+        super().__init__((longitude, obliquity, complementary_terms),
+                         strategy)
+
+    def compute(self, t):
+        """
+        This function computes the nutation and the complementary terms of
+        the equation of the equinoxes at a single epoch.
+
+        :param t: Terrestrial time measured in Julian centuries
+        :return: Delta psi, Delta epsilon, and the complementary terms in
+            radians
+        :type t: float | JulianBase
+        :rtype: tuple[float, float, float]
+        """
+
+        t = float(t)
+
+        arguments = fundamental_arguments(t)
+
+        return self._evaluate(t, arguments)
+
+    def compute_many(self, t, chunk_size=None):
+        """
+        This function computes the nutation and the complementary terms of
+        the equation of the equinoxes at many epochs at once. See
+        CipCoordinate.compute_many for the chunking behavior.
+
+        :param t: Terrestrial time measured in Julian centuries
+        :param chunk_size: Number of epochs per chunk
+        :return: Delta psi, Delta epsilon, and the complementary terms in
+            radians, each with the same shape as t
+        :type t: float | np.ndarray
+        :type chunk_size: int | None
+        :rtype: tuple[np.ndarray, np.ndarray, np.ndarray]
+        """
+
+        t = np.asarray(t, dtype=np.float64)
+        t_flat = t.reshape(-1)
+        values = np.empty((3, len(t_flat)))
+
+        for start, stop in chunk_bounds(len(t_flat), len(self), chunk_size):
+            t_chunk = t_flat[start:stop]
+            arguments = fundamental_arguments(t_chunk)
+
+            values[:, start:stop] = self._evaluate(t_chunk, arguments)
+
+        d_psi, d_epsilon, complementary_terms = (v.reshape(t.shape)
+                                                 for v in values)
+
+        return d_psi, d_epsilon, complementary_terms
+
+    def _evaluate(self, t, arguments):
+        power_sums = self._engine.power_sums(arguments)
+
+        d_psi, d_epsilon, complementary_terms = self._series_values(
+            t, power_sums)
+
+        # IAU 2006 adjustments for the secular change of J2 and the
+        # precession rate. See Wallace & Capitaine (2006), equation 5.
+        j2_factor = J2_RATE_FACTOR * t
+
+        d_psi = d_psi * (1.0 + PRECESSION_RATE_FACTOR + j2_factor)
+        d_epsilon = d_epsilon * (1.0 + j2_factor)
+
+        return d_psi, d_epsilon, complementary_terms
+
+
+class MultiRateCipXys:
+    """
+    This class evaluates X, Y, and s with the series terms split by
+    frequency. Most terms have periods of months to decades, so their sums
+    barely change between queries that are seconds or hours apart.
+
+    Terms whose shortest period over the time span is at least
+    period_threshold days form the long-period group. The power sums of
+    that group are evaluated on a uniform grid of nodes and interpolated
+    with a cubic Lagrange polynomial through the four nearest nodes. Only
+    the short-period terms are summed exactly at each query. compute keeps
+    the last four node values, so consecutive queries within a node
+    interval only pay for the short-period terms. The split only pays off
+    for clustered epochs; widely scattered epochs each need their own nodes
+    and are better served by CipXys directly.
+
+    The node spacing h is chosen so that the interpolation error stays below
+    the tolerance. For cubic interpolation in the middle of four equally
+    spaced nodes the error is at most (9 / 16) h^4 / 24 times the largest
+    fourth derivative. The fourth derivative of a term A sin(ARG) is bounded
+    with Faà di Bruno's formula from the derivatives of its argument
+    polynomial over the time span.
+    """
+
+    def __init__(self, se_cip_xys, period_threshold=DEFAULT_PERIOD_THRESHOLD,
+                 tolerance=DEFAULT_MULTI_RATE_TOLERANCE,
+                 time_span=DEFAULT_TIME_SPAN):
+        """
+        :param se_cip_xys: Fused series to evaluate
+        :param period_threshold: Shortest period, in days, of the terms that
+            are interpolated
+        :param tolerance: Bound on the interpolation error of X, Y, and
+            s + XY/2 in radians
+        :param time_span: Range of Julian centuries TT over which the error
+            bound must hold
+        :type se_cip_xys: CipXys
+        :type period_threshold: float
+        :type tolerance: float
+        :type time_span: tuple[float, float]
+        """
+
+        if not tolerance > 0.0:
+            raise ValueError('The tolerance must be positive.')
+
+        self.se_cip_xys = se_cip_xys
+        self.period_threshold = float(period_threshold)
+        self.tolerance = float(tolerance)
+
+        t_max = max(abs(float(time_span[0])), abs(float(time_span[1])))
+
+        rates, fourth_derivatives = _argument_derivative_bounds(
+            se_cip_xys._multipliers, t_max)
+
+        with np.errstate(divide='ignore'):
+            periods = 2.0 * np.pi / rates * DAYS_PER_CENTURY
+
+        long_period = periods >= self.period_threshold
+        short_period = ~long_period
+
+        multipliers = se_cip_xys._multipliers
+        long_weights = se_cip_xys._weights.select(long_period)
+
+        self.n_long_period = int(np.count_nonzero(long_period))
+
+        self._long_engine = term_engine(se_cip_xys.strategy,
+                                        multipliers[long_period],
+                                        long_weights)
+        self._short_engine = term_engine(
+            se_cip_xys.strategy, multipliers[short_period],
+            se_cip_xys._weights.select(short_period))
 
+        # Bound on the fourth derivative of each power sum, then of each
+        # coordinate, in micro-arcseconds per century^4
+        derivative_sums = long_weights.column_sums(
+            fourth_derivatives[long_period][long_weights.rows] *
+            np.hypot(long_weights.sin_values, long_weights.cos_values))
+        offsets = se_cip_xys._power_offsets
 
-def cip_x(file_name=r'tab5.2a.txt'):
+        coordinate_bounds = [
+            horner(derivative_sums[offsets[k]:offsets[k + 1]], t_max)
+            for k in range(len(offsets) - 1)]
+
+        factor = 9.0 / 16.0 / 24.0
+        worst = max(coordinate_bounds)
+        tolerance_muas = self.tolerance / Conversions.muas_to_rad(1.0)
+
+        if worst > 0.0:
+            h = (tolerance_muas / (factor * worst)) ** 0.25
+        else:
+            h = 1.0
+
+        # Spacing between interpolation nodes in Julian centuries
+        self.node_spacing = min(h, 1.0)
+
+        bound_x, bound_y, bound_sxy2 = (
+            Conversions.muas_to_rad(factor * self.node_spacing ** 4 * x)
+            for x in coordinate_bounds)
+
+        # Bounds on the X, Y, and s errors in radians. |X| and |Y| are far
+        # below one radian.
+        self.error_bound = (bound_x, bound_y,
+                            bound_sxy2 + (bound_x + bound_y) / 2.0)
+
+        self._window = None
+
+    def compute(self, t):
+        """
+        This function computes X, Y, and s at a single epoch.
+
+        :param t: Terrestrial time measured in Julian centuries
+        :return: X, Y, and s in radians
+        :type t: float | JulianBase
+        :rtype: tuple[float, float, float]
+        """
+
+        t = float(t)
+        h = self.node_spacing
+
+        u = t / h
+        k = math.floor(u)
+
+        # The window is replaced as a whole so concurrent callers never see
+        # a partially updated one.
+        window = self._window
+
+        if window is None or window[0] != k:
+            nodes = (k + np.arange(-1, 3)) * h
+            window = (k, self._long_engine.power_sums(
+                fundamental_arguments(nodes)))
+            self._window = window
+
+        power_sums = (_cubic_lagrange_weights(u - k) @ window[1] +
+                      self._short_engine.power_sums(fundamental_arguments(t)))
+
+        return self.se_cip_xys._combine(t, power_sums)
+
+    def compute_many(self, t, chunk_size=None):
+        """
+        This function computes X, Y, and s at many epochs at once. See
+        CipCoordinate.compute_many for the chunking behavior.
+
+        :param t: Terrestrial time measured in Julian centuries
+        :param chunk_size: Number of epochs per chunk
+        :return: X, Y, and s in radians, each with the same shape as t
+        :type t: float | np.ndarray
+        :type chunk_size: int | None
+        :rtype: tuple[np.ndarray, np.ndarray, np.ndarray]
+        """
+
+        t = np.asarray(t, dtype=np.float64)
+        t_flat = t.reshape(-1)
+        values = np.empty((3, len(t_flat)))
+        h = self.node_spacing
+
+        for start, stop in chunk_bounds(len(t_flat), len(self.se_cip_xys),
+                                        chunk_size):
+            t_chunk = t_flat[start:stop]
+
+            u = t_chunk / h
+            k = np.floor(u)
+
+            # Every node is evaluated once per chunk, however many epochs
+            # share it. Densely spaced epochs use a contiguous node range,
+            # which avoids sorting.
+            k_min = k.min()
+            n_nodes = int(k.max() - k_min) + 4
+
+            if n_nodes <= 4 * len(t_chunk):
+                nodes = k_min - 1.0 + np.arange(n_nodes)
+                index = ((k - k_min).astype(np.intp)[:, np.newaxis] +
+                         np.arange(4))
+            else:
+                nodes, index = np.unique(
+                    k[:, np.newaxis] + np.arange(-1.0, 3.0),
+                    return_inverse=True)
+                index = index.reshape(-1, 4)
+
+            node_sums = self._long_engine.power_sums(
+                fundamental_arguments(nodes * h))[index]
+
+            weights = _cubic_lagrange_weights(u - k)
+
+            power_sums = (np.einsum('ij,ijk->ik', weights, node_sums) +
+                          self._short_engine.power_sums(
+                              fundamental_arguments(t_chunk)))
+
+            values[:, start:stop] = self.se_cip_xys._combine(t_chunk,
+                                                             power_sums)
+
+        cip_x, cip_y, cip_s = (v.reshape(t.shape) for v in values)
+
+        return cip_x, cip_y, cip_s
+
+
+class PowerWeights:
+    """
+    This class holds the amplitudes of a series table grouped by the power
+    of t they multiply. Entry i adds
+        sin_values[i] * sin(ARG) + cos_values[i] * cos(ARG)
+    of term rows[i] to its power sum. The entries of power sum p are
+    offsets[p] to offsets[p + 1].
+
+    A term contributes to one power of t, or to a few in a fused table, so
+    unlike dense (terms x powers) weight matrices no zeros are stored.
+    """
+
+    def __init__(self, rows, columns, sin_values, cos_values, n_powers):
+        """
+        :param rows: Term of each entry
+        :param columns: Power sum of each entry
+        :param sin_values: Sine amplitude of each entry
+        :param cos_values: Cosine amplitude of each entry
+        :param n_powers: Number of power sums
+        :type rows: np.ndarray
+        :type columns: np.ndarray
+        :type sin_values: np.ndarray
+        :type cos_values: np.ndarray
+        :type n_powers: int
+        """
+
+        columns = np.asarray(columns, dtype=np.intp)
+        order = np.argsort(columns, kind='stable')
+
+        self.n_powers = int(n_powers)
+        self.rows = np.asarray(rows, dtype=np.intp)[order]
+        self.sin_values = np.asarray(sin_values, dtype=np.float64)[order]
+        self.cos_values = np.asarray(cos_values, dtype=np.float64)[order]
+
+        self.offsets = np.zeros(self.n_powers + 1, dtype=np.intp)
+        self.offsets[1:] = np.cumsum(np.bincount(columns,
+                                                 minlength=self.n_powers))
+
+        # np.add.reduceat can't produce empty sums, so only the power sums
+        # with entries are reduced
+        self._filled = self.offsets[:-1] < self.offsets[1:]
+        self._starts = self.offsets[:-1][self._filled]
+
+    def __len__(self):
+        return len(self.rows)
+
+    def power_sums(self, sin, cos):
+        """
+        :param sin: sin(ARG) of every term, shape (terms, ) or (n, terms)
+        :param cos: cos(ARG) of every term, same shape
+        :return: Power sums, shape (powers, ) or (n, powers)
+        :type sin: np.ndarray
+        :type cos: np.ndarray
+        :rtype: np.ndarray
+        """
+
+        return self.column_sums(sin[..., self.rows] * self.sin_values +
+                                cos[..., self.rows] * self.cos_values)
+
+    def column_sums(self, values):
+        """
+        This function sums per-entry values over the entries of each power
+        sum.
+
+        :param values: Values of the entries, shape (entries, ) or
+            (n, entries)
+        :return: Sums, shape (powers, ) or (n, powers)
+        :type values: np.ndarray
+        :rtype: np.ndarray
+        """
+
+        sums = np.zeros(values.shape[:-1] + (self.n_powers, ))
+
+        if len(self._starts) > 0:
+            sums[..., self._filled] = np.add.reduceat(values, self._starts,
+                                                      axis=-1)
+
+        return sums
+
+    def columns(self):
+        """
+        :return: Power sum of each entry
+        :rtype: np.ndarray
+        """
+
+        return np.repeat(np.arange(self.n_powers), np.diff(self.offsets))
+
+    def select(self, terms):
+        """
+        This function keeps the entries of some of the terms.
+
+        :param terms: True for each term to keep
+        :return: Weights of the kept terms, numbered in their original order
+        :type terms: np.ndarray
+        :rtype: PowerWeights
+        """
+
+        terms = np.asarray(terms, dtype=bool)
+        keep = terms[self.rows]
+        numbers = np.cumsum(terms) - 1
+
+        return PowerWeights(numbers[self.rows[keep]], self.columns()[keep],
+                            self.sin_values[keep], self.cos_values[keep],
+                            self.n_powers)
+
+    def reorder(self, order):
+        """
+        :param order: New order of the terms. Term i of the result is term
+            order[i] of these weights.
+        :return: Weights of the reordered terms
+        :type order: np.ndarray
+        :rtype: PowerWeights
+        """
+
+        rank = np.empty(len(order), dtype=np.intp)
+        rank[order] = np.arange(len(order))
+
+        return PowerWeights(rank[self.rows], self.columns(), self.sin_values,
+                            self.cos_values, self.n_powers)
+
+
+class DirectTrigonometry:
+    """
+    This class evaluates the power sums of a series table by forming every
+    term argument with one matrix product and calling sin and cos on them.
+
+    The power sums are the sums of a_s * sin(ARG) + a_c * cos(ARG) over the
+    terms of each power of t. See PowerWeights for the layout of the
+    amplitudes.
+
+    Terms whose arguments only involve the five luni-solar arguments are
+    expected to lead the table. Their arguments are formed from those five
+    columns only, which skips the nine planetary columns for most terms.
+    The multipliers are kept as int8 and converted to float64 in the matrix
+    products.
+    """
+
+    def __init__(self, multipliers, weights):
+        n = Arguments.N_ARCSECOND_ARGUMENTS
+
+        self._multipliers = np.ascontiguousarray(multipliers, dtype=np.int8)
+
+        planetary = np.any(self._multipliers[:, n:] != 0, axis=1)
+        self._n_luni_solar = int(np.argmax(np.append(planetary, True)))
+
+        self._weights = weights
+
+    def power_sums(self, arguments):
+        """
+        :param arguments: Fundamental arguments, shape (14, ) or (n, 14)
+        :return: Power sums, shape (powers, ) or (n, powers)
+        :type arguments: np.ndarray
+        :rtype: np.ndarray
+        """
+
+        if Kernels.use_compiled():
+            return Kernels.power_sums(arguments, self._multipliers,
+                                      self._weights)
+
+        term_arguments = self._term_arguments(arguments)
+
+        return self._weights.power_sums(np.sin(term_arguments),
+                                        np.cos(term_arguments))
+
+    def power_sums_and_rates(self, arguments, argument_rates):
+        """
+        This function computes the power sums and their time derivatives
+        from the same sin and cos evaluations. With the compiled kernels the
+        power sums come from the same kernel as power_sums, so they match it
+        exactly.
+
+        :param arguments: Fundamental arguments, shape (14, ) or (n, 14)
+        :param argument_rates: Fundamental argument rates, same shape
+        :return: Power sums and their rates, each of shape (powers, ) or
+            (n, powers)
+        :type arguments: np.ndarray
+        :type argument_rates: np.ndarray
+        :rtype: tuple[np.ndarray, np.ndarray]
+        """
+
+        term_arguments = self._term_arguments(arguments)
+        term_rates = self._term_arguments(argument_rates)
+
+        sin = np.sin(term_arguments)
+        cos = np.cos(term_arguments)
+
+        if Kernels.use_compiled():
+            power_sums = Kernels.power_sums(arguments, self._multipliers,
+                                            self._weights)
+        else:
+            power_sums = self._weights.power_sums(sin, cos)
+
+        rate_sums = self._weights.power_sums(term_rates * cos,
+                                             -term_rates * sin)
+
+        return power_sums, rate_sums
+
+    def _term_arguments(self, arguments):
+        n = Arguments.N_ARCSECOND_ARGUMENTS
+        n_luni_solar = self._n_luni_solar
+
+        return np.concatenate(
+            (arguments[..., :n] @ self._multipliers[:n_luni_solar, :n].T,
+             arguments @ self._multipliers[n_luni_solar:].T), axis=-1)
+
+
+class HarmonicRecurrence:
+    """
+    This class evaluates the power sums of a series table without calling
+    sin and cos per term. See DirectTrigonometry for the definition of the
+    power sums.
+
+    exp(i * a_k) is computed once for each fundamental argument a_k and the
+    integer multiples exp(i * m * a_k) are built with the angle-addition
+    recurrence exp(i * m * a_k) = exp(i * (m - 1) * a_k) * exp(i * a_k).
+    Negative multiples are complex conjugates. The phasor of a term is then
+    the product of the phasors of its non-zero multipliers.
+
+    Terms are reordered by their number of non-zero multipliers, most
+    first, so that the k-th factor of every term that has one is applied
+    to a contiguous block of terms.
+    """
+
+    def __init__(self, multipliers, weights):
+        multipliers = np.asarray(multipliers, dtype=np.int8)
+
+        self._max_multiple = int(np.max(np.abs(multipliers), initial=0))
+        width = 2 * self._max_multiple + 1
+
+        n_factors = np.count_nonzero(multipliers, axis=1)
+        order = np.argsort(-n_factors, kind='stable')
+
+        multipliers = multipliers[order]
+        n_factors = n_factors[order]
+
+        self._multipliers = np.ascontiguousarray(multipliers)
+        self._weights = weights.reorder(order)
+
+        # Factor f of every term is an index into the flattened (14 x width)
+        # phasor table. Terms without any factor use the entry for m = 0,
+        # which is exactly one.
+        n_max = max(1, int(np.max(n_factors, initial=0)))
+        indices = np.full((n_max, len(multipliers)), self._max_multiple,
+                          dtype=np.intp)
+
+        for row in range(len(multipliers)):
+            for f, k in enumerate(np.nonzero(multipliers[row])[0]):
+                indices[f, row] = (k * width + self._max_multiple +
+                                   int(multipliers[row, k]))
+
+        # The first factor covers every term, later factors only cover the
+        # leading terms that have that many factors.
+        self._factor_indices = [indices[0], ] + [
+            indices[f, :np.count_nonzero(n_factors > f)]
+            for f in range(1, n_max)]
+
+    def power_sums(self, arguments):
+        """
+        :param arguments: Fundamental arguments, shape (14, ) or (n, 14)
+        :return: Power sums, shape (powers, ) or (n, powers)
+        :type arguments: np.ndarray
+        :rtype: np.ndarray
+        """
+
+        terms = self._term_phasors(arguments)
+
+        return self._weights.power_sums(terms.imag, terms.real)
+
+    def power_sums_and_rates(self, arguments, argument_rates):
+        """
+        See DirectTrigonometry.power_sums_and_rates.
+
+        :param arguments: Fundamental arguments, shape (14, ) or (n, 14)
+        :param argument_rates: Fundamental argument rates, same shape
+        :return: Power sums and their rates, each of shape (powers, ) or
+            (n, powers)
+        :type arguments: np.ndarray
+        :type argument_rates: np.ndarray
+        :rtype: tuple[np.ndarray, np.ndarray]
+        """
+
+        terms = self._term_phasors(arguments)
+        term_rates = argument_rates @ self._multipliers.T
+
+        power_sums = self._weights.power_sums(terms.imag, terms.real)
+        rate_sums = self._weights.power_sums(term_rates * terms.real,
+                                             -term_rates * terms.imag)
+
+        return power_sums, rate_sums
+
+    def _term_phasors(self, arguments):
+        # exp(i * ARG) of every term, shape (terms, ) or (n, terms)
+        k_max = self._max_multiple
+
+        phasors = np.empty(arguments.shape + (2 * k_max + 1, ),
+                           dtype=np.complex128)
+        phasors[..., k_max] = 1.0
+
+        if k_max > 0:
+            phasors[..., k_max + 1] = np.cos(arguments) + 1j * np.sin(
+                arguments)
+
+        for m in range(2, k_max + 1):
+            phasors[..., k_max + m] = (phasors[..., k_max + m - 1] *
+                                       phasors[..., k_max + 1])
+
+        phasors[..., :k_max] = np.conj(phasors[..., :k_max:-1])
+
+        table = phasors.reshape(arguments.shape[:-1] + (-1, ))
+
+        terms = table[..., self._factor_indices[0]]
+
+        for indices in self._factor_indices[1:]:
+            terms[..., :len(indices)] *= table[..., indices]
+
+        return terms
+
+
+def term_engine(strategy, multipliers, weights):
+    """
+    This function creates the object that evaluates the power sums of a
+    series table with the given strategy.
+
+    :param strategy: Evaluation strategy
+    :param multipliers: Argument multipliers, shape (terms, 14)
+    :param weights: Amplitudes of the terms
+    :return: Power sum evaluator
+    :type strategy: EvaluationStrategy
+    :type multipliers: np.ndarray
+    :type weights: PowerWeights
+    :rtype: DirectTrigonometry | HarmonicRecurrence
+    """
+
+    match strategy:
+        case EvaluationStrategy.DIRECT:
+            return DirectTrigonometry(multipliers, weights)
+        case EvaluationStrategy.RECURRENCE:
+            return HarmonicRecurrence(multipliers, weights)
+        case _:
+            raise ValueError(f'Unsupported evaluation strategy: {strategy}')
+
+
+def compare_strategies(t, number=10, accuracy=Accuracy.FULL):
+    """
+    This function benchmarks the evaluation strategies against each other on
+    the fused X, Y, and s series. Each strategy evaluates all of t per run.
+
+    :param t: Terrestrial time measured in Julian centuries
+    :param number: Number of timed runs per strategy
+    :param accuracy: Accuracy tier of the series
+    :return: For each strategy, the best time per epoch in seconds and the
+        largest difference from the DIRECT strategy in radians
+    :type t: float | np.ndarray
+    :type number: int
+    :type accuracy: Accuracy | float
+    :rtype: dict[EvaluationStrategy, tuple[float, float]]
+    """
+
+    t = np.atleast_1d(np.asarray(t, dtype=np.float64))
+
+    results = {}
+    reference = None
+
+    for strategy in EvaluationStrategy:
+        se_cip_xys = cip_xys(accuracy, strategy=strategy)
+
+        timings = timeit.repeat(lambda: se_cip_xys.compute_many(t),
+                                number=1, repeat=number)
+        values = np.array(se_cip_xys.compute_many(t))
+
+        if reference is None:
+            reference = values
+
+        results[strategy] = (min(timings) / len(t),
+                             float(np.max(np.abs(values - reference))))
+
+    return results
+
+
+def horner(coefficients, t):
+    """
+    This function evaluates a polynomial using Horner's method. The
+    coefficients are ordered from the constant term upwards. Each
+    coefficient may be an array, in which case the polynomials are evaluated
+    element-wise.
+
+    :param coefficients: Polynomial coefficients, lowest power first
+    :param t: Polynomial variable
+    :return: Polynomial value
+    :type coefficients: Sequence[float | np.ndarray]
+    :type t: float | np.ndarray
+    :rtype: float | np.ndarray
+    """
+
+    value = 0.0
+
+    for coefficient in reversed(coefficients):
+        value = value * t + coefficient
+
+    return value
+
+
+def horner_with_derivative(coefficients, t):
+    """
+    This function evaluates a polynomial and its derivative together using
+    Horner's method. See horner for the coefficient layout.
+
+    :param coefficients: Polynomial coefficients, lowest power first
+    :param t: Polynomial variable
+    :return: Polynomial value and derivative
+    :type coefficients: Sequence[float | np.ndarray]
+    :type t: float | np.ndarray
+    :rtype: tuple[float | np.ndarray, float | np.ndarray]
+    """
+
+    value = 0.0
+    derivative = 0.0
+
+    for coefficient in reversed(coefficients):
+        derivative = derivative * t + value
+        value = value * t + coefficient
+
+    return value, derivative
+
+
+def chunk_bounds(n_epochs, n_terms, chunk_size=None):
+    """
+    This generator yields (start, stop) index pairs that split n_epochs into
+    chunks. If chunk_size is not given, it's chosen so that a chunk's
+    (epochs x terms) arrays hold at most MAX_CHUNK_ELEMENTS values.
+
+    :param n_epochs: Total number of epochs
+    :param n_terms: Number of series terms evaluated per epoch
+    :param chunk_size: Number of epochs per chunk
+    :type n_epochs: int
+    :type n_terms: int
+    :type chunk_size: int | None
+    :rtype: Iterator[tuple[int, int]]
+    """
+
+    if chunk_size is None:
+        chunk_size = max(1, MAX_CHUNK_ELEMENTS // max(1, n_terms))
+
+    if chunk_size < 1:
+        raise ValueError('The chunk size must be a positive integer.')
+
+    for start in range(0, n_epochs, chunk_size):
+        yield start, min(start + chunk_size, n_epochs)
+
+
+def _series_value_and_rate(polynomial_coefficients, power_sums, rate_sums, t):
+    # The series is p(t) + sum_j t^j S_j(t), so its derivative is
+    # p'(t) + sum_j (j t^(j - 1) S_j(t) + t^j S_j'(t)).
+    poly_part, poly_rate = horner_with_derivative(polynomial_coefficients, t)
+    non_poly_part, non_poly_rate = horner_with_derivative(power_sums, t)
+
+    value = poly_part + non_poly_part
+    rate = poly_rate + non_poly_rate + horner(rate_sums, t)
+
+    return value, rate
+
+
+def _argument_derivative_bounds(multipliers, t_max):
+    # Bounds on the first derivative of each term argument and on the fourth
+    # derivative of sin(ARG) for |t| <= t_max, in centuries. Each argument
+    # is a quartic polynomial with coefficients multipliers @ coefficients.
+    coefficients = Arguments.POLYNOMIAL_COEFFICIENTS.copy()
+    n = Arguments.N_ARCSECOND_ARGUMENTS
+    coefficients[:n] = Conversions.arcsec_to_rad(coefficients[:n])
+
+    term_coefficients = np.abs(multipliers @ coefficients)
+    degree = term_coefficients.shape[1] - 1
+
+    derivatives = [sum(math.perm(k, order) * term_coefficients[:, k] *
+                       t_max ** (k - order)
+                       for k in range(order, degree + 1))
+                   for order in range(1, 5)]
+
+    d1, d2, d3, d4 = derivatives
+
+    # The derivatives of sin and cos are at most one, so the complete Bell
+    # polynomial of the argument derivatives bounds the fourth derivative.
+    fourth = d1 ** 4 + 6.0 * d1 ** 2 * d2 + 4.0 * d1 * d3 + 3.0 * d2 ** 2 + d4
+
+    return d1, fourth
+
+
+def _cubic_lagrange_weights(u):
+    # Weights of the nodes at -1, 0, 1, and 2 for interpolation at u
+    weights = (-u * (u - 1.0) * (u - 2.0) / 6.0,
+               (u + 1.0) * (u - 1.0) * (u - 2.0) / 2.0,
+               -(u + 1.0) * u * (u - 2.0) / 2.0,
+               (u + 1.0) * u * (u - 1.0) / 6.0)
+
+    return np.stack(weights, axis=-1)
+
+
+def fundamental_arguments(t):
+    """
+    This function computes the 14 fundamental arguments of the nutation
+    theory per IERS Conventions (2010). "argument" is the term that IERS uses
+    to refer to the input to the trigonometric functions. The order is
+    tightly coupled with the file format of the series tables.
+
+    :type t: float | np.ndarray
+    :param t: Terrestrial time measured in Julian centuries.
+    :return: Array of the fundamental arguments in radians. The shape is
+        (14, ) for a scalar input and (n, 14) for n input epochs.
+    :rtype: np.ndarray
+    """
+
+    arguments = Arguments.fundamental_arguments(t)
+
+    if arguments.ndim > 1:
+        arguments = arguments.reshape(-1, 14)
+
+    return arguments
+
+
+def cip_x(file_name=r'tab5.2a.txt', accuracy=Accuracy.FULL,
+          time_span=DEFAULT_TIME_SPAN, strategy=EvaluationStrategy.DIRECT):
     file_path = resources.files("TerraFrame.Data").joinpath(file_name)
-    return CipCoordinate(file_path, (-16617.0, 2004191898.0,
-                                     -429782.9, -198618.34, 7.578, 5.9285))
+    return _shared('cip_x', file_name, accuracy, time_span, strategy,
+                   lambda: CipCoordinate(
+                       file_path, (-16617.0, 2004191898.0, -429782.9,
+                                   -198618.34, 7.578, 5.9285),
+                       accuracy, time_span, strategy))
 
-def cip_y(file_name=r'tab5.2b.txt'):
+def cip_y(file_name=r'tab5.2b.txt', accuracy=Accuracy.FULL,
+          time_span=DEFAULT_TIME_SPAN, strategy=EvaluationStrategy.DIRECT):
     file_path = resources.files("TerraFrame.Data").joinpath(file_name)
-    return CipCoordinate(file_path, (-6951.0, -25896.0,
-                                     -22407274.7, 1900.59, 1112.526, 0.1358))
+    return _shared('cip_y', file_name, accuracy, time_span, strategy,
+                   lambda: CipCoordinate(
+                       file_path, (-6951.0, -25896.0, -22407274.7, 1900.59,
+                                   1112.526, 0.1358),
+                       accuracy, time_span, strategy))
 
-def cip_sxy2(file_name=r'tab5.2d.txt'):
+def cip_sxy2(file_name=r'tab5.2d.txt', accuracy=Accuracy.FULL,
+             time_span=DEFAULT_TIME_SPAN, strategy=EvaluationStrategy.DIRECT):
     file_path = resources.files("TerraFrame.Data").joinpath(file_name)
-    return CipCoordinate(file_path, (94.0, 3808.65,
-                                     -122.68, -72574.11, 27.98, 15.62))
+    return _shared('cip_sxy2', file_name, accuracy, time_span, strategy,
+                   lambda: CipCoordinate(
+                       file_path, (94.0, 3808.65, -122.68, -72574.11, 27.98,
+                                   15.62),
+                       accuracy, time_span, strategy))
+
+
+def cip_xys(accuracy=Accuracy.FULL, time_span=DEFAULT_TIME_SPAN,
+            strategy=EvaluationStrategy.DIRECT):
+    return _shared('cip_xys', None, accuracy, time_span, strategy,
+                   lambda: CipXys(
+                       cip_x(accuracy=accuracy, time_span=time_span),
+                       cip_y(accuracy=accuracy, time_span=time_span),
+                       cip_sxy2(accuracy=accuracy, time_span=time_span),
+                       strategy))
+
+
+def _shared(name, file_name, accuracy, time_span, strategy, factory):
+    # The series objects are immutable once built, so every caller with the
+    # same configuration shares one instance through the table registry.
+    if isinstance(accuracy, Accuracy):
+        accuracy = accuracy.value
+
+    key = (name, file_name, float(accuracy),
+           tuple(float(x) for x in time_span), strategy)
+
+    return TableRegistry.get(key, factory)
+
+
+def nutation_longitude(file_name=r'nut00a_longitude.txt',
+                       accuracy=Accuracy.FULL, time_span=DEFAULT_TIME_SPAN,
+                       strategy=EvaluationStrategy.DIRECT):
+    file_path = resources.files("TerraFrame.Data").joinpath(file_name)
+    return _shared('nutation_longitude', file_name, accuracy, time_span,
+                   strategy,
+                   lambda: CipCoordinate(file_path, (0.0, ), accuracy,
+                                         time_span, strategy))
+
+
+def nutation_obliquity(file_name=r'nut00a_obliquity.txt',
+                       accuracy=Accuracy.FULL, time_span=DEFAULT_TIME_SPAN,
+                       strategy=EvaluationStrategy.DIRECT):
+    file_path = resources.files("TerraFrame.Data").joinpath(file_name)
+    return _shared('nutation_obliquity', file_name, accuracy, time_span,
+                   strategy,
+                   lambda: CipCoordinate(file_path, (0.0, ), accuracy,
+                                         time_span, strategy))
+
+
+def equinox_complementary_terms(file_name=r'eect00_complementary_terms.txt',
+                                accuracy=Accuracy.FULL,
+                                time_span=DEFAULT_TIME_SPAN,
+                                strategy=EvaluationStrategy.DIRECT):
+    file_path = resources.files("TerraFrame.Data").joinpath(file_name)
+    return _shared('equinox_complementary_terms', file_name, accuracy,
+                   time_span, strategy,
+                   lambda: CipCoordinate(file_path, (0.0, ), accuracy,
+                                         time_span, strategy))
+
+
+def equinox_nutation(accuracy=Accuracy.FULL, time_span=DEFAULT_TIME_SPAN,
+                     strategy=EvaluationStrategy.DIRECT):
+    return _shared('equinox_nutation', None, accuracy, time_span, strategy,
+                   lambda: EquinoxNutation(
+                       nutation_longitude(accuracy=accuracy,
+                                          time_span=time_span),
+                       nutation_obliquity(accuracy=accuracy,
+                                          time_span=time_span),
+                       equinox_complementary_terms(accuracy=accuracy,
+                                                   time_span=time_span),
+                       strategy))
@@ -0,0 +1,288 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import math
+from enum import Enum
+
+import numpy as np
+
+from TerraFrame.CelestialTerrestrial import CelestialTerrestrialTransformation
+from TerraFrame.Utilities import Conversions, TransformationMatrices
+from TerraFrame.Utilities.Time.JulianDate import JulianDate, JulianDateArray
+from TerraFrame.Utilities.Time.TimeScales import TimeScales
+
+
+class InterpolationMethod(Enum):
+    """
+    Quaternion interpolation methods.
+
+    SLERP: Spherical linear interpolation between neighbouring nodes. The
+        rotation rate jumps at the nodes.
+    SQUAD: Spherical quadrangle interpolation (Shoemake, 1987), the
+        quaternion analogue of a cubic Hermite spline. The rotation rate is
+        continuous and the error is much smaller for the same node spacing.
+    """
+    SLERP = 1
+    SQUAD = 2
+
+
+class QuaternionInterpolator:
+    """
+    This class serves the ITRS to GCRS rotation at many epochs by
+    interpolating between unit quaternions of the full model. The model is
+    evaluated once, at nodes evenly spaced in TT over a time span, and every
+    query after that costs only a few quaternion products.
+
+    The rotation is dominated by the Earth rotation angle, which changes at
+    a nearly constant rate about a nearly fixed axis, and SLERP follows
+    such a rotation exactly. What remains is the slowly changing
+    precession, nutation, and polar motion, so nodes a minute or more apart
+    are typically enough. error_report measures the worst-case error
+    against the full model.
+    """
+
+    def __init__(self, start, end, node_spacing=60.0,
+                 method=InterpolationMethod.SQUAD, transformation=None):
+        """
+        :param start: First epoch of the time span
+        :param end: Last epoch of the time span
+        :param node_spacing: Spacing of the nodes in seconds of TT
+        :param method: Interpolation method
+        :param transformation: Transformation used at the nodes. Defaults to
+            CelestialTerrestrialTransformation with its default settings.
+        :type start: JulianDate
+        :type end: JulianDate
+        :type node_spacing: float
+        :type method: InterpolationMethod
+        :type transformation: CelestialTerrestrialTransformation | None
+        """
+
+        if node_spacing <= 0.0:
+            raise ValueError('The node spacing must be positive.')
+
+        if transformation is None:
+            transformation = CelestialTerrestrialTransformation()
+
+        self.transformation = transformation
+        self.method = InterpolationMethod(method)
+        self.node_spacing = float(node_spacing)
+
+        self.start = Conversions.any_to_tt(start)
+        self.span = _seconds_between(Conversions.any_to_tt(end), self.start)
+
+        if self.span <= 0.0:
+            raise ValueError('The end of the time span must be after the '
+                             'start.')
+
+        n_intervals = max(1, math.ceil(self.span / self.node_spacing))
+        node_seconds = self.node_spacing * np.arange(n_intervals + 1)
+
+        q = transformation.itrs_to_gcrs_quaternion_many(
+            self._epochs(node_seconds))
+
+        # q and -q are the same rotation. Pick the signs so that each node
+        # is in the same hemisphere as the previous one.
+        flips = np.sum(q[1:] * q[:-1], axis=-1) < 0.0
+        signs = np.cumprod(np.where(flips, -1.0, 1.0))
+        q[1:] *= signs[:, None]
+
+        self._nodes = q
+
+        if self.method is InterpolationMethod.SQUAD:
+            self._controls = _squad_controls(q)
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def __call__(self, times):
+        """
+        This function interpolates the ITRS to GCRS quaternion.
+
+        :param times: Epochs within the time span, in one timescale
+        :return: Unit quaternions [w, x, y, z], shape (N, 4)
+        :type times: JulianDateArray | Sequence[JulianDate]
+        :rtype: np.ndarray
+        """
+
+        if not isinstance(times, JulianDateArray):
+            times = JulianDateArray.from_julian_dates(list(times))
+
+        jd_tt = Conversions.any_to_tt_many(times)
+
+        return self.interpolate_seconds(_seconds_between(jd_tt, self.start))
+
+    def matrices(self, times):
+        """
+        This function interpolates the ITRS to GCRS matrix.
+
+        :param times: Epochs within the time span, in one timescale
+        :return: ITRS to GCRS matrices, shape (N, 3, 3)
+        :type times: JulianDateArray | Sequence[JulianDate]
+        :rtype: np.ndarray
+        """
+
+        return TransformationMatrices.matrix_from_quaternion(self(times))
+
+    def interpolate_seconds(self, seconds):
+        """
+        This function interpolates the ITRS to GCRS quaternion at epochs
+        given as seconds of TT since the start of the time span.
+
+        :param seconds: Seconds of TT since the start
+        :return: Unit quaternions [w, x, y, z], shape seconds.shape + (4, )
+        :type seconds: float | np.ndarray
+        :rtype: np.ndarray
+        """
+
+        seconds = np.asarray(seconds, dtype=np.float64)
+
+        if np.any(seconds < 0.0) or np.any(seconds > self.span):
+            raise ValueError('The epochs must be within the time span of '
+                             'the interpolator.')
+
+        position = seconds / self.node_spacing
+        index = np.clip(np.floor(position).astype(np.intp), 0,
+                        len(self._nodes) - 2)
+        u = (position - index)[..., None]
+
+        q0 = self._nodes[index]
+        q1 = self._nodes[index + 1]
+
+        if self.method is InterpolationMethod.SLERP:
+            return _slerp(q0, q1, u)
+
+        return _squad(q0, q1, self._controls[index],
+                      self._controls[index + 1], u)
+
+    def error_report(self, samples_per_interval=4):
+        """
+        This function compares the interpolation with the full model at
+        evenly spaced epochs between the nodes.
+
+        :param samples_per_interval: Number of epochs checked between each
+            pair of nodes
+        :return: Largest and RMS angular errors in radians, the epoch of the
+            largest error in seconds since the start, and the number of
+            epochs checked
+        :type samples_per_interval: int
+        :rtype: dict[str, float | int]
+        """
+
+        offsets = (np.arange(1, samples_per_interval + 1) /
+                   (samples_per_interval + 1))
+        seconds = self.node_spacing * (np.arange(len(self._nodes) - 1)[:, None]
+                                       + offsets).reshape(-1)
+        seconds = seconds[seconds <= self.span]
+
+        q_model = self.transformation.itrs_to_gcrs_quaternion_many(
+            self._epochs(seconds))
+        q_interpolated = self.interpolate_seconds(seconds)
+
+        errors = angular_distance(q_model, q_interpolated)
+        worst = int(np.argmax(errors))
+
+        return {'max_error': float(errors[worst]),
+                'rms_error': float(np.sqrt(np.mean(errors ** 2))),
+                'max_error_seconds': float(seconds[worst]),
+                'samples': len(seconds)}
+
+    def _epochs(self, seconds):
+        start = JulianDateArray(self.start.integer_part(),
+                                self.start.fraction_part(), TimeScales.TT)
+
+        return start + Conversions.seconds_to_days(seconds)
+
+
+def angular_distance(q_a, q_b):
+    """
+    This function computes the angle of the rotation between two
+    orientations given as unit quaternions.
+
+    :param q_a: Unit quaternions, shape (..., 4)
+    :param q_b: Unit quaternions, shape (..., 4)
+    :return: Angles in radians
+    :type q_a: np.ndarray
+    :type q_b: np.ndarray
+    :rtype: np.ndarray
+    """
+
+    # The vector part is used rather than the scalar part, which loses
+    # precision for small angles
+    difference = _multiply(_conjugate(q_a), q_b)
+    sine = np.linalg.norm(difference[..., 1:], axis=-1)
+
+    return 2.0 * np.arcsin(np.minimum(sine, 1.0))
+
+
+def _multiply(q_a, q_b):
+    w1, x1, y1, z1 = (q_a[..., i] for i in range(4))
+    w2, x2, y2, z2 = (q_b[..., i] for i in range(4))
+
+    return np.stack([w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2,
+                     w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2,
+                     w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2,
+                     w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2], axis=-1)
+
+
+def _conjugate(q):
+    return q * np.array([1.0, -1.0, -1.0, -1.0])
+
+
+def _log(q):
+    # Logarithm of a unit quaternion as a 3-vector: half the rotation angle
+    # times the rotation axis
+    v = q[..., 1:]
+    norm = np.linalg.norm(v, axis=-1, keepdims=True)
+    angle = np.arctan2(norm, q[..., :1])
+
+    scale = np.divide(angle, norm, out=1.0 / q[..., :1], where=norm > 0.0)
+
+    return v * scale
+
+
+def _exp(v):
+    # Inverse of _log
+    angle = np.linalg.norm(v, axis=-1, keepdims=True)
+
+    return np.concatenate([np.cos(angle), v * np.sinc(angle / np.pi)],
+                          axis=-1)
+
+
+def _slerp(q0, q1, u):
+    # q0 (q0* q1)^u, along the shorter arc
+    difference = _multiply(_conjugate(q0), q1)
+    difference *= np.where(difference[..., :1] < 0.0, -1.0, 1.0)
+
+    return _multiply(q0, _exp(u * _log(difference)))
+
+
+def _squad(q0, q1, s0, s1, u):
+    # Spherical quadrangle between nodes q0 and q1 with control points s0
+    # and s1
+    return _slerp(_slerp(q0, q1, u), _slerp(s0, s1, u), 2.0 * u * (1.0 - u))
+
+
+def _squad_controls(q):
+    # Inner control points of Shoemake (1987). The end nodes are their own
+    # control points.
+    controls = q.copy()
+
+    if len(q) > 2:
+        q_inverse = _conjugate(q[1:-1])
+
+        tangent = (_log(_multiply(q_inverse, q[2:])) +
+                   _log(_multiply(q_inverse, q[:-2])))
+
+        controls[1:-1] = _multiply(q[1:-1], _exp(-tangent / 4.0))
+
+    return controls
+
+
+def _seconds_between(jd_a, jd_b):
+    # Seconds from jd_b to jd_a, formed from the two parts of the dates to
+    # keep the precision
+    days = ((jd_a.integer_part() - jd_b.integer_part()) +
+            (jd_a.fraction_part() - jd_b.fraction_part()))
+
+    return days * 86400.0
@@ -0,0 +1,182 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import json
+import math
+import socket
+
+from TerraFrame.Service import Protocol
+
+
+class TransformClient:
+    """
+    This class requests transformation matrices from a transform server
+    started with python -m TerraFrame serve. It only uses the standard
+    library, so importing it doesn't load NumPy, the model tables, or the
+    Earth orientation data.
+
+    A client holds one connection and isn't meant to be shared between
+    threads; give each thread its own client.
+    """
+
+    def __init__(self, socket_path=None, timeout=None):
+        """
+        :param socket_path: Path of the server socket. Defaults to
+            Protocol.default_socket_path.
+        :param timeout: Socket timeout in seconds, None to wait forever
+        :type socket_path: str | os.PathLike | None
+        :type timeout: float | None
+        """
+
+        if socket_path is None:
+            socket_path = Protocol.default_socket_path()
+
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._socket.settimeout(timeout)
+
+        try:
+            self._socket.connect(str(socket_path))
+        except OSError:
+            self._socket.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        self._socket.close()
+
+    def itrs_to_gcrs(self, times, time_scale=None):
+        """
+        This function requests the ITRS to GCRS matrices at many epochs.
+
+        :param times: Epochs as JulianDate objects, (integer part, fraction
+            part) pairs, or Julian dates as floats
+        :param time_scale: Time scale of the epochs, by name or as a
+            TimeScales member. Defaults to the time scale of the first
+            JulianDate, or UTC.
+        :return: Row-major 3x3 matrices as nested lists
+        :type times: Sequence[JulianDate | tuple[int, float] | float]
+        :type time_scale: str | TimeScales | None
+        :rtype: list[list[list[float]]]
+        """
+
+        return self._transform(Protocol.Operation.ITRS_TO_GCRS, times,
+                               time_scale)
+
+    def gcrs_to_itrs(self, times, time_scale=None):
+        """
+        This function requests the GCRS to ITRS matrices at many epochs. See
+        itrs_to_gcrs.
+
+        :param times: Epochs as JulianDate objects, (integer part, fraction
+            part) pairs, or Julian dates as floats
+        :param time_scale: Time scale of the epochs
+        :return: Row-major 3x3 matrices as nested lists
+        :type times: Sequence[JulianDate | tuple[int, float] | float]
+        :type time_scale: str | TimeScales | None
+        :rtype: list[list[list[float]]]
+        """
+
+        return self._transform(Protocol.Operation.GCRS_TO_ITRS, times,
+                               time_scale)
+
+    def statistics(self):
+        """
+        This function requests the request, batch, and latency statistics of
+        the server. See TransformServer.statistics.
+
+        :return: Server statistics
+        :rtype: dict[str, int | float]
+        """
+
+        content = self._request(Protocol.Operation.STATISTICS, 0, [], [])
+
+        return json.loads(content.decode('utf-8'))
+
+    def _transform(self, operation, times, time_scale):
+        times = list(times)
+
+        if time_scale is None:
+            time_scale = 'UTC'
+
+            if len(times) > 0:
+                time_scale = getattr(times[0], 'time_scale', 'UTC')
+
+        name = getattr(time_scale, 'name', time_scale)
+
+        if name not in Protocol.TIME_SCALE_CODES:
+            raise ValueError(f'Unknown time scale: {time_scale}')
+
+        integer_parts = []
+        fraction_parts = []
+
+        for time in times:
+            integer_part, fraction_part = _split(time)
+
+            integer_parts.append(integer_part)
+            fraction_parts.append(fraction_part)
+
+        values = Protocol.unpack_array('d', self._request(
+            operation, Protocol.TIME_SCALE_CODES[name], integer_parts,
+            fraction_parts))
+
+        return [[list(values[9 * i + 3 * j:9 * i + 3 * j + 3])
+                 for j in range(3)] for i in range(len(times))]
+
+    def _request(self, operation, time_scale_code, integer_parts,
+                 fraction_parts):
+        if len(integer_parts) > Protocol.MAX_EPOCHS:
+            raise ValueError(f'At most {Protocol.MAX_EPOCHS} epochs can be '
+                             f'sent in one request.')
+
+        self._socket.sendall(
+            Protocol.REQUEST_HEADER.pack(Protocol.MAGIC, operation.value,
+                                         time_scale_code, 0,
+                                         len(integer_parts)) +
+            Protocol.pack_array('q', integer_parts) +
+            Protocol.pack_array('d', fraction_parts))
+
+        header = Protocol.receive_exactly(self._socket,
+                                          Protocol.RESPONSE_HEADER.size)
+
+        if header is None:
+            raise ConnectionError('The server closed the connection.')
+
+        magic, status, count = Protocol.RESPONSE_HEADER.unpack(header)
+
+        if magic != Protocol.MAGIC:
+            raise ConnectionError('The server sent an invalid response.')
+
+        if (Protocol.Status(status) is Protocol.Status.OK and
+                operation is not Protocol.Operation.STATISTICS):
+            size = 9 * 8 * count
+        else:
+            size = count
+
+        content = Protocol.receive_exactly(self._socket, size) if size else b''
+
+        if Protocol.Status(status) is Protocol.Status.ERROR:
+            raise RuntimeError(f'The transform server failed: '
+                               f'{content.decode("utf-8")}')
+
+        return content
+
+
+def _split(time):
+    # Two-part Julian date with the fraction part in [0, 1)
+    if hasattr(time, 'integer_part'):
+        return int(time.integer_part()), float(time.fraction_part())
+
+    if isinstance(time, (tuple, list)):
+        integer_part, fraction_part = time
+    else:
+        integer_part, fraction_part = 0, float(time)
+
+    carry = math.floor(fraction_part)
+
+    return int(integer_part) + carry, float(fraction_part - carry)
@@ -0,0 +1,143 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+# Wire format of the transform service. Only the standard library is used,
+# so the client stays lightweight.
+#
+# A request is a header followed by the epochs: count little-endian int64
+# integer parts of the Julian dates, then count little-endian float64
+# fraction parts. A response is a header followed by its payload: count
+# row-major 3x3 float64 matrices for a transformation, or count bytes of
+# UTF-8 text for the statistics (JSON) and for errors.
+
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from enum import Enum
+
+# Identifies the protocol and its version
+MAGIC = b'TFS1'
+
+# Magic, operation, time scale, reserved, number of epochs
+REQUEST_HEADER = struct.Struct('<4sBBHI')
+
+# Magic, status, reserved, payload count
+RESPONSE_HEADER = struct.Struct('<4sB3xI')
+
+# Largest number of epochs in a single request
+MAX_EPOCHS = 1 << 20
+
+# Environment variable used to override the default socket path
+SOCKET_PATH_VARIABLE = 'TERRAFRAME_SOCKET'
+
+# Wire codes of the time scales. These are the values of
+# Utilities.Time.TimeScales, repeated here so the client doesn't import it.
+TIME_SCALE_CODES = {'UTC': 1, 'TAI': 2, 'TT': 3, 'UT1': 4, 'TDB': 5,
+                    'TCG': 6}
+
+
+class Operation(Enum):
+    ITRS_TO_GCRS = 1
+    GCRS_TO_ITRS = 2
+    STATISTICS = 3
+
+
+class Status(Enum):
+    OK = 0
+    ERROR = 1
+
+
+def default_socket_path():
+    """
+    This function returns the socket path used when none is given. It can be
+    set with the TERRAFRAME_SOCKET environment variable and defaults to
+    terraframe.sock in XDG_RUNTIME_DIR or the temporary directory.
+
+    :return: Socket path
+    :rtype: str
+    """
+
+    path = os.environ.get(SOCKET_PATH_VARIABLE)
+
+    if path:
+        return path
+
+    directory = os.environ.get('XDG_RUNTIME_DIR') or tempfile.gettempdir()
+
+    return os.path.join(directory, 'terraframe.sock')
+
+
+def receive_exactly(connection, size):
+    """
+    This function reads exactly size bytes from a socket.
+
+    :param connection: Connected socket
+    :param size: Number of bytes
+    :return: The bytes, or None if the peer closed the connection before
+        sending any
+    :type connection: socket.socket
+    :type size: int
+    :rtype: bytes | None
+    """
+
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
+
+    while received < size:
+        n = connection.recv_into(view[received:])
+
+        if n == 0:
+            if received == 0:
+                return None
+
+            raise ConnectionError('The connection closed in the middle of a '
+                                  'message.')
+
+        received += n
+
+    return bytes(buffer)
+
+
+def pack_array(type_code, values):
+    """
+    This function packs numbers as little-endian binary.
+
+    :param type_code: array type code, 'q' for int64 or 'd' for float64
+    :param values: Numbers to pack
+    :return: Packed numbers
+    :type type_code: str
+    :type values: Iterable[int | float]
+    :rtype: bytes
+    """
+
+    packed = array(type_code, values)
+
+    if sys.byteorder != 'little':
+        packed.byteswap()
+
+    return packed.tobytes()
+
+
+def unpack_array(type_code, content):
+    """
+    This function unpacks little-endian binary written by pack_array.
+
+    :param type_code: array type code, 'q' for int64 or 'd' for float64
+    :param content: Packed numbers
+    :return: Unpacked numbers
+    :type type_code: str
+    :type content: bytes
+    :rtype: array.array
+    """
+
+    unpacked = array(type_code)
+    unpacked.frombytes(content)
+
+    if sys.byteorder != 'little':
+        unpacked.byteswap()
+
+    return unpacked
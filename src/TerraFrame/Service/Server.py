@@ -0,0 +1,448 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import json
+import os
+import queue
+import socket
+import socketserver
+import stat
+import threading
+from collections import deque
+from concurrent.futures import Future
+from time import perf_counter
+
+import numpy as np
+
+from TerraFrame.CelestialTerrestrial import CelestialTerrestrialTransformation
+from TerraFrame.Service import Protocol
+from TerraFrame.Utilities.Time.JulianDate import JulianDateArray
+from TerraFrame.Utilities.Time.TimeScales import TimeScales
+
+# Largest number of epochs the server gathers into one batch
+MAX_BATCH_SIZE = 4096
+
+# Longest time in seconds a request waits for other requests to join its
+# batch
+MAX_DELAY = 0.002
+
+# Number of recent request latencies kept for the statistics
+LATENCY_WINDOW = 10000
+
+# Time scales the transformation accepts. There is no conversion from UT1 to
+# TT.
+SUPPORTED_TIME_SCALES = frozenset(TimeScales) - {TimeScales.UT1}
+
+# Epochs further than this many days from J2000 are rejected. The CIP
+# coordinates leave the unit disk not far beyond.
+MAX_DAYS_FROM_J2000 = 3652500.0
+
+
+class ServerStatistics:
+    """
+    This class counts the requests and batches of a transform server and
+    keeps the latencies of recent requests. Updates are thread-safe.
+    """
+
+    def __init__(self, latency_window=LATENCY_WINDOW):
+        """
+        :param latency_window: Number of recent latencies kept
+        :type latency_window: int
+        """
+
+        self.requests = 0
+        self.epochs = 0
+        self.errors = 0
+        self.batches = 0
+        self.batched_requests = 0
+        self.batched_epochs = 0
+        self.max_batch_epochs = 0
+
+        self._latencies = deque(maxlen=latency_window)
+        self._lock = threading.Lock()
+
+    def record_batch(self, n_requests, n_epochs):
+        with self._lock:
+            self.batches += 1
+            self.batched_requests += n_requests
+            self.batched_epochs += n_epochs
+            self.max_batch_epochs = max(self.max_batch_epochs, n_epochs)
+
+    def record_request(self, n_epochs, latency, failed=False):
+        with self._lock:
+            self.requests += 1
+            self.epochs += n_epochs
+            self.errors += int(failed)
+
+            self._latencies.append(latency)
+
+    def snapshot(self):
+        """
+        This function reports the counters and the latency percentiles.
+
+        :return: Numbers of requests, epochs, errors, and batches, the mean
+            and largest batch sizes, and the mean, median, 99th percentile,
+            and largest latencies of recent requests in seconds
+        :rtype: dict[str, int | float]
+        """
+
+        with self._lock:
+            latencies = np.array(self._latencies)
+
+            statistics = {
+                'requests': self.requests,
+                'epochs': self.epochs,
+                'errors': self.errors,
+                'batches': self.batches,
+                'mean_batch_requests': self.batched_requests /
+                                       max(self.batches, 1),
+                'mean_batch_epochs': self.batched_epochs /
+                                     max(self.batches, 1),
+                'max_batch_epochs': self.max_batch_epochs}
+
+        if len(latencies) > 0:
+            p50, p99 = np.percentile(latencies, [50.0, 99.0])
+
+            statistics.update({'latency_mean': float(np.mean(latencies)),
+                               'latency_p50': float(p50),
+                               'latency_p99': float(p99),
+                               'latency_max': float(np.max(latencies))})
+
+        return statistics
+
+
+class TransformServer:
+    """
+    This class serves ITRS to GCRS transformations over a Unix domain
+    socket, so short-lived processes don't each load the model tables and
+    the Earth orientation data. See Protocol for the wire format and
+    Client.TransformClient for the client.
+
+    Each connection is handled by its own thread. Requests that arrive
+    within max_delay of each other are coalesced and evaluated as one
+    vectorized batch with itrs_to_gcrs_many. Requests are checked before
+    they join a batch, and if a batch still fails its requests are
+    evaluated one by one, so an error is only returned to the request that
+    caused it.
+    """
+
+    def __init__(self, socket_path=None, transformation=None,
+                 max_batch_size=MAX_BATCH_SIZE, max_delay=MAX_DELAY):
+        """
+        :param socket_path: Path of the socket. Defaults to
+            Protocol.default_socket_path.
+        :param transformation: Transformation to serve. Defaults to
+            CelestialTerrestrialTransformation with its default settings.
+        :param max_batch_size: Number of epochs after which a batch is
+            evaluated without waiting for more requests
+        :param max_delay: Longest time in seconds a request waits for other
+            requests to join its batch
+        :type socket_path: str | os.PathLike | None
+        :type transformation: CelestialTerrestrialTransformation | None
+        :type max_batch_size: int
+        :type max_delay: float
+        """
+
+        if socket_path is None:
+            socket_path = Protocol.default_socket_path()
+
+        if transformation is None:
+            transformation = CelestialTerrestrialTransformation()
+
+        self.socket_path = os.fspath(socket_path)
+        self.transformation = transformation
+        self.max_batch_size = int(max_batch_size)
+        self.max_delay = float(max_delay)
+
+        # Load the time conversion tables before accepting requests
+        transformation.itrs_to_gcrs_many(
+            JulianDateArray(np.array([2451545]), np.array([0.0])))
+
+        self._statistics = ServerStatistics()
+        self._queue = queue.Queue()
+
+        # Set once the batcher has been told to stop. Requests are only
+        # queued while it's clear, so none are left behind the stop marker.
+        self._closed = False
+        self._queue_lock = threading.Lock()
+
+        _remove_stale_socket(self.socket_path)
+
+        self._server = socketserver.ThreadingUnixStreamServer(
+            self.socket_path, _RequestHandler)
+        self._server.daemon_threads = True
+        self._server.block_on_close = False
+        self._server.transform_server = self
+
+        self._thread = None
+
+        self._batcher = threading.Thread(target=self._run_batches,
+                                         name='TerraFrame batcher',
+                                         daemon=True)
+        self._batcher.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def serve_forever(self):
+        """
+        This function handles requests until shutdown or close is called
+        from another thread.
+        """
+
+        self._server.serve_forever()
+
+    def start(self):
+        """
+        This function handles requests in a background thread.
+
+        :return: This server
+        :rtype: TransformServer
+        """
+
+        self._thread = threading.Thread(target=self.serve_forever,
+                                        name='TerraFrame server',
+                                        daemon=True)
+        self._thread.start()
+
+        return self
+
+    def close(self):
+        """
+        This function stops the server and removes its socket. Connections
+        that are still open get an error for any further request.
+        """
+
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+
+        self._server.server_close()
+
+        with self._queue_lock:
+            if not self._closed:
+                self._closed = True
+                self._queue.put(None)
+
+        self._batcher.join()
+
+        try:
+            os.unlink(self.socket_path)
+        except FileNotFoundError:
+            pass
+
+    def statistics(self):
+        """
+        This function reports the request, batch, and latency statistics.
+        See ServerStatistics.snapshot.
+
+        :return: Server statistics
+        :rtype: dict[str, int | float]
+        """
+
+        return self._statistics.snapshot()
+
+    def _respond(self, operation, time_scale, count, content):
+        start = perf_counter()
+        failed = False
+
+        try:
+            operation = Protocol.Operation(operation)
+
+            if operation is Protocol.Operation.STATISTICS:
+                return _response(Protocol.Status.OK, json.dumps(
+                    self.statistics()).encode('utf-8'))
+
+            request = _request(time_scale, count, content)
+
+            # The matrices of a request are computed by the batcher thread
+            future = Future()
+
+            with self._queue_lock:
+                if self._closed:
+                    raise RuntimeError('The server is closed.')
+
+                self._queue.put(request + (future, ))
+
+            t_gi = future.result()
+
+            if operation is Protocol.Operation.GCRS_TO_ITRS:
+                t_gi = np.swapaxes(t_gi, 1, 2)
+
+            return _response(Protocol.Status.OK, np.ascontiguousarray(
+                t_gi, dtype='<f8').tobytes(), count)
+        except Exception as e:
+            failed = True
+
+            return _response(Protocol.Status.ERROR, str(e).encode('utf-8'))
+        finally:
+            self._statistics.record_request(count, perf_counter() - start,
+                                            failed)
+
+    def _run_batches(self):
+        while True:
+            request = self._queue.get()
+
+            if request is None:
+                return
+
+            batch = [request]
+            n_epochs = len(request[1])
+            deadline = perf_counter() + self.max_delay
+            stop = False
+
+            while n_epochs < self.max_batch_size:
+                try:
+                    request = self._queue.get(
+                        timeout=max(deadline - perf_counter(), 0.0))
+                except queue.Empty:
+                    break
+
+                if request is None:
+                    stop = True
+                    break
+
+                batch.append(request)
+                n_epochs += len(request[1])
+
+            self._evaluate(batch, n_epochs)
+
+            if stop:
+                return
+
+    def _evaluate(self, batch, n_epochs):
+        self._statistics.record_batch(len(batch), n_epochs)
+
+        # A JulianDateArray holds a single time scale
+        for time_scale in set(x[0] for x in batch):
+            group = [x for x in batch if x[0] is time_scale]
+
+            try:
+                t_gi = self._transform(
+                    time_scale, np.concatenate([x[1] for x in group]),
+                    np.concatenate([x[2] for x in group]))
+            except Exception as e:
+                if len(group) == 1:
+                    group[0][3].set_exception(e)
+                    continue
+
+                # Find the request that failed, so the others still get
+                # their matrices
+                for x in group:
+                    try:
+                        x[3].set_result(self._transform(*x[:3]))
+                    except Exception as error:
+                        x[3].set_exception(error)
+
+                continue
+
+            offset = 0
+
+            for x in group:
+                x[3].set_result(t_gi[offset:offset + len(x[1])])
+                offset += len(x[1])
+
+    def _transform(self, time_scale, integer_parts, fraction_parts):
+        if len(integer_parts) == 0:
+            return np.empty((0, 3, 3))
+
+        return self.transformation.itrs_to_gcrs_many(
+            JulianDateArray(integer_parts, fraction_parts, time_scale))
+
+
+class _RequestHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        server = self.server.transform_server
+
+        # A connection carries any number of requests
+        while True:
+            try:
+                header = Protocol.receive_exactly(
+                    self.request, Protocol.REQUEST_HEADER.size)
+
+                if header is None:
+                    return
+
+                magic, operation, time_scale, _, count = (
+                    Protocol.REQUEST_HEADER.unpack(header))
+
+                if magic != Protocol.MAGIC or count > Protocol.MAX_EPOCHS:
+                    # The rest of the stream can't be interpreted
+                    self.request.sendall(_response(
+                        Protocol.Status.ERROR, b'Invalid request.'))
+                    return
+
+                content = b''
+
+                if count > 0:
+                    content = Protocol.receive_exactly(self.request,
+                                                       16 * count)
+
+                    if content is None:
+                        return
+
+                self.request.sendall(server._respond(operation, time_scale,
+                                                     count, content))
+            except (ConnectionError, OSError):
+                return
+
+
+def _request(time_scale, count, content):
+    # Decodes and checks the epochs of a request
+    time_scale = TimeScales(time_scale)
+
+    if time_scale not in SUPPORTED_TIME_SCALES:
+        raise ValueError(f'Unsupported time scale: {time_scale.name}')
+
+    integer_parts = np.frombuffer(content, '<i8', count, 0)
+    fraction_parts = np.frombuffer(content, '<f8', count, 8 * count)
+
+    if not np.all(np.isfinite(fraction_parts)):
+        raise ValueError('The fraction parts must be finite.')
+
+    # In floating point, so that integer parts near the int64 limits don't
+    # wrap around
+    days = (integer_parts.astype(np.float64) - 2451545.0) + fraction_parts
+
+    if np.any(np.abs(days) > MAX_DAYS_FROM_J2000):
+        raise ValueError(f'The epochs must be within {MAX_DAYS_FROM_J2000} '
+                         f'days of J2000.')
+
+    return time_scale, integer_parts, fraction_parts
+
+
+def _response(status, payload, count=None):
+    if count is None:
+        count = len(payload)
+
+    return Protocol.RESPONSE_HEADER.pack(Protocol.MAGIC, status.value,
+                                         count) + payload
+
+
+def _remove_stale_socket(path):
+    # A socket file left behind by a server that didn't shut down cleanly
+    # refuses connections and is removed
+    try:
+        mode = os.stat(path).st_mode
+    except FileNotFoundError:
+        return
+
+    if not stat.S_ISSOCK(mode):
+        raise FileExistsError(f'{path} exists and is not a socket.')
+
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+    try:
+        probe.connect(path)
+    except ConnectionRefusedError:
+        os.unlink(path)
+        return
+    finally:
+        probe.close()
+
+    raise RuntimeError(f'A server is already listening on {path}.')
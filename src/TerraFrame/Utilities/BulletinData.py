@@ -9,7 +9,9 @@ from typing import Optional
 import numpy as np
 import numpy.typing as npt
 
+from . import DataCache
 from .Interpolation import Interpolation1D
+from .TableRegistry import TableRegistry
 
 
 class BulletinData:
@@ -26,12 +28,21 @@ class BulletinData:
         3. Polar motion y-coordinate (arcseconds)
         4. Nutation correction x-coordinate (arcseconds)
         5. Nutation correction y-coordinate (arcseconds)
+        6. Excess length of day (milliseconds)
 
     Since the UTC deltas are provided in UTC but at single day resolutions, we
     treat the UTC delta data as if it's a function of UT1.
 
+    The version is the checksum of the bulletin file, so it changes whenever
+    the Earth orientation data is updated.
+
+    The data and interpolants are loaded through the TableRegistry, so they
+    are created once even when many threads ask for them at the same time,
+    and the arrays are read-only.
+
     """
     data: Optional[npt.NDArray[np.float64]]
+    version: Optional[str]
 
     f_pm_x: Optional[
         Callable[[float | Iterable[float]], float | Iterable[float]]]
@@ -41,19 +52,21 @@ class BulletinData:
         Callable[[float | Iterable[float]], float | Iterable[float]]]
     f_nc_dy: Optional[
         Callable[[float | Iterable[float]], float | Iterable[float]]]
+    f_lod: Optional[
+        Callable[[float | Iterable[float]], float | Iterable[float]]]
 
     data = None
+    version = None
     f_pm_x = None
     f_pm_y = None
     f_nc_dx = None
     f_nc_dy = None
+    f_lod = None
 
     def __init__(self):
         self._file_name = r'finals.all.iau2000.txt'
 
-        self._parse_file()
-
-        self._init_interpolants()
+        self._load()
 
     def __len__(self):
         return BulletinData.data[:, 0].shape[0]
@@ -72,35 +85,35 @@ class BulletinData:
         else:
             raise RuntimeError('BulletinData must be initialized first.')
 
-    def _init_interpolants(self):
-        if BulletinData.f_pm_x is None:
-            BulletinData.f_pm_x = Interpolation1D(self.data[:, 0],
-                                                  self.data[:, 2])
+    def _load(self):
+        # The data is assigned last, so once it's set the other class
+        # attributes are too
+        if BulletinData.data is not None:
+            return
 
-            BulletinData.f_pm_y = Interpolation1D(self.data[:, 0],
-                                                  self.data[:, 3])
+        entry = TableRegistry.get(('BulletinData', self._file_name),
+                                  self._parse_file)
 
-            BulletinData.f_nc_dx = Interpolation1D(self.data[:, 0],
-                                                   self.data[:, 4])
+        BulletinData.version = entry['version']
 
-            BulletinData.f_nc_dy = Interpolation1D(self.data[:, 0],
-                                                   self.data[:, 5])
+        BulletinData.f_pm_x = entry['f_pm_x']
+        BulletinData.f_pm_y = entry['f_pm_y']
+        BulletinData.f_nc_dx = entry['f_nc_dx']
+        BulletinData.f_nc_dy = entry['f_nc_dy']
+        BulletinData.f_lod = entry['f_lod']
 
-    def _parse_file(self):
-        # Don't reparse the file data
-        if BulletinData.data is not None:
-            return
+        BulletinData.data = entry['data']
 
-        file_content = []
+    def _parse_file(self):
+        file = resources.files("TerraFrame.Data").joinpath(self._file_name)
+        content = file.read_bytes()
 
-        with (resources.files("TerraFrame.Data").joinpath(self._file_name).open(
-                "r", encoding="utf-8") as f):
-            file_content = f.readlines()
+        file_content = content.decode('utf-8').splitlines(keepends=True)
 
         data_tmp = []
 
         for line in file_content:
-            line_data = np.zeros((6,))
+            line_data = np.zeros((7,))
 
             if len(line.strip()) >= 125:
                 # The file format is fixed width with a strict
@@ -142,10 +155,44 @@ class BulletinData:
                     # Nutation correction, dy (milliarcseconds)
                     line_data[5] = float(line[116:125])
 
+                # Excess length of day (milliseconds). This is only given
+                # for past dates and is filled in below for predictions.
+                try:
+                    line_data[6] = float(line[79:86])
+                except ValueError:
+                    line_data[6] = np.nan
+
                 data_tmp.append(line_data)
 
             else:
                 # Skip invalid lines
                 continue
 
-        BulletinData.data = np.array(data_tmp)
+        data = np.array(data_tmp)
+
+        _fill_length_of_day(data)
+
+        return {'data': data,
+                'version': DataCache.checksum(content),
+                'f_pm_x': Interpolation1D(data[:, 0], data[:, 2]),
+                'f_pm_y': Interpolation1D(data[:, 0], data[:, 3]),
+                'f_nc_dx': Interpolation1D(data[:, 0], data[:, 4]),
+                'f_nc_dy': Interpolation1D(data[:, 0], data[:, 5]),
+                'f_lod': Interpolation1D(data[:, 0], data[:, 6])}
+
+
+def _fill_length_of_day(data):
+    # Where the length of day isn't published, derive it from the rate of
+    # change of UT1-UTC. Leap seconds are whole-second jumps in UT1-UTC and
+    # are removed first.
+    missing = np.isnan(data[:, 6])
+
+    if not np.any(missing):
+        return
+
+    leap_seconds = np.round(np.diff(data[:, 1]))
+    ut1_tai = data[:, 1] - np.concatenate(([0.0], np.cumsum(leap_seconds)))
+
+    length_of_day = -1000.0 * np.gradient(ut1_tai, data[:, 0])
+
+    data[missing, 6] = length_of_day[missing]
@@ -5,18 +5,21 @@
 import math
 
 from .Time import Deltas
-from .Time.JulianDate import JulianDate
+from .Time.JulianDate import JulianDate, JulianDateArray
 from .Time.TimeScales import TimeScales
 
+# Rate difference between TCG and TT, L_G, per IAU 2000 Resolution B1.9
+L_G = 6.969290134e-10
+
 
 def any_to_tt(jd_a):
     """
-    This function takes a Julian Date (JD) in UTC, TT, or TAI and
+    This function takes a Julian Date (JD) in UTC, TT, TAI, TDB, or TCG and
     converts it to TT. This convertion is leap second aware.
 
     Note, UT1 is not supported.
 
-    :param jd_a: Julian Date in UTC, TT, or TAI
+    :param jd_a: Julian Date in UTC, TT, TAI, TDB, or TCG
     :type jd_a: JulianDate
     :return: Julian Date in TAI
     :rtype: JulianDate
@@ -31,6 +34,10 @@ def any_to_tt(jd_a):
             return utc_to_tt(jd_a)
         case TimeScales.TAI:
             return tai_to_tt(jd_a)
+        case TimeScales.TDB:
+            return tdb_to_tt(jd_a)
+        case TimeScales.TCG:
+            return tcg_to_tt(jd_a)
         case _:
             raise RuntimeError(f'Unsupported timescale in convertion to TT: '
                                f'{jd_a.time_scale}')
@@ -237,6 +244,200 @@ def tai_to_tt(jd_tai):
     return jd_tt
 
 
+def tt_to_tdb(jd_tt, accuracy=None):
+    """
+    This function takes a Julian Date (JD) in TT and converts it to TDB at
+    the geocenter. TDB - TT comes from the Fairhead & Bretagnon (1990)
+    series, see Deltas.TdbTtDelta.
+
+    :param jd_tt: Julian Date in TT
+    :param accuracy: Truncation level of the TDB - TT series. Defaults to
+        TdbAccuracy.FULL.
+    :type jd_tt: JulianDate
+    :type accuracy: Deltas.TdbAccuracy | float | None
+    :return: Julian Date in TDB
+    :rtype: JulianDate
+    """
+
+    assert (isinstance(jd_tt, JulianDate))
+    assert jd_tt.time_scale == TimeScales.TT
+
+    if accuracy is None:
+        accuracy = Deltas.TdbAccuracy.FULL
+
+    delta = Deltas.TdbTtDelta(accuracy).get_delta(jd_tt)
+
+    jd_tdb = jd_tt + seconds_to_days(float(delta))
+    jd_tdb.time_scale = TimeScales.TDB
+
+    return jd_tdb
+
+
+def tdb_to_tt(jd_tdb, accuracy=None):
+    """
+    This function takes a Julian Date (JD) in TDB at the geocenter and
+    converts it to TT. The series is evaluated at TDB rather than TT, which
+    changes the result by less than 1e-14 seconds.
+
+    :param jd_tdb: Julian Date in TDB
+    :param accuracy: Truncation level of the TDB - TT series. Defaults to
+        TdbAccuracy.FULL.
+    :type jd_tdb: JulianDate
+    :type accuracy: Deltas.TdbAccuracy | float | None
+    :return: Julian Date in TT
+    :rtype: JulianDate
+    """
+
+    assert (isinstance(jd_tdb, JulianDate))
+    assert jd_tdb.time_scale == TimeScales.TDB
+
+    if accuracy is None:
+        accuracy = Deltas.TdbAccuracy.FULL
+
+    delta = Deltas.TdbTtDelta(accuracy).get_delta(jd_tdb)
+
+    jd_tt = jd_tdb - seconds_to_days(float(delta))
+    jd_tt.time_scale = TimeScales.TT
+
+    return jd_tt
+
+
+def tt_to_tcg(jd_tt):
+    """
+    This function takes a Julian Date (JD) in TT and converts it to TCG.
+    TCG runs faster than TT by the constant rate L_G and the two agree at
+    1977 January 1.0 TAI.
+
+    :param jd_tt: Julian Date in TT
+    :type jd_tt: JulianDate
+    :return: Julian Date in TCG
+    :rtype: JulianDate
+    """
+
+    assert (isinstance(jd_tt, JulianDate))
+    assert jd_tt.time_scale == TimeScales.TT
+
+    elapsed = _days_since_tcg_tt_epoch(jd_tt)
+
+    jd_tcg = jd_tt + L_G / (1.0 - L_G) * elapsed
+    jd_tcg.time_scale = TimeScales.TCG
+
+    return jd_tcg
+
+
+def tcg_to_tt(jd_tcg):
+    """
+    This function takes a Julian Date (JD) in TCG and converts it to TT.
+
+    :param jd_tcg: Julian Date in TCG
+    :type jd_tcg: JulianDate
+    :return: Julian Date in TT
+    :rtype: JulianDate
+    """
+
+    assert (isinstance(jd_tcg, JulianDate))
+    assert jd_tcg.time_scale == TimeScales.TCG
+
+    elapsed = _days_since_tcg_tt_epoch(jd_tcg)
+
+    jd_tt = jd_tcg - L_G * elapsed
+    jd_tt.time_scale = TimeScales.TT
+
+    return jd_tt
+
+
+def any_to_tt_many(jd_a):
+    """
+    This function converts an array of Julian Dates (JD) in UTC, TT, TAI,
+    TDB, or TCG to TT. It is the batched form of any_to_tt and matches it
+    element for element.
+
+    :param jd_a: Julian Dates in UTC, TT, TAI, TDB, or TCG
+    :type jd_a: JulianDateArray
+    :return: Julian Dates in TT
+    :rtype: JulianDateArray
+    """
+
+    assert (isinstance(jd_a, JulianDateArray))
+
+    match jd_a.time_scale:
+        case TimeScales.TT:
+            return jd_a
+        case TimeScales.UTC:
+            jd_tt = jd_a + seconds_to_days(
+                Deltas.TaiUtcDelta().get_delta_many(jd_a))
+            jd_tt += seconds_to_days(32.184)
+        case TimeScales.TAI:
+            jd_tt = jd_a + seconds_to_days(32.184)
+        case TimeScales.TDB:
+            jd_tt = jd_a - seconds_to_days(
+                Deltas.TdbTtDelta().get_delta_many(jd_a))
+        case TimeScales.TCG:
+            jd_tt = jd_a - L_G * _days_since_tcg_tt_epoch(jd_a)
+        case _:
+            raise RuntimeError(f'Unsupported timescale in convertion to TT: '
+                               f'{jd_a.time_scale}')
+
+    jd_tt.time_scale = TimeScales.TT
+
+    return jd_tt
+
+
+def tt_to_utc_many(jd_tt):
+    """
+    This function converts an array of Julian Dates (JD) in TT to UTC. It is
+    the batched form of tt_to_utc and matches it element for element.
+
+    :param jd_tt: Julian Dates in TT
+    :type jd_tt: JulianDateArray
+    :return: Julian Dates in UTC
+    :rtype: JulianDateArray
+    """
+
+    assert (isinstance(jd_tt, JulianDateArray))
+    assert jd_tt.time_scale == TimeScales.TT
+
+    jd_tai = jd_tt - seconds_to_days(32.184)
+
+    jd_utc = jd_tai - seconds_to_days(
+        Deltas.TaiUtcDeltaInverted.get_delta_many(jd_tai))
+    jd_utc.time_scale = TimeScales.UTC
+
+    return jd_utc
+
+
+def tt_to_ut1_many(jd_tt):
+    """
+    This function converts an array of Julian Dates (JD) in TT to UT1. It is
+    the batched form of tt_to_ut1 and matches it element for element.
+
+    :param jd_tt: Julian Dates in TT
+    :type jd_tt: JulianDateArray
+    :return: Julian Dates in UT1
+    :rtype: JulianDateArray
+    """
+
+    assert (isinstance(jd_tt, JulianDateArray))
+    assert jd_tt.time_scale == TimeScales.TT
+
+    jd_tai = jd_tt - seconds_to_days(32.184)
+    jd_utc = tt_to_utc_many(jd_tt)
+
+    delta_ut1_utc = Deltas.Ut1UtcDelta().get_delta_many(jd_utc)
+    delta_tai_utc = Deltas.TaiUtcDelta().get_delta_many(jd_utc)
+
+    jd_ut1 = jd_tai + seconds_to_days(delta_ut1_utc - delta_tai_utc)
+    jd_ut1.time_scale = TimeScales.UT1
+
+    return jd_ut1
+
+
+def _days_since_tcg_tt_epoch(jd):
+    # Days since 1977 January 1.0 TAI, JD 2443144.5003725 in TT and TCG. The
+    # two parts are subtracted separately to keep the precision.
+    return (jd.integer_part() - 2443144) + (jd.fraction_part() - 0.5003725)
+
+
 def muas_to_rad(x):
     """
     This function converts the input from microarcsecond (muas) to radians
@@ -0,0 +1,127 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+# Bump this whenever the layout of a cached array changes so that old cache
+# files are regenerated instead of being misread.
+CACHE_FORMAT_VERSION = 2
+
+# Environment variable used to override the cache location. Setting it to an
+# empty string disables the cache entirely.
+CACHE_DIRECTORY_VARIABLE = 'TERRAFRAME_CACHE_DIR'
+
+
+def cache_directory():
+    """
+    This function returns the directory used to store binary versions of the
+    text data files. The directory can be set with the TERRAFRAME_CACHE_DIR
+    environment variable and defaults to ~/.cache/TerraFrame.
+
+    :return: Cache directory or None if caching is disabled
+    :rtype: Path | None
+    """
+
+    directory = os.environ.get(CACHE_DIRECTORY_VARIABLE)
+
+    if directory is None:
+        return Path.home() / '.cache' / 'TerraFrame'
+    elif len(directory.strip()) == 0:
+        return None
+    else:
+        return Path(directory)
+
+
+def checksum(content):
+    """
+    This function computes the checksum used to tie a cached array to the
+    text it was generated from.
+
+    :param content: Raw contents of the source file
+    :type content: bytes
+    :return: Hexadecimal SHA-256 digest
+    :rtype: str
+    """
+
+    return hashlib.sha256(content).hexdigest()
+
+
+def load_array(source, parser):
+    """
+    This function returns the array parsed from a text data file. The parsed
+    array is stored in a compact .npz file in the cache directory together
+    with the checksum of the source text. Later calls load the binary file
+    directly unless the source text has changed, in which case the text is
+    parsed again and the cache file is replaced.
+
+    Failing to read or write the cache is never an error; the text is simply
+    parsed instead.
+
+    :param source: Path to the text data file
+    :param parser: Function that takes the file text and returns an array
+    :return: Parsed data
+    :type source: Path | importlib.resources.abc.Traversable
+    :type parser: Callable[[str], np.ndarray]
+    :rtype: np.ndarray
+    """
+
+    content = source.read_bytes()
+    source_checksum = checksum(content)
+
+    directory = cache_directory()
+
+    if directory is None:
+        return parser(content.decode('utf-8'))
+
+    cache_path = directory / (Path(source.name).stem + '.npz')
+
+    data = _read_cache(cache_path, source_checksum)
+
+    if data is not None:
+        return data
+
+    data = parser(content.decode('utf-8'))
+
+    _write_cache(cache_path, source_checksum, data)
+
+    return data
+
+
+def _read_cache(cache_path, source_checksum):
+    try:
+        with np.load(cache_path, allow_pickle=False) as f:
+            if (int(f['version']) == CACHE_FORMAT_VERSION and
+                    str(f['checksum']) == source_checksum):
+                return f['data']
+    except (OSError, ValueError, KeyError):
+        pass
+
+    return None
+
+
+def _write_cache(cache_path, source_checksum, data):
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write to a temporary file first so that other processes never see
+        # a partially written cache file.
+        fd, tmp_path = tempfile.mkstemp(suffix='.npz', dir=cache_path.parent)
+
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.savez(f, version=CACHE_FORMAT_VERSION,
+                         checksum=source_checksum, data=data)
+
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            os.unlink(tmp_path)
+            raise
+
+    except OSError:
+        pass
@@ -4,28 +4,96 @@
 
 import math
 
+import numpy as np
+
 from TerraFrame.Utilities.Time.JulianDate import JulianDate
 from TerraFrame.Utilities import Time
 
+# Rate of the Earth rotation angle in radians per day of UT1
+ERA_RATE_PER_UT1_DAY = 2.0 * math.pi * 1.00273781191135448
+
+# Number of SI seconds in a day
+SECONDS_PER_DAY = 86400.0
+
 
 def earth_rotation_angle(time):
     """
     This function computes the earth rotation angle at a given datetime in UT1.
 
     :param time: JulianDate in UT1
-    :return: Earth rotation angle in radians
+    :return: Earth rotation angle in radians, in [0, 2 pi)
     :type time: JulianDate
     :rtype: float
     """
 
     assert (time.time_scale == Time.TimeScales.UT1)
 
-    day_frac = time.day_fraction()
-    tu = time - JulianDate.j2000()
+    # Same arithmetic as the batched function, so that the two agree to the
+    # last bit
+    era = earth_rotation_angle_many(time.integer_part(), time.fraction_part())
+
+    return float(era)
+
+
+def earth_rotation_angle_many(jd_ut1, jd_ut1_fraction=0.0):
+    """
+    This function computes the earth rotation angle at many epochs at once.
+    The Julian dates are given in two parts, like JulianDate, so that the
+    fraction of the day keeps its full precision.
+
+    :param jd_ut1: Julian date in UT1, or its integer part
+    :param jd_ut1_fraction: Fraction part of the Julian date
+    :return: Earth rotation angle in radians, in [0, 2 pi)
+    :type jd_ut1: float | np.ndarray
+    :type jd_ut1_fraction: float | np.ndarray
+    :rtype: np.ndarray
+    """
+
+    jd_ut1 = np.asarray(jd_ut1, dtype=np.float64)
+    jd_ut1_fraction = np.asarray(jd_ut1_fraction, dtype=np.float64)
+
+    # Whole days add whole turns, so only the fractions of the two parts
+    # are kept to preserve precision.
+    day_frac = np.fmod(jd_ut1, 1.0) + np.fmod(jd_ut1_fraction, 1.0)
+    tu = (jd_ut1 - float(JulianDate.j2000())) + jd_ut1_fraction
+
+    era = 2.0 * math.pi * (day_frac + 0.7790572732640 +
+                           0.00273781191135448 * tu)
+
+    return np.mod(era, 2.0 * math.pi)
 
-    era = 2.0 * math.pi * (
-                day_frac + 0.7790572732640 + float(0.00273781191135448 * tu))
 
-    era = math.fmod(era, 2.0 * math.pi)
+def earth_rotation_rate(length_of_day=0.0):
+    """
+    This function computes the rate of the earth rotation angle with respect
+    to atomic time (TAI, TT, or UTC between leap seconds).
+
+    UT1 advances more slowly than atomic time when the length of day exceeds
+    86400 SI seconds: dUT1/dTAI = 1 - LOD / 86400, where LOD is the excess
+    length of day published by the IERS.
+
+    :param length_of_day: Excess length of day in seconds
+    :return: Earth rotation rate in radians per SI second
+    :type length_of_day: float
+    :rtype: float
+    """
+
+    return (ERA_RATE_PER_UT1_DAY / SECONDS_PER_DAY *
+            (1.0 - length_of_day / SECONDS_PER_DAY))
+
+
+def earth_rotation_angle_and_rate(time, length_of_day=0.0):
+    """
+    This function computes the earth rotation angle and its rate at a given
+    datetime in UT1. See earth_rotation_rate for the rate.
+
+    :param time: JulianDate in UT1
+    :param length_of_day: Excess length of day in seconds
+    :return: Earth rotation angle in radians and its rate in radians per SI
+        second
+    :type time: JulianDate
+    :type length_of_day: float
+    :rtype: tuple[float, float]
+    """
 
-    return era
+    return earth_rotation_angle(time), earth_rotation_rate(length_of_day)
@@ -2,6 +2,8 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
+import threading
+
 import numpy as np
 from .Helpers import clamp, ensure_iterable
 
@@ -14,30 +16,33 @@ class Interpolation1D:
     Since most queries will be near each other, there is an index cache. If
     the index is out of bounds, the first or last values are used.
 
+    The index cache is kept per thread, so an interpolant can be shared
+    between threads. The data itself is never modified.
+
     """
 
     def __init__(self, x, y):
         self._x = x
         self._y = y
 
-        self._index_cache = None
+        self._index_cache = threading.local()
 
     def _get_index(self, xv):
         index = None
+        cached = getattr(self._index_cache, 'index', None)
 
         # Under nominal usage patterns, most queries will use the same index
         # with only the occasional change
-        if self._index_cache is not None:
-            x1 = self._x[clamp(self._index_cache - 1, 0, len(self._x) - 1)]
-            x2 = self._x[clamp(self._index_cache, 0, len(self._x) - 1)]
+        if cached is not None:
+            x1 = self._x[clamp(cached - 1, 0, len(self._x) - 1)]
+            x2 = self._x[clamp(cached, 0, len(self._x) - 1)]
 
             if x1 < xv <= x2:
-                index = self._index_cache
-
+                index = cached
 
         if index is None:
             index = np.searchsorted(self._x, xv)
-            self._index_cache = index
+            self._index_cache.index = index
 
         return index
 
@@ -69,3 +74,35 @@ class Interpolation1D:
             return yv[0]
         else:
             return yv
+
+    def evaluate_many(self, xv):
+        """
+        This function interpolates at many points at once with whole-array
+        operations. It gives the same values as calling the interpolant,
+        including the first or last value outside the data, and leaves the
+        index cache alone.
+
+        :param xv: Query points
+        :type xv: float | np.ndarray
+        :return: Interpolated values with the same shape as xv
+        :rtype: np.ndarray
+        """
+
+        xv = np.asarray(xv, dtype=np.float64)
+
+        index = np.searchsorted(self._x, xv)
+        inner = np.clip(index, 1, len(self._x) - 1)
+
+        y2 = self._y[inner]
+        y1 = self._y[inner - 1]
+
+        x2 = self._x[inner]
+        x1 = self._x[inner - 1]
+
+        yv = (y2 - y1) / (x2 - x1) * (xv - x1) + y1
+
+        # If we're out of bounds, use the first or last value
+        yv = np.where(index == 0, self._y[0], yv)
+        yv = np.where(index >= len(self._x), self._y[-1], yv)
+
+        return yv
@@ -0,0 +1,350 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import math
+import os
+import threading
+from enum import Enum
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# Environment variable used to select the backend at import time. Valid
+# values are the names of the Backend members, case-insensitive.
+BACKEND_VARIABLE = 'TERRAFRAME_BACKEND'
+
+
+class Backend(Enum):
+    """
+    Backends for the hot loops of the library.
+
+    NUMPY: Whole-array NumPy operations. Always available.
+    NUMBA: Loop kernels compiled with Numba. This avoids the per-call
+        overhead of many small NumPy operations, which dominates for batches
+        of 1 to 100 epochs. Only available if Numba is installed.
+    """
+    NUMPY = 1
+    NUMBA = 2
+
+
+_compiled = {}
+_compile_lock = threading.Lock()
+
+
+def numba_available():
+    """
+    :return: True if Numba is installed
+    :rtype: bool
+    """
+
+    return numba is not None
+
+
+def set_backend(backend):
+    """
+    This function selects the backend used from now on.
+
+    :param backend: Backend to use
+    :type backend: Backend
+    """
+
+    global _backend
+
+    backend = Backend(backend)
+
+    if backend is Backend.NUMBA and not numba_available():
+        raise RuntimeError('The NUMBA backend requires Numba to be installed.')
+
+    _backend = backend
+
+
+def active_backend():
+    """
+    :return: The backend currently in use
+    :rtype: Backend
+    """
+
+    return _backend
+
+
+def use_compiled():
+    """
+    :return: True if the compiled kernels should be used
+    :rtype: bool
+    """
+
+    return _backend is Backend.NUMBA
+
+
+def diagnostics():
+    """
+    This function reports the state of the backend selection.
+
+    :return: The active backend, whether Numba is installed and its
+        version, and the kernels compiled so far
+    :rtype: dict[str, Any]
+    """
+
+    with _compile_lock:
+        compiled = sorted(_compiled.keys())
+
+    return {'backend': _backend.name,
+            'numba_available': numba_available(),
+            'numba_version': numba.__version__ if numba_available() else None,
+            'compiled_kernels': compiled}
+
+
+def compiled(kernel):
+    """
+    This function returns the compiled version of a kernel, compiling it on
+    first use. Without Numba the kernel itself is returned, which runs as
+    plain Python and is only meant for testing.
+
+    :param kernel: Kernel function
+    :type kernel: Callable
+    :return: Compiled kernel
+    :rtype: Callable
+    """
+
+    if not numba_available():
+        return kernel
+
+    function = _compiled.get(kernel.__name__)
+
+    if function is None:
+        with _compile_lock:
+            function = _compiled.get(kernel.__name__)
+
+            if function is None:
+                function = numba.njit(cache=True)(kernel)
+                _compiled[kernel.__name__] = function
+
+    return function
+
+
+def fundamental_arguments(t, coefficients, n_arcsecond, n_reduced):
+    """
+    This function evaluates the fundamental argument polynomials with the
+    compiled kernel. See Arguments.fundamental_arguments.
+
+    :param t: Terrestrial time measured in Julian centuries
+    :param coefficients: Polynomial coefficients, shape (arguments, degree)
+    :param n_arcsecond: Number of leading arguments in arcseconds
+    :param n_reduced: Number of leading arguments reduced to one turn
+    :return: Arguments in radians, shape t.shape + (arguments, )
+    :type t: float | np.ndarray
+    :type coefficients: np.ndarray
+    :type n_arcsecond: int
+    :type n_reduced: int
+    :rtype: np.ndarray
+    """
+
+    t = np.asarray(t, dtype=np.float64)
+    t_flat = np.ascontiguousarray(t.reshape(-1))
+
+    values = np.empty((len(t_flat), coefficients.shape[0]))
+
+    compiled(_fundamental_arguments_kernel)(
+        t_flat, np.ascontiguousarray(coefficients), n_arcsecond, n_reduced,
+        values)
+
+    return values.reshape(t.shape + (coefficients.shape[0], ))
+
+
+def power_sums(arguments, multipliers, weights):
+    """
+    This function evaluates the power sums of a series table with the
+    compiled kernel. See SeriesExpansion.DirectTrigonometry.
+
+    :param arguments: Fundamental arguments, shape (14, ) or (n, 14)
+    :param multipliers: Argument multipliers, shape (terms, 14)
+    :param weights: Amplitudes of the terms
+    :return: Power sums, shape (powers, ) or (n, powers)
+    :type arguments: np.ndarray
+    :type multipliers: np.ndarray
+    :type weights: SeriesExpansion.PowerWeights
+    :rtype: np.ndarray
+    """
+
+    arguments = np.asarray(arguments, dtype=np.float64)
+    arguments_2d = np.ascontiguousarray(arguments.reshape(
+        -1, arguments.shape[-1]))
+
+    values = np.empty((arguments_2d.shape[0], weights.n_powers))
+
+    compiled(_power_sums_kernel)(
+        arguments_2d, np.ascontiguousarray(multipliers), weights.offsets,
+        weights.rows, weights.sin_values, weights.cos_values, values)
+
+    return values.reshape(arguments.shape[:-1] + (weights.n_powers, ))
+
+
+def celestial_terrestrial_matrices(x, y, s, era, pm_x, pm_y, sp):
+    """
+    This function builds the CIRS to GCRS, TIRS to CIRS, ITRS to TIRS, and
+    composed ITRS to GCRS matrices with the compiled kernel. See
+    TransformationMatrices.celestial_terrestrial_matrices.
+
+    :return: The four matrices, shape (4, 3, 3)
+    :rtype: np.ndarray
+    """
+
+    values = np.empty((4, 3, 3))
+
+    compiled(_celestial_terrestrial_matrices_kernel)(
+        float(x), float(y), float(s), float(era), float(pm_x), float(pm_y),
+        float(sp), values)
+
+    return values
+
+
+# The kernels below are written in the subset of Python that Numba compiles:
+# explicit loops over contiguous arrays, scalar math, and results
+# written into preallocated output arrays.
+
+def _fundamental_arguments_kernel(t, coefficients, n_arcsecond, n_reduced,
+                                  out):
+    n_arguments, n_coefficients = coefficients.shape
+    turn_arcseconds = 360.0 * 60.0 * 60.0
+    turn_radians = 2.0 * math.pi
+
+    for e in range(t.shape[0]):
+        for a in range(n_arguments):
+            value = (coefficients[a, n_coefficients - 1] * t[e] +
+                     coefficients[a, n_coefficients - 2])
+
+            for k in range(n_coefficients - 3, -1, -1):
+                value = value * t[e] + coefficients[a, k]
+
+            if a < n_arcsecond:
+                value = np.fmod(value, turn_arcseconds) / 3600.0
+                value *= math.pi / 180.0
+            elif a < n_reduced:
+                value = np.fmod(value, turn_radians)
+
+            out[e, a] = value
+
+
+def _power_sums_kernel(arguments, multipliers, offsets, rows, sin_values,
+                       cos_values, out):
+    n_epochs, n_arguments = arguments.shape
+    n_terms = multipliers.shape[0]
+    n_powers = out.shape[1]
+
+    sin_terms = np.empty(n_terms)
+    cos_terms = np.empty(n_terms)
+
+    for e in range(n_epochs):
+        for k in range(n_terms):
+            angle = 0.0
+
+            for a in range(n_arguments):
+                if multipliers[k, a] != 0:
+                    angle += multipliers[k, a] * arguments[e, a]
+
+            sin_terms[k] = math.sin(angle)
+            cos_terms[k] = math.cos(angle)
+
+        for p in range(n_powers):
+            total = 0.0
+
+            for i in range(offsets[p], offsets[p + 1]):
+                total += (sin_terms[rows[i]] * sin_values[i] +
+                          cos_terms[rows[i]] * cos_values[i])
+
+            out[e, p] = total
+
+
+def _celestial_terrestrial_matrices_kernel(x, y, s, era, pm_x, pm_y, sp,
+                                           out):
+    # CIRS -> GCRS from the closed form of IERS Conventions (2010),
+    # equation 5.10, followed by R3(s)
+    z = math.sqrt(1.0 - x * x - y * y)
+    a = 1.0 / (1.0 + z)
+
+    q = np.empty((3, 3))
+    q[0, 0] = 1.0 - a * x * x
+    q[0, 1] = -a * x * y
+    q[0, 2] = x
+    q[1, 0] = -a * x * y
+    q[1, 1] = 1.0 - a * y * y
+    q[1, 2] = y
+    q[2, 0] = -x
+    q[2, 1] = -y
+    q[2, 2] = 1.0 - a * (x * x + y * y)
+
+    r = np.zeros((3, 3))
+    r[0, 0] = math.cos(s)
+    r[0, 1] = math.sin(s)
+    r[1, 0] = -math.sin(s)
+    r[1, 1] = math.cos(s)
+    r[2, 2] = 1.0
+
+    for i in range(3):
+        for j in range(3):
+            out[0, i, j] = (q[i, 0] * r[0, j] + q[i, 1] * r[1, j] +
+                            q[i, 2] * r[2, j])
+
+    # TIRS -> CIRS: R3(-ERA)
+    for i in range(3):
+        for j in range(3):
+            out[1, i, j] = 0.0
+
+    out[1, 0, 0] = math.cos(era)
+    out[1, 0, 1] = -math.sin(era)
+    out[1, 1, 0] = math.sin(era)
+    out[1, 1, 1] = math.cos(era)
+    out[1, 2, 2] = 1.0
+
+    # ITRS -> TIRS: R3(-s') R2(x_p) R1(y_p)
+    c_sp = math.cos(sp)
+    s_sp = math.sin(sp)
+    c_x = math.cos(pm_x)
+    s_x = math.sin(pm_x)
+    c_y = math.cos(pm_y)
+    s_y = math.sin(pm_y)
+
+    out[2, 0, 0] = c_sp * c_x
+    out[2, 0, 1] = c_sp * s_x * s_y - s_sp * c_y
+    out[2, 0, 2] = -c_sp * s_x * c_y - s_sp * s_y
+    out[2, 1, 0] = s_sp * c_x
+    out[2, 1, 1] = s_sp * s_x * s_y + c_sp * c_y
+    out[2, 1, 2] = -s_sp * s_x * c_y + c_sp * s_y
+    out[2, 2, 0] = s_x
+    out[2, 2, 1] = -c_x * s_y
+    out[2, 2, 2] = c_x * c_y
+
+    # ITRS -> GCRS
+    m = np.empty((3, 3))
+
+    for i in range(3):
+        for j in range(3):
+            m[i, j] = (out[0, i, 0] * out[1, 0, j] +
+                       out[0, i, 1] * out[1, 1, j] +
+                       out[0, i, 2] * out[1, 2, j])
+
+    for i in range(3):
+        for j in range(3):
+            out[3, i, j] = (m[i, 0] * out[2, 0, j] + m[i, 1] * out[2, 1, j] +
+                            m[i, 2] * out[2, 2, j])
+
+
+def _default_backend():
+    name = os.environ.get(BACKEND_VARIABLE, '').strip().upper()
+
+    if name == Backend.NUMPY.name:
+        return Backend.NUMPY
+
+    # Fall back to NumPy when Numba isn't installed, even if it was asked for
+    if numba_available():
+        return Backend.NUMBA
+    else:
+        return Backend.NUMPY
+
+
+_backend = _default_backend()
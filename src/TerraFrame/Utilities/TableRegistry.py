@@ -0,0 +1,165 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import threading
+from enum import Enum
+
+import numpy as np
+
+
+class TableRegistry:
+    """
+    This class is a process-wide registry of loaded coefficient tables and
+    the objects built from them. Entries are created lazily the first time
+    they are requested and are then shared by every caller, so each table
+    is parsed and held in memory only once per process.
+
+    Entries are read-only: every NumPy array reachable from an entry is
+    marked as not writeable when the entry is added. Lookups are
+    thread-safe and an entry's factory runs at most once.
+    """
+
+    _entries = {}
+    _lock = threading.RLock()
+
+    @classmethod
+    def get(cls, key, factory):
+        """
+        This function returns the entry for key, creating it with factory if
+        it doesn't exist yet.
+
+        :param key: Hashable key identifying the entry
+        :param factory: Function without arguments that creates the entry
+        :return: Shared entry
+        :type key: Hashable
+        :type factory: Callable[[], Any]
+        :rtype: Any
+        """
+
+        # Entries are never replaced, so a lock-free read is safe
+        entry = cls._entries.get(key)
+
+        if entry is not None:
+            return entry
+
+        with cls._lock:
+            entry = cls._entries.get(key)
+
+            if entry is None:
+                entry = factory()
+                _make_read_only(entry, set())
+                cls._entries[key] = entry
+
+        return entry
+
+    @staticmethod
+    def make_read_only(obj):
+        """
+        This function marks every NumPy array reachable from obj as not
+        writeable, as is done for new entries. It is meant for objects that
+        an entry builds lazily after it was added.
+
+        :param obj: Object to mark
+        :type obj: Any
+        """
+
+        _make_read_only(obj, set())
+
+    @classmethod
+    def keys(cls):
+        with cls._lock:
+            return list(cls._entries.keys())
+
+    @classmethod
+    def nbytes(cls):
+        """
+        This function reports the memory held by the arrays of all registry
+        entries. Arrays that are shared between entries are counted once.
+
+        :return: Number of bytes
+        :rtype: int
+        """
+
+        return sum(cls.memory_usage().values())
+
+    @classmethod
+    def memory_usage(cls):
+        """
+        This function reports the memory held by the arrays of each registry
+        entry. An array shared between entries is attributed to the first
+        entry that holds it.
+
+        :return: Number of bytes per registry key
+        :rtype: dict[Hashable, int]
+        """
+
+        seen = set()
+
+        with cls._lock:
+            return {key: _array_nbytes(entry, seen)
+                    for key, entry in cls._entries.items()}
+
+    @classmethod
+    def clear(cls):
+        """
+        This function drops all entries. Objects that already hold entries
+        keep them; later requests create new entries. This is meant for
+        tests and for reloading changed data files.
+        """
+
+        with cls._lock:
+            cls._entries = {}
+
+
+def _base_array(array):
+    while isinstance(array.base, np.ndarray):
+        array = array.base
+
+    return array
+
+
+def _children(obj):
+    if isinstance(obj, dict):
+        return obj.values()
+    elif isinstance(obj, (list, tuple)):
+        return obj
+    elif (type(obj).__module__.startswith('TerraFrame.') and
+          hasattr(obj, '__dict__') and not isinstance(obj, Enum)):
+        # Only the library's own objects are walked
+        return vars(obj).values()
+    else:
+        return ()
+
+
+def _make_read_only(obj, seen):
+    if id(obj) in seen:
+        return
+
+    seen.add(id(obj))
+
+    if isinstance(obj, np.ndarray):
+        obj.flags.writeable = False
+        return
+
+    for child in _children(obj):
+        _make_read_only(child, seen)
+
+
+def _array_nbytes(obj, seen):
+    if isinstance(obj, np.ndarray):
+        base = _base_array(obj)
+
+        if id(base) in seen:
+            return 0
+
+        seen.add(id(base))
+
+        return base.nbytes
+
+    if id(obj) in seen:
+        return 0
+
+    seen.add(id(obj))
+
+    return sum(_array_nbytes(child, seen) for child in _children(obj))
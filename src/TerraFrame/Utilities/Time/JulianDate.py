@@ -7,6 +7,8 @@ from copy import copy, deepcopy
 from TerraFrame.Utilities.Time.TimeScales import TimeScales
 import datetime
 
+import numpy as np
+
 
 class JulianBase:
     """
@@ -51,26 +53,21 @@ class JulianBase:
             fractional_part, integer_part = math.modf(value)
 
             self._integer_part += int(integer_part)
-            self._fraction_part = (math.copysign(fractional_part,
-                                                 integer_part) + self._fraction_part)
-
-            # Check if we need to roll over the fractional part
-            if abs(self._fraction_part) >= 1.0:
-                fractional_part, integer_part = math.modf(self._fraction_part)
+            self._fraction_part += fractional_part
 
-                self._integer_part += int(integer_part)
+            # Keep the fraction part in [0, 1) so that the value is always
+            # the integer part plus the fraction part, for negative values
+            # too.
+            if not 0.0 <= self._fraction_part < 1.0:
+                carry = math.floor(self._fraction_part)
 
-                if fractional_part < 0:
-                    self._integer_part -= 1
-                    self._fraction_part = 1.0 - fractional_part
-                else:
-                    self._fraction_part = fractional_part
+                self._integer_part += int(carry)
+                self._fraction_part -= carry
 
-            if self._fraction_part < 0.0 and self._integer_part >= 0:
-                self._integer_part -= 1
-                self._fraction_part = 1.0 + self._fraction_part
-            else:
-                self._fraction_part = abs(self._fraction_part)
+                # A tiny negative fraction rounds up to 1.0 when shifted
+                if self._fraction_part >= 1.0:
+                    self._integer_part += 1
+                    self._fraction_part -= 1.0
 
         elif isinstance(value, int):
             self._integer_part += value
@@ -140,8 +137,8 @@ class JulianBase:
         elif isinstance(other, JulianBase):
             jd = JulianDate(0, 0.0, self.time_scale)
 
-            frac1 = math.copysign(self._fraction_part, self._integer_part)
-            frac2 = math.copysign(other._fraction_part, other._integer_part)
+            frac1 = self._fraction_part
+            frac2 = other._fraction_part
 
             jd._add_number(self._integer_part * other._integer_part)
             jd._add_number(frac1 * frac2)
@@ -299,6 +296,194 @@ class JulianCentury(JulianBase):
         return JulianCentury(67, 0.11964407939767340849357)
 
 
+class JulianDateArray:
+    """
+    This class holds an array of Julian dates (JD) in one timescale. Like
+    JulianBase, each date is split into an integer part and a floating point
+    fractional part in [0, 1).
+
+    The arithmetic mirrors JulianBase operation for operation, so element i
+    of a result is bit for bit the JulianDate the scalar functions produce
+    for element i of the input. This lets the batched transformations be
+    checked against the scalar ones to the last bit.
+    """
+
+    time_scale: TimeScales
+    _integer_part: np.ndarray
+    _fraction_part: np.ndarray
+
+    # Make NumPy arrays defer to the operators below, so that for example
+    # ndarray * JulianDateArray calls __rmul__
+    __array_ufunc__ = None
+
+    def __init__(self, integer_part, fraction_part=0.0,
+                 time_scale: TimeScales = TimeScales.UTC):
+        integer_part = np.asarray(integer_part)
+        fraction_part = np.asarray(fraction_part, dtype=np.float64)
+
+        shape = np.broadcast_shapes(integer_part.shape, fraction_part.shape)
+
+        self.time_scale = time_scale
+
+        self._integer_part = np.zeros(shape, dtype=np.int64)
+        self._fraction_part = np.zeros(shape)
+
+        self._add_number(integer_part)
+        self._add_number(fraction_part)
+
+    @staticmethod
+    def from_julian_dates(times):
+        """
+        This function packs a sequence of Julian dates into an array. All
+        dates must be in the same timescale.
+
+        :param times: Julian dates
+        :type times: Sequence[JulianDate]
+        :return: Julian date array
+        :rtype: JulianDateArray
+        """
+
+        assert len(times) > 0
+
+        time_scale = times[0].time_scale
+
+        assert all(x.time_scale == time_scale for x in times)
+
+        return JulianDateArray(
+            np.array([x.integer_part() for x in times], dtype=np.int64),
+            np.array([x.fraction_part() for x in times], dtype=np.float64),
+            time_scale)
+
+    def to_julian_dates(self):
+        """
+        :return: The dates as a list of JulianDate objects
+        :rtype: list[JulianDate]
+        """
+
+        return [self[i] for i in range(len(self))]
+
+    def integer_part(self):
+        return self._integer_part
+
+    def fraction_part(self):
+        return self._fraction_part
+
+    def as_float(self):
+        """
+        :return: The dates as single floating point numbers, with the same
+            loss of precision as float(JulianDate)
+        :rtype: np.ndarray
+        """
+
+        return self._integer_part.astype(np.float64) + self._fraction_part
+
+    def less_than(self, other):
+        """
+        This function compares the dates element-wise, in the same order as
+        JulianBase.__lt__.
+
+        :param other: Dates to compare with
+        :type other: JulianDateArray | JulianBase
+        :return: True where this date is before the other one
+        :rtype: np.ndarray
+        """
+
+        return ((self._integer_part < other.integer_part()) |
+                ((self._integer_part == other.integer_part()) &
+                 (self._fraction_part < other.fraction_part())))
+
+    def round_to_days(self):
+        # Floor round to the nearest day keeping in mind the noon epoch. See
+        # JulianDate.round_to_days.
+        return JulianDateArray(
+            self._integer_part - (self._fraction_part < 0.5), 0.5,
+            self.time_scale)
+
+    def _add_number(self, value):
+        value = np.asarray(value)
+
+        if np.issubdtype(value.dtype, np.integer):
+            self._integer_part = self._integer_part + value
+
+            return
+
+        fractional_part, integer_part = np.modf(value.astype(np.float64))
+
+        self._integer_part = self._integer_part + integer_part.astype(
+            np.int64)
+        self._fraction_part = self._fraction_part + fractional_part
+
+        # Same normalization as JulianBase._add_number
+        carry = np.floor(self._fraction_part)
+
+        self._integer_part = self._integer_part + carry.astype(np.int64)
+        self._fraction_part = self._fraction_part - carry
+
+        rounded_up = self._fraction_part >= 1.0
+
+        self._integer_part = self._integer_part + rounded_up
+        self._fraction_part = np.where(rounded_up, self._fraction_part - 1.0,
+                                       self._fraction_part)
+
+    def __len__(self):
+        return len(self._integer_part)
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return JulianDate(int(self._integer_part[index]),
+                              float(self._fraction_part[index]),
+                              self.time_scale)
+
+        return JulianDateArray(self._integer_part[index],
+                               self._fraction_part[index], self.time_scale)
+
+    def __copy__(self):
+        return JulianDateArray(self._integer_part.copy(),
+                               self._fraction_part.copy(), self.time_scale)
+
+    def __add__(self, other):
+        value = copy(self)
+
+        if isinstance(other, (JulianBase, JulianDateArray)):
+            value._add_number(np.asarray(other.integer_part(),
+                                         dtype=np.int64))
+            value._add_number(np.asarray(other.fraction_part(),
+                                         dtype=np.float64))
+        else:
+            value._add_number(other)
+
+        return value
+
+    def __radd__(self, other):
+        return self.__add__(other)
+
+    def __sub__(self, other):
+        value = copy(self)
+
+        if isinstance(other, (JulianBase, JulianDateArray)):
+            value._add_number(np.asarray(other.integer_part(),
+                                         dtype=np.int64) * -1)
+            value._add_number(np.asarray(other.fraction_part(),
+                                         dtype=np.float64) * -1.0)
+        else:
+            value._add_number(np.asarray(other) * -1)
+
+        return value
+
+    def __mul__(self, other):
+        other = np.asarray(other, dtype=np.float64)
+
+        return JulianDateArray(self._integer_part * other,
+                               self._fraction_part * other, self.time_scale)
+
+    def __rmul__(self, other):
+        return self.__mul__(other)
+
+    def __repr__(self):
+        return (f'JulianDateArray({len(self)} dates, '
+                f'{self.time_scale.name})')
+
+
 def julian_date_now():
     dt_now = datetime.datetime.now(datetime.UTC)
     dt_ref = datetime.datetime(2000, 1, 1, 12, 0, 0, tzinfo=datetime.UTC)
@@ -465,16 +650,17 @@ def julian_date_from_pydatetime(dt):
 def julian_terrestrial_time_to_century(tt):
     """
     This function takes in the terrestrial time (TT) as a Julian Date (JD) and
-    converts it to a Julian Century (JC) using the J2000 epoch.
+    converts it to a Julian Century (JC) using the J2000 epoch. Barycentric
+    Dynamical Time (TDB) is also accepted and keeps its time scale.
 
     :type tt: JulianDate
     :param tt: Terrestrial time as a JD
     :return:
     """
 
-    assert(tt.time_scale == TimeScales.TT)
+    assert(tt.time_scale in (TimeScales.TT, TimeScales.TDB))
 
-    t = 1.0 / 36525.0 * (tt - JulianDate.j2000(time_scale=TimeScales.TT))
+    t = 1.0 / 36525.0 * (tt - JulianDate.j2000(time_scale=tt.time_scale))
 
     return t
 
@@ -10,3 +10,5 @@ class TimeScales(Enum):
     TAI = 2  # International Atomic Time
     TT = 3 # Terrestrial Time
     UT1 = 4 # Universal Time
+    TDB = 5  # Barycentric Dynamical Time
+    TCG = 6  # Geocentric Coordinate Time
@@ -0,0 +1,105 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import threading
+from collections import OrderedDict
+
+
+class TransformCache:
+    """
+    This class is a size-bounded, least recently used (LRU) cache for
+    transformation matrices. When the cache is full, adding an entry evicts
+    the entry that was used least recently.
+
+    The cache counts hits, misses, and evictions. Lookups and insertions
+    are thread-safe.
+    """
+
+    def __init__(self, max_size):
+        """
+        :param max_size: Maximum number of entries
+        :type max_size: int
+        """
+
+        if max_size < 1:
+            raise ValueError('The cache size must be at least 1.')
+
+        self.max_size = int(max_size)
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, key):
+        """
+        This function returns the entry for key and marks it as the most
+        recently used one.
+
+        :param key: Hashable key identifying the entry
+        :type key: Hashable
+        :return: Entry or None if the key isn't cached
+        :rtype: Any
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+
+            return entry
+
+    def put(self, key, entry):
+        """
+        This function adds an entry, evicting the least recently used entry
+        if the cache is full.
+
+        :param key: Hashable key identifying the entry
+        :param entry: Entry to store
+        :type key: Hashable
+        :type entry: Any
+        """
+
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def statistics(self):
+        """
+        This function reports the counters of the cache.
+
+        :return: Hits, misses, evictions, current size, and maximum size
+        :rtype: dict[str, int]
+        """
+
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses,
+                    'evictions': self.evictions, 'size': len(self._entries),
+                    'max_size': self.max_size}
+
+    def clear(self):
+        """
+        This function drops all entries and resets the counters.
+        """
+
+        with self._lock:
+            self._entries.clear()
+
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
@@ -6,7 +6,7 @@ import sys
 
 import numpy as np
 
-from TerraFrame.Utilities import Earth
+from TerraFrame.Utilities import Earth, Kernels
 from TerraFrame.Utilities import Time, Conversions
 from TerraFrame.Utilities.Time.JulianDate import JulianDate
 
@@ -90,6 +90,133 @@ def r3(psi):
     return r
 
 
+def r3_rate(psi, psi_rate):
+    """
+    This function computes the time derivative of the R3 rotation matrix.
+
+    :param psi: Rotation angle in radians
+    :param psi_rate: Rate of the rotation angle
+    :return: Derivative of the R3 matrix, in the time unit of psi_rate
+    :type psi: float
+    :type psi_rate: float
+    :rtype: np.ndarray
+    """
+
+    r = psi_rate * np.array(
+        [[-np.sin(psi), np.cos(psi), 0.0], [-np.cos(psi), -np.sin(psi), 0.0],
+         [0.0, 0.0, 0.0]])
+
+    return r
+
+
+def rotation_stack(axis, angles):
+    """
+    This function computes the R1, R2, or R3 rotation matrix for every
+    element of an array of angles. See r1, r2, and r3 for the definitions.
+
+    :param axis: Rotation axis: 1, 2, or 3
+    :param angles: Rotation angles in radians
+    :return: Rotation matrices, shape angles.shape + (3, 3)
+    :type axis: int
+    :type angles: float | np.ndarray
+    :rtype: np.ndarray
+    """
+
+    angles = np.asarray(angles, dtype=np.float64)
+
+    i, j = {1: (1, 2), 2: (2, 0), 3: (0, 1)}[axis]
+
+    c = np.cos(angles)
+    s = np.sin(angles)
+
+    r = np.zeros(angles.shape + (3, 3))
+    r[..., axis - 1, axis - 1] = 1.0
+    r[..., i, i] = c
+    r[..., i, j] = s
+    r[..., j, i] = -s
+    r[..., j, j] = c
+
+    return r
+
+
+def quaternion_from_matrix(t_m):
+    """
+    This function converts rotation matrices to unit quaternions. A
+    quaternion q = [w, x, y, z] (scalar first) represents the same
+    transformation as the matrix T: T v = q v q*, with v as a pure
+    quaternion. The sign is chosen so that w >= 0.
+
+    Each quaternion is computed from the largest of its four components
+    (Shepperd's method), which keeps the conversion accurate for any
+    rotation angle.
+
+    :param t_m: Rotation matrices, shape (..., 3, 3)
+    :return: Unit quaternions, shape (..., 4)
+    :type t_m: np.ndarray
+    :rtype: np.ndarray
+    """
+
+    t_m = np.asarray(t_m, dtype=np.float64)
+
+    m00, m01, m02 = t_m[..., 0, 0], t_m[..., 0, 1], t_m[..., 0, 2]
+    m10, m11, m12 = t_m[..., 1, 0], t_m[..., 1, 1], t_m[..., 1, 2]
+    m20, m21, m22 = t_m[..., 2, 0], t_m[..., 2, 1], t_m[..., 2, 2]
+
+    # Four times the square of w, x, y, and z
+    squares = np.stack([1.0 + m00 + m11 + m22, 1.0 + m00 - m11 - m22,
+                        1.0 - m00 + m11 - m22, 1.0 - m00 - m11 + m22],
+                       axis=-1)
+
+    largest = np.argmax(squares, axis=-1)
+    k = 0.5 * np.sqrt(np.take_along_axis(squares, largest[..., None],
+                                         axis=-1)[..., 0])
+
+    # Each candidate is four times the largest component times q
+    candidates = np.stack([
+        np.stack([4.0 * k * k, m21 - m12, m02 - m20, m10 - m01], axis=-1),
+        np.stack([m21 - m12, 4.0 * k * k, m01 + m10, m02 + m20], axis=-1),
+        np.stack([m02 - m20, m01 + m10, 4.0 * k * k, m12 + m21], axis=-1),
+        np.stack([m10 - m01, m02 + m20, m12 + m21, 4.0 * k * k], axis=-1)],
+        axis=-2)
+
+    q = np.take_along_axis(candidates, largest[..., None, None],
+                           axis=-2)[..., 0, :] / (4.0 * k[..., None])
+
+    q *= np.where(q[..., :1] < 0.0, -1.0, 1.0)
+
+    return q / np.linalg.norm(q, axis=-1, keepdims=True)
+
+
+def matrix_from_quaternion(q):
+    """
+    This function converts unit quaternions to rotation matrices. See
+    quaternion_from_matrix for the convention.
+
+    :param q: Unit quaternions [w, x, y, z], shape (..., 4)
+    :return: Rotation matrices, shape (..., 3, 3)
+    :type q: np.ndarray
+    :rtype: np.ndarray
+    """
+
+    q = np.asarray(q, dtype=np.float64)
+
+    w, x, y, z = q[..., 0], q[..., 1], q[..., 2], q[..., 3]
+
+    t_m = np.empty(q.shape[:-1] + (3, 3))
+
+    t_m[..., 0, 0] = 1.0 - 2.0 * (y * y + z * z)
+    t_m[..., 0, 1] = 2.0 * (x * y - z * w)
+    t_m[..., 0, 2] = 2.0 * (x * z + y * w)
+    t_m[..., 1, 0] = 2.0 * (x * y + z * w)
+    t_m[..., 1, 1] = 1.0 - 2.0 * (x * x + z * z)
+    t_m[..., 1, 2] = 2.0 * (y * z - x * w)
+    t_m[..., 2, 0] = 2.0 * (x * z - y * w)
+    t_m[..., 2, 1] = 2.0 * (y * z + x * w)
+    t_m[..., 2, 2] = 1.0 - 2.0 * (x * x + y * y)
+
+    return t_m
+
+
 def euler_angles_from_transformation(t_m):
     """
     This function takes a transformation matrix and calculates the corresponding
@@ -174,19 +301,18 @@ def calculate_s_prime(time):
     called s' (or s prime) per IERS Conventions (2010).
 
     Note that technically, per IERS Conventions (2010), the input time should
-    be Barycentric Dynamical Time (TDB) but the difference between TDB and TT is
-    already small. Additionally, we do not consider effects outside the
-    Geocentric Celestial Reference System (GCRS) and the primary driver of the
-    TDB vs TT difference is earth's mean anomaly in its orbit. The error from
-    this simplication is less than a microarcsecond in nutation.
+    be Barycentric Dynamical Time (TDB). TDB is available through
+    Conversions.tt_to_tdb, but TT can be used instead: TDB - TT stays below 2
+    milliseconds, and the error from this simplification is less than a
+    microarcsecond in nutation.
 
     :type time: JulianDate
-    :param time: Terrestrial time measured in Julian centuries.
+    :param time: TT or TDB measured in Julian centuries.
     :return: s prime
     :rtype: float
     """
 
-    assert (time.time_scale == Time.TimeScales.TT)
+    assert (time.time_scale in (Time.TimeScales.TT, Time.TimeScales.TDB))
 
     # This is an approximation good for the next century. See section 5.5.2 of
     # IERS Conventions (2010) for more context.
@@ -197,6 +323,22 @@ def calculate_s_prime(time):
     return s_prime
 
 
+def calculate_s_prime_many(t):
+    """
+    This function computes the TIO locator s' at many epochs at once. See
+    calculate_s_prime.
+
+    :param t: TT or TDB measured in Julian centuries
+    :type t: float | np.ndarray
+    :return: s prime in radians
+    :rtype: np.ndarray
+    """
+
+    s_prime = -47e-6 * np.asarray(t, dtype=np.float64)
+
+    return Conversions.arcsec_to_rad(s_prime)
+
+
 def cirs_to_gcrs(x, y, s):
     """
     This function computes the transformation matrix from the Celestial
@@ -229,6 +371,150 @@ def cirs_to_gcrs(x, y, s):
     return t_gc
 
 
+def cirs_to_gcrs_rate(x, y, s, x_rate, y_rate, s_rate):
+    """
+    This function computes the time derivative of the transformation matrix
+    from the Celestial Intermediate Reference System (CIRS) to the
+    Geocentric Celestial Reference System (GCRS).
+
+    The derivative is taken of the closed form of the matrix given in IERS
+    Conventions (2010), equation 5.10:
+
+        [[1 - aX^2, -aXY, X], [-aXY, 1 - aY^2, Y], [-X, -Y, 1 - a(X^2 + Y^2)]]
+        @ R3(s)
+
+    with a = 1 / (1 + Z) and Z = sqrt(1 - X^2 - Y^2).
+
+    :type x: float
+    :type y: float
+    :type s: float
+    :type x_rate: float
+    :type y_rate: float
+    :type s_rate: float
+    :param x: X coordinate of the CIP
+    :param y: Y coordinate of the CIP
+    :param s: CIO location parameter
+    :param x_rate: Rate of X
+    :param y_rate: Rate of Y
+    :param s_rate: Rate of s
+    :return: Derivative of the CIRS to GCRS matrix, in the time unit of the
+        rates
+    :rtype: np.ndarray
+    """
+
+    # This should never be true in reality
+    assert (1.0 - x ** 2 - y ** 2 > 0.0)
+
+    z = np.sqrt(1.0 - x ** 2 - y ** 2)
+    a = 1.0 / (1.0 + z)
+
+    z_rate = -(x * x_rate + y * y_rate) / z
+    a_rate = -z_rate * a ** 2
+
+    m = np.array([[1.0 - a * x ** 2, -a * x * y, x],
+                  [-a * x * y, 1.0 - a * y ** 2, y],
+                  [-x, -y, 1.0 - a * (x ** 2 + y ** 2)]])
+
+    axy_rate = a_rate * x * y + a * (x_rate * y + x * y_rate)
+
+    m_rate = np.array([
+        [-(a_rate * x ** 2 + 2.0 * a * x * x_rate), -axy_rate, x_rate],
+        [-axy_rate, -(a_rate * y ** 2 + 2.0 * a * y * y_rate), y_rate],
+        [-x_rate, -y_rate, -(a_rate * (x ** 2 + y ** 2) +
+                             2.0 * a * (x * x_rate + y * y_rate))]])
+
+    t_gc_rate = m_rate @ r3(s) + m @ r3_rate(s, s_rate)
+
+    return t_gc_rate
+
+
+def celestial_terrestrial_matrices(x, y, s, era, pm_x, pm_y, sp):
+    """
+    This function builds the three matrices of the ITRS to GCRS
+    transformation and composes them. With the NUMBA backend all four
+    matrices are built by a single compiled kernel.
+
+    :type x: float
+    :type y: float
+    :type s: float
+    :type era: float
+    :type pm_x: float
+    :type pm_y: float
+    :type sp: float
+    :param x: X coordinate of the CIP
+    :param y: Y coordinate of the CIP
+    :param s: CIO location parameter
+    :param era: Earth rotation angle in radians
+    :param pm_x: Polar motion x coordinate
+    :param pm_y: Polar motion y coordinate
+    :param sp: TIO location parameter
+    :return: CIRS to GCRS, TIRS to CIRS, ITRS to TIRS, and ITRS to GCRS
+        matrices
+    :rtype: tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+    """
+
+    if Kernels.use_compiled():
+        t_gc, t_ct, t_ti, t_gi = Kernels.celestial_terrestrial_matrices(
+            x, y, s, era, pm_x, pm_y, sp)
+
+        return t_gc, t_ct, t_ti, t_gi
+
+    t_gc = cirs_to_gcrs(x, y, s)
+    t_ct = r3(-era)
+    t_ti = itrs_to_tirs(pm_x, pm_y, sp)
+
+    t_gi = t_gc @ t_ct @ t_ti
+
+    return t_gc, t_ct, t_ti, t_gi
+
+
+def celestial_terrestrial_matrices_many(x, y, s, era, pm_x, pm_y, sp):
+    """
+    This function builds the three matrices of the ITRS to GCRS
+    transformation and composes them for many epochs at once. Each matrix
+    is built from the same rotations as celestial_terrestrial_matrices with
+    the NUMPY backend.
+
+    :type x: np.ndarray
+    :type y: np.ndarray
+    :type s: np.ndarray
+    :type era: np.ndarray
+    :type pm_x: np.ndarray
+    :type pm_y: np.ndarray
+    :type sp: np.ndarray
+    :param x: X coordinate of the CIP
+    :param y: Y coordinate of the CIP
+    :param s: CIO location parameter
+    :param era: Earth rotation angle in radians
+    :param pm_x: Polar motion x coordinate
+    :param pm_y: Polar motion y coordinate
+    :param sp: TIO location parameter
+    :return: CIRS to GCRS, TIRS to CIRS, ITRS to TIRS, and ITRS to GCRS
+        matrices, each of shape x.shape + (3, 3)
+    :rtype: tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+    """
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+
+    # This should never be true in reality
+    assert np.all(1.0 - x ** 2 - y ** 2 > 0.0)
+
+    # e and d formulas from Capitaine (2003), see cirs_to_gcrs
+    e = np.atan2(y, x)
+    d = np.atan2(np.sqrt(x ** 2 + y ** 2), np.sqrt(1 - x ** 2 - y ** 2))
+
+    t_gc = (rotation_stack(3, -e) @ rotation_stack(2, -d) @
+            rotation_stack(3, e) @ rotation_stack(3, s))
+    t_ct = rotation_stack(3, -np.asarray(era, dtype=np.float64))
+    t_ti = (rotation_stack(3, -np.asarray(sp, dtype=np.float64)) @
+            rotation_stack(2, pm_x) @ rotation_stack(1, pm_y))
+
+    t_gi = t_gc @ t_ct @ t_ti
+
+    return t_gc, t_ct, t_ti, t_gi
+
+
 def earth_rotation_matrix(time):
     """
     This function computes the earth rotation matrix at a given datetime in UT1.
@@ -271,3 +557,25 @@ def itrs_to_tirs(pm_x, pm_y, sp):
     t_ti = (r3(-sp) @ r2(pm_x) @ r1(pm_y))
 
     return t_ti
+
+
+def earth_rotation_matrix_rate(time, length_of_day=0.0):
+    """
+    This function computes the time derivative of the earth rotation matrix
+    at a given datetime in UT1.
+
+    :param time: JulianDate in UT1
+    :param length_of_day: Excess length of day in seconds
+    :return: Derivative of the TIRS to CIRS matrix per SI second
+    :type time: JulianDate
+    :type length_of_day: float
+    :rtype: np.ndarray
+    """
+
+    assert (time.time_scale == Time.TimeScales.UT1)
+
+    era, era_rate = Earth.earth_rotation_angle_and_rate(time, length_of_day)
+
+    r_era_rate = r3_rate(-era, -era_rate)
+
+    return r_era_rate
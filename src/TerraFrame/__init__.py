@@ -2,4 +2,36 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
-from .CelestialTerrestrial import CelestialTerrestrialTransformation
+import importlib
+
+# The public classes and the modules they live in. The modules are imported
+# on first use, so lightweight modules like Service.Client can be imported
+# without loading NumPy and the transformation code.
+_EXPORTS = {
+    'CelestialTerrestrialTransformation': 'CelestialTerrestrial',
+    'PipelineTimings': 'CelestialTerrestrial',
+    'TransformDirection': 'CelestialTerrestrial',
+    'EquinoxTransformation': 'EquinoxBased',
+    'InterpolationMethod': 'QuaternionInterpolation',
+    'QuaternionInterpolator': 'QuaternionInterpolation',
+    'EphemerisTable': 'Ephemeris',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    module = importlib.import_module(f'.{_EXPORTS[name]}', __name__)
+    value = getattr(module, name)
+
+    # Later lookups don't go through __getattr__
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
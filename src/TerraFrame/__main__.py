@@ -0,0 +1,67 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import argparse
+import json
+import signal
+import sys
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m TerraFrame')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    serve = commands.add_parser(
+        'serve', help='Serve ITRS/GCRS transformations over a Unix socket.')
+    serve.add_argument('--socket', default=None,
+                       help='Socket path. Defaults to $TERRAFRAME_SOCKET or '
+                            'terraframe.sock in $XDG_RUNTIME_DIR or the '
+                            'temporary directory.')
+    serve.add_argument('--max-batch-size', type=int, default=None,
+                       help='Epochs after which a batch is evaluated '
+                            'without waiting for more requests.')
+    serve.add_argument('--max-delay', type=float, default=None,
+                       help='Seconds a request waits for other requests to '
+                            'join its batch.')
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'serve':
+        return _serve(args)
+
+    return 1
+
+
+def _serve(args):
+    # The server is only imported here, so --help stays fast
+    from TerraFrame.Service import Server
+
+    options = {}
+
+    if args.max_batch_size is not None:
+        options['max_batch_size'] = args.max_batch_size
+
+    if args.max_delay is not None:
+        options['max_delay'] = args.max_delay
+
+    server = Server.TransformServer(args.socket, **options)
+
+    # Stop cleanly on SIGTERM as well as on Ctrl-C
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+
+    print(f'Serving on {server.socket_path}', flush=True)
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(json.dumps(server.statistics()), flush=True)
+        server.close()
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())